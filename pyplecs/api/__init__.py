@@ -1,12 +1,14 @@
 """REST API for PyPLECS simulation management."""
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+from ..cache import TIME_COLUMNS, UnsupportedCacheBackend
+from ..cache.timeaxis import detect_segments
 from ..config import get_config
 from ..core.models import SimulationRequest, SimulationStatus
 from ..orchestration import SimulationOrchestrator, TaskPriority
@@ -26,6 +28,7 @@ class SimulationRequestAPI(BaseModel):
     metadata: dict = {}
     priority: str = "NORMAL"
     use_cache: bool = True
+    client_id: Optional[str] = None
 
 
 class SimulationStatusAPI(BaseModel):
@@ -46,12 +49,34 @@ class SimulationResultAPI(BaseModel):
     task_id: str
     success: bool
     timeseries_data: Optional[dict] = None
+    time_segments: Optional[List[Tuple[float, float, int]]] = None
     metadata: dict = {}
     error_message: Optional[str] = None
     execution_time: float = 0.0
     cached: bool = False
 
 
+class CacheQueryAPI(BaseModel):
+    """API model for parameter/KPI queries over cached results."""
+
+    model_file: Optional[str] = None
+    parameters: dict = {}
+    kpis: dict = {}
+    order_by: str = "created_at"
+    descending: bool = False
+    limit: int = 100
+    offset: int = 0
+
+
+class WarmupRequestAPI(BaseModel):
+    """API model for cache warm-up jobs."""
+
+    model_file: str
+    sweep: dict
+    simulation_time: Optional[float] = None
+    output_variables: List[str] = []
+
+
 # Global orchestrator instance
 orchestrator: Optional[SimulationOrchestrator] = None
 
@@ -64,6 +89,32 @@ def get_orchestrator() -> SimulationOrchestrator:
     return orchestrator
 
 
+def _project_timeseries(timeseries, columns: Optional[List[str]]):
+    """Restrict a result DataFrame to the requested signals plus time."""
+    if timeseries is None or not columns:
+        return timeseries
+    wanted = set(columns) | set(TIME_COLUMNS)
+    return timeseries[[name for name in timeseries.columns if name in wanted]]
+
+
+def _compact_time(timeseries):
+    """Split a uniform time column off a result as ``(t0, dt, n)`` segments.
+
+    Returns:
+        Tuple of the remaining DataFrame and the segments (None if the
+        time axis is missing or not piecewise uniform)
+    """
+    if timeseries is None:
+        return timeseries, None
+    time_col = next((name for name in TIME_COLUMNS if name in timeseries.columns), None)
+    if time_col is None:
+        return timeseries, None
+    segments = detect_segments(timeseries[time_col].to_numpy())
+    if segments is None:
+        return timeseries, None
+    return timeseries.drop(columns=time_col), segments
+
+
 def create_api_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     config = get_config()
@@ -125,6 +176,7 @@ def _register_routes(app):
                 simulation_time=request.simulation_time,
                 output_variables=request.output_variables,
                 metadata=request.metadata,
+                client_id=request.client_id,
             )
             try:
                 priority = TaskPriority[request.priority.upper()]
@@ -145,23 +197,28 @@ def _register_routes(app):
     ):
         """Submit multiple simulations for parallel batch execution."""
         try:
-            task_ids = []
+            sim_requests = []
+            priorities = []
             for req in requests:
-                sim_request = SimulationRequest(
-                    model_file=req.model_file,
-                    parameters=req.parameters,
-                    simulation_time=req.simulation_time,
-                    output_variables=req.output_variables,
-                    metadata=req.metadata,
+                sim_requests.append(
+                    SimulationRequest(
+                        model_file=req.model_file,
+                        parameters=req.parameters,
+                        simulation_time=req.simulation_time,
+                        output_variables=req.output_variables,
+                        metadata=req.metadata,
+                        client_id=req.client_id,
+                    )
                 )
                 try:
-                    priority = TaskPriority[req.priority.upper()]
+                    priorities.append(TaskPriority[req.priority.upper()])
                 except KeyError:
-                    priority = TaskPriority.NORMAL
-                task_id = await orchestrator.submit_simulation(
-                    sim_request, priority=priority, use_cache=req.use_cache
-                )
-                task_ids.append(task_id)
+                    priorities.append(TaskPriority.NORMAL)
+            task_ids = await orchestrator.submit_simulations(
+                sim_requests,
+                priority=priorities,
+                use_cache=[req.use_cache for req in requests],
+            )
             return {
                 "task_ids": task_ids,
                 "batch_size": len(task_ids),
@@ -190,9 +247,18 @@ def _register_routes(app):
 
     @app.get("/simulations/{task_id}/result", response_model=SimulationResultAPI)
     async def get_simulation_result(
-        task_id: str, orchestrator: SimulationOrchestrator = Depends(get_orchestrator)
+        task_id: str,
+        columns: Optional[str] = None,
+        compact_time: bool = False,
+        orchestrator: SimulationOrchestrator = Depends(get_orchestrator),
     ):
-        """Get the result of a completed simulation."""
+        """Get the result of a completed simulation.
+
+        Only the request's ``output_variables`` are returned, or the
+        comma-separated ``columns`` if given; the time column is always kept.
+        With ``compact_time`` a uniform time column is replaced by
+        ``time_segments`` of ``(t0, dt, n)``.
+        """
         task = await orchestrator.get_task_status(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
@@ -203,12 +269,18 @@ def _register_routes(app):
             )
         if not task.result:
             raise HTTPException(status_code=500, detail="Result not available")
+        timeseries = _project_timeseries(
+            task.result.timeseries_data,
+            columns.split(",") if columns else task.request.output_variables,
+        )
+        time_segments = None
+        if compact_time:
+            timeseries, time_segments = _compact_time(timeseries)
         return SimulationResultAPI(
             task_id=task.result.task_id,
             success=task.result.success,
-            timeseries_data=task.result.timeseries_data.to_dict()
-            if task.result.timeseries_data is not None
-            else None,
+            timeseries_data=timeseries.to_dict() if timeseries is not None else None,
+            time_segments=time_segments,
             metadata=task.result.metadata,
             error_message=task.result.error_message,
             execution_time=task.result.execution_time,
@@ -277,9 +349,98 @@ def _register_routes(app):
     async def get_cache_stats(
         orchestrator: SimulationOrchestrator = Depends(get_orchestrator),
     ):
-        """Get cache statistics."""
+        """Get cache statistics, with hit rates and savings per model and client."""
         return orchestrator.cache.get_cache_stats()
 
+    @app.post("/cache/query")
+    async def query_cache(
+        query: CacheQueryAPI,
+        orchestrator: SimulationOrchestrator = Depends(get_orchestrator),
+    ):
+        """Find cached results by parameters and KPIs.
+
+        ``parameters`` maps names to an exact value or a ``[low, high]``
+        range (either bound may be null); ``kpis`` maps KPI names such as
+        ``Vo.mean`` to ranges. Results are returned as handles; load one
+        with ``GET /cache/results/{simulation_hash}``.
+        """
+        try:
+            handles = orchestrator.cache.find_results(
+                model_file=query.model_file,
+                parameters=query.parameters,
+                kpis={name: tuple(bounds) for name, bounds in query.kpis.items()},
+                order_by=query.order_by,
+                descending=query.descending,
+                limit=query.limit,
+                offset=query.offset,
+            )
+        except UnsupportedCacheBackend as e:
+            raise HTTPException(status_code=501, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {
+            "results": [handle.to_dict() for handle in handles],
+            "count": len(handles),
+            "limit": query.limit,
+            "offset": query.offset,
+        }
+
+    @app.post("/cache/warmup", response_model=dict)
+    async def submit_warmup(
+        request: WarmupRequestAPI,
+        orchestrator: SimulationOrchestrator = Depends(get_orchestrator),
+    ):
+        """Warm the cache with a sweep, e.g. a nightly operating-point set.
+
+        ``sweep`` has ``base`` (shared parameters), ``grid`` (``{name:
+        [values]}`` or ``{name: {start, stop, num}}``) and/or ``points``
+        (a list of parameter dicts). Progress is under ``warmup`` in
+        ``GET /stats``.
+        """
+        try:
+            job_id = await orchestrator.submit_warmup(
+                request.model_file,
+                request.sweep,
+                simulation_time=request.simulation_time,
+                output_variables=request.output_variables,
+            )
+        except (FileNotFoundError, ValueError, KeyError) as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"job_id": job_id, "status": "submitted"}
+
+    @app.delete("/cache/warmup/{job_id}")
+    async def cancel_warmup(
+        job_id: str,
+        orchestrator: SimulationOrchestrator = Depends(get_orchestrator),
+    ):
+        """Stop feeding a warm-up job's remaining points."""
+        if not orchestrator.cancel_warmup(job_id):
+            raise HTTPException(status_code=404, detail="Running warm-up job not found")
+        return {"message": "Warm-up job cancelled"}
+
+    @app.get("/cache/results/{simulation_hash}")
+    async def get_cached_result(
+        simulation_hash: str,
+        columns: Optional[str] = None,
+        compact_time: bool = False,
+        orchestrator: SimulationOrchestrator = Depends(get_orchestrator),
+    ):
+        """Load a cached result by hash, e.g. from a ``/cache/query`` handle."""
+        result = orchestrator.cache.load_result(
+            simulation_hash, columns.split(",") if columns else None
+        )
+        if result is None:
+            raise HTTPException(status_code=404, detail="Cached result not found")
+        timeseries, time_segments = result["timeseries"], None
+        if compact_time:
+            timeseries, time_segments = _compact_time(timeseries)
+        return {
+            "simulation_hash": simulation_hash,
+            "timeseries_data": timeseries.to_dict(),
+            "time_segments": time_segments,
+            "metadata": result["metadata"],
+        }
+
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
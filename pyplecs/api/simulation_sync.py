@@ -6,16 +6,21 @@ and returns results directly (no task queue / polling).
 
 import logging
 import time
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+import pyarrow as pa
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
+from ..cache.timeaxis import detect_segments, encode_time_axis
 from ..pyplecs import PlecsServer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["sync"])
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
 
 class SyncSimulationRequest(BaseModel):
     """Request model for synchronous simulation."""
@@ -23,6 +28,8 @@ class SyncSimulationRequest(BaseModel):
     model_file: str
     parameters: dict[str, float] = {}
     signal_map: dict[int, str] | None = None
+    compact_time: bool = False
+    response_format: Literal["json", "arrow"] = "json"
 
 
 class SyncSimulationResponse(BaseModel):
@@ -30,6 +37,7 @@ class SyncSimulationResponse(BaseModel):
 
     success: bool
     time: list[float]
+    time_segments: list[tuple[float, float, int]] | None = None
     signals: dict[str, list[float]]
     metadata: dict = {}
     error_message: str | None = None
@@ -41,6 +49,11 @@ async def run_simulation_sync(request: SyncSimulationRequest):
 
     This endpoint blocks until the simulation completes. Use for
     single-shot validation runs where polling overhead is undesirable.
+
+    With ``compact_time`` a uniform or piecewise-uniform time axis is sent
+    as ``time_segments`` of ``(t0, dt, n)`` instead of a full ``time``
+    list. ``response_format="arrow"`` returns an Arrow IPC stream instead
+    of JSON; a compact time axis is then recorded in its schema metadata.
     """
     t_start = time.perf_counter()
 
@@ -74,9 +87,15 @@ async def run_simulation_sync(request: SyncSimulationRequest):
             error_message=f"Result parsing error: {e}",
         )
 
+    if request.response_format == "arrow":
+        return _arrow_response(time_vec, signals, request.compact_time)
+
+    time_segments = detect_segments(time_vec) if request.compact_time else None
+
     return SyncSimulationResponse(
         success=True,
-        time=time_vec,
+        time=[] if time_segments else time_vec,
+        time_segments=time_segments,
         signals=signals,
         metadata={
             "execution_time": round(elapsed, 4),
@@ -87,6 +106,20 @@ async def run_simulation_sync(request: SyncSimulationRequest):
     )
 
 
+def _arrow_response(
+    time_vec: list[float], signals: dict[str, list[float]], compact_time: bool
+) -> Response:
+    """Serialize a result as an Arrow IPC stream."""
+    table = pa.table({"Time": pa.array(time_vec, pa.float64()), **signals})
+    if compact_time:
+        table = encode_time_axis(table, "Time")
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+
 def _to_list(obj) -> list[float]:
     """Convert array-like or nested xmlrpc result to plain list of floats."""
     if hasattr(obj, "tolist"):
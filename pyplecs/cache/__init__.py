@@ -1,21 +1,51 @@
 """Simulation caching system with hash-based storage."""
 
+import base64
+import dataclasses
 import hashlib
 import json
 import os
 import pickle
+import shutil
+import sqlite3
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 from pyplecs.contracts import SimulationCacheBase
 
-from ..config import get_config
+from ..config import CacheConfig, get_config
+from .approximate import APPROXIMATE_MODES, ApproximateIndex, approximate_result
+from .bloom import BloomFilter
+from .bundle import iter_bundle, read_manifest, write_bundle
+from .chunks import ChunkPool, decode_chunk, split_column
+from .codecs import CodecSettings, decode_table, encode_table, parquet_options
+from .dataset import SweepDataset
+from .eviction import CacheGarbageCollector
+from .failures import FailureStore, classify_failure, failure_classes
+from .locking import Lease, LeaseManager, atomic_write
+from .query import ResultHandle, compute_kpis, split_filters
+from .relevance import referenced_names
+from .states import SystemStateStore
+from .stats import CacheStats
+from .tiers import CacheTierManager
+from .timeaxis import encode_time_axis, insert_time_axis, read_time_axis, window_rows
+from .writer import CacheWriter
+
+# Column names recognised as the time axis of a stored waveform
+TIME_COLUMNS = ("Time", "time")
+
+
+class UnsupportedCacheBackend(ValueError):
+    """The configured cache type or storage layout cannot serve a request."""
 
 
 class CacheBackend(ABC):
@@ -26,11 +56,25 @@ class CacheBackend(ABC):
         """Get value from cache."""
         pass
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values at once; missing or expired keys are omitted."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
     @abstractmethod
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache."""
         pass
 
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values; backends may write them in one transaction."""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
     @abstractmethod
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
@@ -46,6 +90,67 @@ class CacheBackend(ABC):
         """Clear all cache entries."""
         pass
 
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+    def expired_keys(self, now: float, limit: int) -> List[str]:
+        """Return up to ``limit`` keys whose TTL has passed.
+
+        Expired entries are hidden from ``get``/``exists`` but left in
+        place, so the garbage collector can drop the entry and its stored
+        results together.
+        """
+        return []
+
+    def eviction_candidates(
+        self, policy: str, limit: int, cost_weight: float = 0.0
+    ) -> List[str]:
+        """Return up to ``limit`` keys in the order they should be evicted."""
+        return []
+
+    def set_tier(self, key: str, tier: str) -> None:
+        """Record which storage tier (``hot`` or ``cold``) holds a result.
+
+        Entries are ``hot`` when written; ``set`` resets the tier.
+        """
+        pass
+
+    def demotion_candidates(self, before: float, limit: int) -> List[str]:
+        """Return up to ``limit`` hot keys last accessed before ``before``."""
+        return []
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a value without recording an access or checking its TTL."""
+        return self.get(key)
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield every stored entry as a dict with at least ``key``,
+        ``model_file`` and ``size_bytes``. Used to rebuild statistics."""
+        return iter(())
+
+    def size_totals(self) -> Optional[Tuple[int, int]]:
+        """Return ``(entries, size_bytes)`` over all stored entries.
+
+        Backends that cannot aggregate without reading every entry return
+        None; callers then fall back to the statistics counters.
+        """
+        return None
+
+    def change_token(self) -> Optional[Any]:
+        """Return a cheap value that changes when the index may have changed.
+
+        Used to notice entries written by other processes. None means the
+        backend cannot tell, so every negative Bloom filter answer is
+        confirmed against the backend.
+        """
+        return None
+
+    def iter_keys(self) -> Iterator[str]:
+        """Yield every stored key, including expired ones."""
+        for entry in self.iter_entries():
+            yield entry["key"]
+
 
 class FileCacheBackend(CacheBackend):
     """File-based cache backend using the filesystem."""
@@ -55,6 +160,7 @@ class FileCacheBackend(CacheBackend):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_dir = self.cache_dir / "metadata"
         self.metadata_dir.mkdir(exist_ok=True)
+        self._scan = None
 
     def _get_file_path(self, key: str) -> Path:
         """Get file path for cache key."""
@@ -78,7 +184,6 @@ class FileCacheBackend(CacheBackend):
                 metadata = json.load(f)
 
             if metadata.get("ttl") and time.time() > metadata["expires_at"]:
-                self.delete(key)
                 return None
         except (json.JSONDecodeError, KeyError):
             return None
@@ -86,28 +191,43 @@ class FileCacheBackend(CacheBackend):
         # Load cached data
         try:
             with open(file_path, "rb") as f:
-                return pickle.load(f)
+                value = pickle.load(f)
         except Exception:
             return None
 
+        # Record the access in the data file's mtime for LRU eviction
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+
+        return value
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in file cache."""
         file_path = self._get_file_path(key)
         metadata_path = self._get_metadata_path(key)
 
-        # Save data
-        with open(file_path, "wb") as f:
-            pickle.dump(value, f)
+        # Save data; files are renamed into place so concurrent readers in
+        # other processes never see a partial write
+        with atomic_write(file_path) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f)
 
         # Save metadata
+        fields = value if isinstance(value, dict) else {}
         metadata = {
             "created_at": time.time(),
             "ttl": ttl,
             "expires_at": time.time() + ttl if ttl else None,
+            "model_file": fields.get("model_file"),
+            "size_bytes": int(fields.get("size_bytes") or 0),
+            "execution_time": float(fields.get("execution_time") or 0.0),
         }
 
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f)
+        with atomic_write(metadata_path) as tmp_path:
+            with open(tmp_path, "w") as f:
+                json.dump(metadata, f)
 
     def delete(self, key: str) -> bool:
         """Delete key from file cache."""
@@ -136,6 +256,644 @@ class FileCacheBackend(CacheBackend):
         for file_path in self.metadata_dir.glob("*.meta"):
             file_path.unlink()
 
+    def _scan_metadata(self, limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """Read the next ``limit`` metadata files of a rolling directory scan.
+
+        The scan resumes where the previous call stopped and restarts from
+        the top once the directory is exhausted, so repeated calls visit
+        every entry without ever listing the whole directory at once.
+        """
+        entries = []
+        restarted = False
+        while len(entries) < limit:
+            if self._scan is None:
+                if restarted:
+                    break
+                self._scan = os.scandir(self.metadata_dir)
+                restarted = True
+            try:
+                dir_entry = next(self._scan)
+            except StopIteration:
+                self._scan.close()
+                self._scan = None
+                continue
+
+            if not dir_entry.name.endswith(".meta"):
+                continue
+            try:
+                with open(dir_entry.path, "r") as f:
+                    entries.append((dir_entry.name[: -len(".meta")], json.load(f)))
+            except (OSError, json.JSONDecodeError):
+                continue
+        return entries
+
+    def expired_keys(self, now: float, limit: int) -> List[str]:
+        """Return expired keys found in the next slice of the rolling scan."""
+        return [
+            key
+            for key, metadata in self._scan_metadata(limit)
+            if metadata.get("expires_at") and now > metadata["expires_at"]
+        ]
+
+    def eviction_candidates(
+        self, policy: str, limit: int, cost_weight: float = 0.0
+    ) -> List[str]:
+        """Rank a sample of entries from the rolling scan for eviction.
+
+        Without an index the file backend cannot order the whole cache, so
+        it approximates LRU by ranking ``limit`` sampled entries by their
+        last access time (the data file's mtime).
+        """
+        scored = []
+        for key, metadata in self._scan_metadata(limit):
+            try:
+                last_access = self._get_file_path(key).stat().st_mtime
+            except OSError:
+                continue
+            if policy == "cost":
+                last_access += cost_weight * metadata.get("execution_time", 0.0)
+            scored.append((last_access, key))
+        return [key for _, key in sorted(scored)]
+
+    def set_tier(self, key: str, tier: str) -> None:
+        """Record the tier in the entry's metadata file."""
+        metadata_path = self._get_metadata_path(key)
+        try:
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        metadata["tier"] = tier
+        with atomic_write(metadata_path) as tmp_path:
+            with open(tmp_path, "w") as f:
+                json.dump(metadata, f)
+
+    def demotion_candidates(self, before: float, limit: int) -> List[str]:
+        """Return idle hot keys from the next slice of the rolling scan.
+
+        Like ``eviction_candidates``, last access is the data file's mtime.
+        """
+        scored = []
+        for key, metadata in self._scan_metadata(limit):
+            if metadata.get("tier") == "cold":
+                continue
+            try:
+                last_access = self._get_file_path(key).stat().st_mtime
+            except OSError:
+                continue
+            if last_access < before:
+                scored.append((last_access, key))
+        return [key for _, key in sorted(scored)]
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Load a value without touching its access time or checking TTL."""
+        try:
+            with open(self._get_file_path(key), "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield entries from the metadata files."""
+        with os.scandir(self.metadata_dir) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith(".meta"):
+                    continue
+                try:
+                    with open(dir_entry.path, "r") as f:
+                        metadata = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    continue
+                yield {"key": dir_entry.name[: -len(".meta")], **metadata}
+
+    def iter_keys(self) -> Iterator[str]:
+        """Yield keys from the cache file names without reading them."""
+        with os.scandir(self.cache_dir) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(".cache"):
+                    yield dir_entry.name[: -len(".cache")]
+
+    def change_token(self) -> Optional[Any]:
+        """The cache directory's mtime, which moves whenever a file is added."""
+        try:
+            return self.cache_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        """Close any open directory scan."""
+        if self._scan is not None:
+            self._scan.close()
+            self._scan = None
+
+
+class SqliteCacheBackend(CacheBackend):
+    """SQLite-indexed cache backend.
+
+    Keeps one row per entry in a single WAL-mode database instead of a
+    pickle plus a JSON sidecar per key. Values are stored as JSON, so
+    loading an entry never unpickles data from disk. Waveform payloads stay
+    in the ``SimulationResultStore``; this backend only indexes them.
+    """
+
+    SCHEMA_VERSION = 4
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            model_file TEXT,
+            model_fingerprint TEXT,
+            parameters TEXT,
+            value TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL,
+            last_access REAL NOT NULL,
+            access_count INTEGER NOT NULL DEFAULT 0,
+            size_bytes INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_model ON entries(model_fingerprint);
+        CREATE INDEX IF NOT EXISTS idx_entries_created ON entries(created_at);
+        CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries(expires_at);
+        CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+        CREATE TABLE IF NOT EXISTS entry_params (
+            key TEXT NOT NULL REFERENCES entries(key) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            num_value REAL,
+            text_value TEXT,
+            PRIMARY KEY (key, name)
+        );
+        CREATE INDEX IF NOT EXISTS idx_params_num ON entry_params(name, num_value);
+        CREATE INDEX IF NOT EXISTS idx_params_text ON entry_params(name, text_value);
+    """
+
+    _KPI_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entry_kpis (
+            key TEXT NOT NULL REFERENCES entries(key) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            value REAL NOT NULL,
+            PRIMARY KEY (key, name)
+        );
+        CREATE INDEX IF NOT EXISTS idx_kpis_value ON entry_kpis(name, value);
+    """
+
+    _ENTRY_COLUMNS = (
+        "key",
+        "model_file",
+        "model_fingerprint",
+        "parameters",
+        "created_at",
+        "expires_at",
+        "last_access",
+        "access_count",
+        "size_bytes",
+        "execution_time",
+        "tier",
+    )
+
+    # Keys per IN (...) clause, below SQLite's default variable limit
+    _IN_CHUNK = 500
+
+    _RANGE_COLUMNS = (
+        "created_at",
+        "expires_at",
+        "last_access",
+        "access_count",
+        "size_bytes",
+        "execution_time",
+    )
+
+    def __init__(self, cache_dir: str, db_name: str = "index.sqlite"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / db_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, timeout=30.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # Entries imported from a file-backend cache when the index was created
+        self.imported = self._import_file_entries() if self._migrate() == 0 else 0
+
+    def _migrate(self) -> int:
+        """Create or upgrade the schema; returns the previous version."""
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                self._conn.executescript(self._SCHEMA)
+            if version < 2:
+                self._conn.execute(
+                    "ALTER TABLE entries ADD COLUMN execution_time REAL NOT NULL DEFAULT 0"
+                )
+            if version < 3:
+                self._conn.executescript(self._KPI_SCHEMA)
+            if version < 4:
+                self._conn.execute(
+                    "ALTER TABLE entries ADD COLUMN tier TEXT NOT NULL DEFAULT 'hot'"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_entries_tier ON entries(tier, last_access)"
+                )
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        return version
+
+    def _import_file_entries(self) -> int:
+        """Index the entries a ``FileCacheBackend`` left in the directory.
+
+        Runs once, when the database is created, so switching ``cache.type``
+        from ``file`` to ``sqlite`` keeps the existing results. The file
+        backend's pickles and ``.meta`` sidecars are left in place.
+
+        Returns:
+            Number of entries imported
+        """
+        metadata_dir = self.cache_dir / "metadata"
+        if not metadata_dir.is_dir():
+            return 0
+        imported = 0
+        with self._lock, self._conn:
+            for metadata_path in metadata_dir.glob("*.meta"):
+                key = metadata_path.name[: -len(".meta")]
+                try:
+                    with open(metadata_path, "r") as f:
+                        metadata = json.load(f)
+                    with open(self.cache_dir / f"{key}.cache", "rb") as f:
+                        value = pickle.load(f)
+                except Exception:
+                    continue
+                created_at = metadata.get("created_at") or time.time()
+                self._insert(key, value, metadata.get("ttl"), created_at)
+                imported += 1
+        return imported
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from the index, bumping its access counters."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and now > expires_at:
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ?, access_count = access_count + 1 "
+                "WHERE key = ?",
+                (now, key),
+            )
+
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values with one query per chunk of keys."""
+        keys = list(dict.fromkeys(keys))
+        now = time.time()
+        rows = []
+        with self._lock, self._conn:
+            for start in range(0, len(keys), self._IN_CHUNK):
+                chunk = keys[start : start + self._IN_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                rows.extend(
+                    self._conn.execute(
+                        f"SELECT key, value FROM entries WHERE key IN ({placeholders}) "
+                        "AND (expires_at IS NULL OR expires_at >= ?)",
+                        (*chunk, now),
+                    ).fetchall()
+                )
+            self._conn.executemany(
+                "UPDATE entries SET last_access = ?, access_count = access_count + 1 "
+                "WHERE key = ?",
+                [(now, key) for key, _ in rows],
+            )
+
+        found = {}
+        for key, value in rows:
+            try:
+                found[key] = json.loads(value)
+            except json.JSONDecodeError:
+                continue
+        return found
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in the index.
+
+        ``value`` must be JSON-serializable. If it is a dict, the
+        ``model_file``, ``model_fingerprint``, ``parameters``,
+        ``size_bytes`` and ``execution_time`` fields are also written to
+        indexed columns.
+        """
+        with self._lock, self._conn:
+            self._insert(key, value, ttl, time.time())
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in a single transaction."""
+        now = time.time()
+        with self._lock, self._conn:
+            for key, value in items.items():
+                self._insert(key, value, ttl, now)
+
+    def _insert(self, key: str, value: Any, ttl: Optional[int], now: float) -> None:
+        """Replace one entry and its parameters; caller holds the transaction."""
+        fields = value if isinstance(value, dict) else {}
+        parameters = fields.get("parameters") or {}
+
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._conn.execute(
+            "INSERT INTO entries (key, model_file, model_fingerprint, parameters, "
+            "value, created_at, expires_at, last_access, access_count, size_bytes, "
+            "execution_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)",
+            (
+                key,
+                fields.get("model_file"),
+                fields.get("model_fingerprint"),
+                json.dumps(parameters, sort_keys=True, default=str),
+                json.dumps(value, default=str),
+                now,
+                now + ttl if ttl else None,
+                now,
+                int(fields.get("size_bytes") or 0),
+                float(fields.get("execution_time") or 0.0),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT INTO entry_params (key, name, num_value, text_value) "
+            "VALUES (?, ?, ?, ?)",
+            [(key, name, *self._split_param(v)) for name, v in parameters.items()],
+        )
+        self._conn.executemany(
+            "INSERT INTO entry_kpis (key, name, value) VALUES (?, ?, ?)",
+            [(key, name, float(v)) for name, v in (fields.get("kpis") or {}).items()],
+        )
+
+    @staticmethod
+    def _split_param(value: Any) -> Tuple[Optional[float], Optional[str]]:
+        """Split a parameter value into its numeric and text index columns."""
+        if isinstance(value, bool):
+            return float(value), None
+        if isinstance(value, (int, float)):
+            return float(value), None
+        return None, json.dumps(value, sort_keys=True, default=str)
+
+    def delete(self, key: str) -> bool:
+        """Delete key from the index."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return cursor.rowcount > 0
+
+    def exists(self, key: str) -> bool:
+        """Check if a non-expired key exists in the index."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM entries WHERE key = ? "
+                "AND (expires_at IS NULL OR expires_at >= ?)",
+                (key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entry_params")
+            self._conn.execute("DELETE FROM entries")
+
+    def expired_keys(self, now: float, limit: int) -> List[str]:
+        """Return up to ``limit`` expired keys, oldest expiry first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM entries WHERE expires_at < ? "
+                "ORDER BY expires_at LIMIT ?",
+                (now, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def eviction_candidates(
+        self, policy: str, limit: int, cost_weight: float = 0.0
+    ) -> List[str]:
+        """Return up to ``limit`` keys in eviction order.
+
+        ``lru`` orders by last access; ``cost`` credits each entry
+        ``cost_weight`` seconds of recency per second of simulation time.
+        """
+        if policy == "cost":
+            sql = (
+                "SELECT key FROM entries "
+                "ORDER BY last_access + ? * execution_time LIMIT ?"
+            )
+            args: Tuple[Any, ...] = (cost_weight, limit)
+        else:
+            sql = "SELECT key FROM entries ORDER BY last_access LIMIT ?"
+            args = (limit,)
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [row[0] for row in rows]
+
+    def set_tier(self, key: str, tier: str) -> None:
+        """Record which storage tier holds a result."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE entries SET tier = ? WHERE key = ?", (tier, key))
+
+    def demotion_candidates(self, before: float, limit: int) -> List[str]:
+        """Return up to ``limit`` idle hot keys, least recently accessed first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM entries WHERE tier = 'hot' AND last_access < ? "
+                "ORDER BY last_access LIMIT ?",
+                (before, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a value without bumping access counters or checking TTL."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield all indexed entries, including expired ones."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self._ENTRY_COLUMNS)} FROM entries"
+            ).fetchall()
+        for row in rows:
+            yield dict(zip(self._ENTRY_COLUMNS, row))
+
+    def iter_keys(self) -> Iterator[str]:
+        """Yield all indexed keys, including expired ones."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM entries").fetchall()
+        for (key,) in rows:
+            yield key
+
+    def size_totals(self) -> Optional[Tuple[int, int]]:
+        """Count and sum the sizes of all indexed entries, including expired ones."""
+        with self._lock:
+            count, size_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+            ).fetchone()
+        return int(count), int(size_bytes)
+
+    def change_token(self) -> Optional[Any]:
+        """SQLite's ``data_version``, bumped by commits of other connections."""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def query(
+        self,
+        model_fingerprint: Optional[str] = None,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        parameter_ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        order_by: str = "created_at",
+        descending: bool = False,
+        limit: Optional[int] = None,
+        parameter_values: Optional[Dict[str, Any]] = None,
+        kpi_ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Run a range query over indexed entries.
+
+        Args:
+            model_fingerprint: Restrict to entries for this model content
+            ranges: Inclusive ``(low, high)`` bounds on entry columns such as
+                ``created_at``, ``last_access`` or ``size_bytes``. Either
+                bound may be None for an open interval.
+            parameter_ranges: Inclusive ``(low, high)`` bounds on numeric
+                simulation parameters, e.g. ``{"Vi": (10, 48)}``
+            order_by: Entry column to sort by, or ``param:<name>`` /
+                ``kpi:<name>`` to sort by a parameter or KPI value
+            descending: Sort in descending order
+            limit: Maximum number of entries to return
+            parameter_values: Exact parameter values, e.g. ``{"fs": 100e3}``
+            kpi_ranges: Inclusive ``(low, high)`` bounds on indexed KPIs,
+                e.g. ``{"Vo.mean": (11.5, 12.5)}``
+            offset: Number of matching entries to skip (pagination)
+
+        Returns:
+            List of entry dicts; ``parameters`` is decoded from JSON and
+            ``kpis`` holds the entry's indexed KPIs
+        """
+        order_args: List[Any] = []
+        if order_by.startswith("param:"):
+            order_sql = (
+                "(SELECT num_value FROM entry_params p "
+                "WHERE p.key = entries.key AND p.name = ?)"
+            )
+            order_args.append(order_by[len("param:") :])
+        elif order_by.startswith("kpi:"):
+            order_sql = (
+                "(SELECT value FROM entry_kpis k WHERE k.key = entries.key AND k.name = ?)"
+            )
+            order_args.append(order_by[len("kpi:") :])
+        elif order_by in self._ENTRY_COLUMNS:
+            order_sql = order_by
+        else:
+            raise ValueError(f"Cannot order by: {order_by}")
+
+        clauses = ["(expires_at IS NULL OR expires_at >= ?)"]
+        args: List[Any] = [time.time()]
+
+        if model_fingerprint is not None:
+            clauses.append("model_fingerprint = ?")
+            args.append(model_fingerprint)
+
+        for column, (low, high) in (ranges or {}).items():
+            if column not in self._RANGE_COLUMNS:
+                raise ValueError(f"Unsupported range column: {column}")
+            if low is not None:
+                clauses.append(f"{column} >= ?")
+                args.append(low)
+            if high is not None:
+                clauses.append(f"{column} <= ?")
+                args.append(high)
+
+        for name, (low, high) in (parameter_ranges or {}).items():
+            sub = ["name = ?"]
+            args.append(name)
+            if low is not None:
+                sub.append("num_value >= ?")
+                args.append(float(low))
+            if high is not None:
+                sub.append("num_value <= ?")
+                args.append(float(high))
+            clauses.append(
+                f"key IN (SELECT key FROM entry_params WHERE {' AND '.join(sub)})"
+            )
+
+        for name, value in (parameter_values or {}).items():
+            num_value, text_value = self._split_param(value)
+            if num_value is not None:
+                clauses.append(
+                    "key IN (SELECT key FROM entry_params WHERE name = ? AND num_value = ?)"
+                )
+                args.extend((name, num_value))
+            else:
+                clauses.append(
+                    "key IN (SELECT key FROM entry_params WHERE name = ? AND text_value = ?)"
+                )
+                args.extend((name, text_value))
+
+        for name, (low, high) in (kpi_ranges or {}).items():
+            sub = ["name = ?"]
+            args.append(name)
+            if low is not None:
+                sub.append("value >= ?")
+                args.append(float(low))
+            if high is not None:
+                sub.append("value <= ?")
+                args.append(float(high))
+            clauses.append(f"key IN (SELECT key FROM entry_kpis WHERE {' AND '.join(sub)})")
+
+        sql = (
+            f"SELECT {', '.join(self._ENTRY_COLUMNS)} FROM entries "
+            f"WHERE {' AND '.join(clauses)} "
+            f"ORDER BY {order_sql} {'DESC' if descending else 'ASC'}, key"
+        )
+        args.extend(order_args)
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            args.extend((-1 if limit is None else int(limit), int(offset)))
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+            keys = [row[0] for row in rows]
+            kpis: Dict[str, Dict[str, float]] = {key: {} for key in keys}
+            for start in range(0, len(keys), self._IN_CHUNK):
+                chunk = keys[start : start + self._IN_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                for key, name, value in self._conn.execute(
+                    f"SELECT key, name, value FROM entry_kpis WHERE key IN ({placeholders})",
+                    chunk,
+                ):
+                    kpis[key][name] = value
+
+        entries = []
+        for row in rows:
+            entry = dict(zip(self._ENTRY_COLUMNS, row))
+            entry["parameters"] = json.loads(entry["parameters"] or "{}")
+            entry["kpis"] = kpis[entry["key"]]
+            entries.append(entry)
+        return entries
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
 
 class SimulationHash:
     """Generate hash for simulation parameters and models."""
@@ -143,12 +901,48 @@ class SimulationHash:
     def __init__(self, algorithm: str = "sha256"):
         self.algorithm = algorithm
         self.config = get_config()
+        # Hasher state after the model path and content, keyed by
+        # (path, content included) and validated by (mtime_ns, size)
+        self._model_states: Dict[Tuple[str, bool], Tuple[Any, Any]] = {}
+        self._fingerprints: Dict[str, Tuple[Any, str]] = {}
+        # Names each model content references, keyed by model fingerprint
+        self._references: Dict[str, Optional[FrozenSet[str]]] = {}
+
+    @staticmethod
+    def _file_signature(model_file: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the model file, or None if missing."""
+        try:
+            st = os.stat(model_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _model_state(self, model_file: str, include_file_content: bool):
+        """Return a hasher that has consumed the model path and content.
+
+        The model file is only re-read when its mtime or size changes, so
+        hashing many parameter sets for one model reads it once.
+        """
+        signature = self._file_signature(model_file) if include_file_content else None
+        key = (str(model_file), signature is not None)
+        cached = self._model_states.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        hasher = hashlib.new(self.algorithm)
+        hasher.update(str(model_file).encode())
+        if signature is not None:
+            with open(model_file, "rb") as f:
+                hasher.update(f.read())
+        self._model_states[key] = (signature, hasher)
+        return hasher
 
     def compute_hash(
         self,
         model_file: str,
         parameters: Dict[str, Any],
         include_file_content: bool = True,
+        variant: Optional[str] = None,
     ) -> str:
         """Compute hash for simulation configuration.
 
@@ -156,93 +950,215 @@ class SimulationHash:
             model_file: Path to PLECS model file
             parameters: Simulation parameters
             include_file_content: Whether to include file content in hash
+            variant: Separate key space for results of the same
+                configuration that do not replace a plain run's, e.g.
+                ``"warm_start"``
 
         Returns:
             Hexadecimal hash string
         """
-        hasher = hashlib.new(self.algorithm)
+        # Model path and (if requested and present) file content
+        hasher = self._model_state(model_file, include_file_content).copy()
 
-        # Hash model file path
-        hasher.update(str(model_file).encode())
-
-        # Hash file content if requested
-        if include_file_content and os.path.exists(model_file):
-            with open(model_file, "rb") as f:
-                hasher.update(f.read())
-
-        # Hash parameters (excluding configured fields)
-        filtered_params = self._filter_parameters(parameters)
+        # Hash parameters (excluding configured and unreferenced fields)
+        filtered_params = self.key_parameters(parameters, model_file)
         param_str = json.dumps(filtered_params, sort_keys=True)
         hasher.update(param_str.encode())
+        if variant:
+            hasher.update(f"\0{variant}".encode())
 
         return hasher.hexdigest()
 
-    def _filter_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Filter out parameters that should not affect the hash."""
+    def model_fingerprint(self, model_file: str) -> str:
+        """Compute a digest of the model file content.
+
+        Falls back to hashing the path when the file does not exist, so
+        entries for the same model content can be grouped across paths.
+        """
+        signature = self._file_signature(model_file)
+        cached = self._fingerprints.get(str(model_file))
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        hasher = hashlib.new(self.algorithm)
+        if signature is not None:
+            with open(model_file, "rb") as f:
+                hasher.update(f.read())
+        else:
+            hasher.update(str(model_file).encode())
+        digest = hasher.hexdigest()
+        self._fingerprints[str(model_file)] = (signature, digest)
+        return digest
+
+    def referenced_parameters(self, model_file: str) -> Optional[FrozenSet[str]]:
+        """Names the model references, or None if they cannot be determined.
+
+        Parsed once per model content (see ``relevance.referenced_names``).
+        """
+        fingerprint = self.model_fingerprint(model_file)
+        if fingerprint not in self._references:
+            self._references[fingerprint] = referenced_names(model_file)
+        return self._references[fingerprint]
+
+    def key_parameters(
+        self, parameters: Dict[str, Any], model_file: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Return the parameters that make up the cache key.
+
+        Drops ``cache.exclude_fields`` and, with
+        ``cache.hash.drop_unreferenced``, parameters the model never uses.
+        """
         exclude_fields = self.config.cache.exclude_fields
-        return {k: v for k, v in parameters.items() if k not in exclude_fields}
+        filtered = {k: v for k, v in parameters.items() if k not in exclude_fields}
+        if model_file is not None and self.config.cache.drop_unreferenced:
+            referenced = self.referenced_parameters(model_file)
+            if referenced is not None:
+                filtered = {k: v for k, v in filtered.items() if k in referenced}
+        return filtered
 
 
 class SimulationResultStore:
     """Store and retrieve simulation results in optimized formats."""
 
-    def __init__(self, storage_dir: str):
+    _RESULT_SUFFIXES = (
+        ".parquet",
+        ".arrow",
+        ".h5",
+        ".csv",
+        ".chunks",
+        "_metadata.json",
+        "_metadata.yml",
+    )
+    _TIMESERIES_SUFFIXES = {
+        "parquet": ".parquet",
+        "arrow": ".arrow",
+        "chunked": ".chunks",
+        "hdf5": ".h5",
+        "csv": ".csv",
+    }
+    _METADATA_SUFFIXES = {"json": "_metadata.json", "yaml": "_metadata.yml"}
+
+    def __init__(self, storage_dir: str, settings: Optional[CacheConfig] = None):
+        """Initialize the store.
+
+        Args:
+            storage_dir: Directory holding the result files
+            settings: Storage settings (format, codecs, layout); defaults to
+                the ``cache`` section of the global config
+        """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.config = get_config()
+        self.settings = settings or self.config.cache
+        self._chunk_pool: Optional[ChunkPool] = None
+        self._chunk_pool_lock = threading.Lock()
+        self._dataset: Optional[SweepDataset] = None
 
     def store_results(
         self,
         simulation_hash: str,
         timeseries_data: pd.DataFrame,
         metadata: Dict[str, Any],
-    ) -> None:
+        model_fingerprint: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> int:
         """Store simulation results.
 
         Args:
             simulation_hash: Unique hash for this simulation
             timeseries_data: Time series simulation data
             metadata: Simulation metadata and parameters
+            model_fingerprint: Model partition for the ``dataset`` layout
+            parameters: Simulation parameters, stored as columns by the
+                ``dataset`` layout
+
+        Returns:
+            Total bytes written to disk
         """
-        # Store timeseries data
-        ts_format = self.config.cache.timeseries_format.lower()
+        # Store timeseries data sorted by time so windowed reads can bisect
+        ts_format = self.settings.timeseries_format.lower()
+        timeseries_data = self._sort_by_time(timeseries_data)
+        pooled_bytes = 0
+
+        if self.settings.storage_layout == "dataset":
+            table = pa.Table.from_pandas(timeseries_data, preserve_index=False)
+            return self.dataset.write(
+                simulation_hash,
+                model_fingerprint or "unknown",
+                parameters or {},
+                table,
+                metadata,
+            )
 
         if ts_format == "parquet":
-            self._store_parquet(simulation_hash, timeseries_data)
+            ts_path = self._store_parquet(simulation_hash, timeseries_data)
+        elif ts_format == "arrow":
+            ts_path = self._store_arrow(simulation_hash, timeseries_data)
+        elif ts_format == "chunked":
+            ts_path, pooled_bytes = self._store_chunked(simulation_hash, timeseries_data)
         elif ts_format == "hdf5":
-            self._store_hdf5(simulation_hash, timeseries_data)
+            ts_path = self._store_hdf5(simulation_hash, timeseries_data)
         elif ts_format == "csv":
-            self._store_csv(simulation_hash, timeseries_data)
+            ts_path = self._store_csv(simulation_hash, timeseries_data)
         else:
             raise ValueError(f"Unsupported timeseries format: {ts_format}")
 
         # Store metadata
-        metadata_format = self.config.cache.metadata_format.lower()
+        metadata_format = self.settings.metadata_format.lower()
         if metadata_format == "json":
-            self._store_json_metadata(simulation_hash, metadata)
+            metadata_path = self._store_json_metadata(simulation_hash, metadata)
         elif metadata_format == "yaml":
-            self._store_yaml_metadata(simulation_hash, metadata)
+            metadata_path = self._store_yaml_metadata(simulation_hash, metadata)
         else:
             raise ValueError(f"Unsupported metadata format: {metadata_format}")
 
-    def load_results(self, simulation_hash: str) -> Optional[Dict[str, Any]]:
+        return ts_path.stat().st_size + metadata_path.stat().st_size + pooled_bytes
+
+    def load_results(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+        timeseries_format: Optional[str] = None,
+        metadata_format: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Load simulation results.
 
         Args:
             simulation_hash: Unique hash for this simulation
+            columns: Signals to load (None = all). The time column is always
+                included; names not present in the result are ignored.
+            t_start: Only return samples at or after this time (None = from start)
+            t_end: Only return samples at or before this time (None = to end)
+            timeseries_format: Read this format instead of the configured
+                one (file layout only)
+            metadata_format: Read this metadata format instead of the
+                configured one
 
         Returns:
             Dictionary with 'timeseries' and 'metadata' keys, or None if not found
         """
         # Load timeseries data
-        ts_format = self.config.cache.timeseries_format.lower()
+        ts_format = (timeseries_format or self.settings.timeseries_format).lower()
+        window = (t_start, t_end)
+
+        if self.settings.storage_layout == "dataset" and timeseries_format is None:
+            result = self._load_dataset(simulation_hash, columns, *window)
+            # Results stored before switching layouts are still read below
+            if result is not None:
+                return result
 
         if ts_format == "parquet":
-            timeseries = self._load_parquet(simulation_hash)
+            timeseries = self._load_parquet(simulation_hash, columns, *window)
+        elif ts_format == "arrow":
+            timeseries = self._load_arrow(simulation_hash, columns, *window)
+        elif ts_format == "chunked":
+            timeseries = self._load_chunked(simulation_hash, columns, *window)
         elif ts_format == "hdf5":
-            timeseries = self._load_hdf5(simulation_hash)
+            timeseries = self._load_hdf5(simulation_hash, columns, *window)
         elif ts_format == "csv":
-            timeseries = self._load_csv(simulation_hash)
+            timeseries = self._load_csv(simulation_hash, columns, *window)
         else:
             return None
 
@@ -250,7 +1166,7 @@ class SimulationResultStore:
             return None
 
         # Load metadata
-        metadata_format = self.config.cache.metadata_format.lower()
+        metadata_format = (metadata_format or self.settings.metadata_format).lower()
         if metadata_format == "json":
             metadata = self._load_json_metadata(simulation_hash)
         elif metadata_format == "yaml":
@@ -260,65 +1176,699 @@ class SimulationResultStore:
 
         return {"timeseries": timeseries, "metadata": metadata or {}}
 
-    def _store_parquet(self, simulation_hash: str, data: pd.DataFrame) -> None:
-        """Store data in Parquet format."""
+    def delete_results(self, simulation_hash: str, keep: Iterable[str] = ()) -> int:
+        """Delete stored results in every supported format.
+
+        Args:
+            simulation_hash: Unique hash for this simulation
+            keep: File suffixes (or ``"dataset"``) to leave in place
+
+        Returns:
+            Number of bytes freed
+        """
+        keep = set(keep)
+        freed = 0
+        for suffix in self._RESULT_SUFFIXES:
+            if suffix in keep:
+                continue
+            file_path = self.storage_dir / f"{simulation_hash}{suffix}"
+            try:
+                size = file_path.stat().st_size
+                digests = self._manifest_digests(file_path) if suffix == ".chunks" else []
+                file_path.unlink()
+            except FileNotFoundError:
+                continue
+            except PermissionError:
+                # Memory-mapped Arrow files cannot be deleted on Windows
+                # while a reader still holds a view into them
+                continue
+            freed += size
+            if digests:
+                freed += self.chunk_pool.release(digests)
+
+        if "dataset" not in keep and (
+            self._dataset is not None or (self.storage_dir / "dataset").exists()
+        ):
+            freed += self.dataset.delete(simulation_hash)
+        return freed
+
+    def stored_formats(self, simulation_hash: str) -> List[str]:
+        """Timeseries formats a result has files for, outside the dataset."""
+        return [
+            ts_format
+            for ts_format, suffix in self._TIMESERIES_SUFFIXES.items()
+            if (self.storage_dir / f"{simulation_hash}{suffix}").exists()
+        ]
+
+    def stored_metadata_format(self, simulation_hash: str) -> Optional[str]:
+        """Format of a result's metadata file, preferring the configured one."""
+        formats = [self.settings.metadata_format.lower(), *self._METADATA_SUFFIXES]
+        for metadata_format in formats:
+            suffix = self._METADATA_SUFFIXES.get(metadata_format)
+            if suffix and (self.storage_dir / f"{simulation_hash}{suffix}").exists():
+                return metadata_format
+        return None
+
+    def verify_results(self, simulation_hash: str) -> List[str]:
+        """Check a result's files against their checksums.
+
+        Parquet pages written with checksums are verified while decoding,
+        Arrow files are fully validated and chunked results have every
+        chunk re-hashed against its content address.
+
+        Returns:
+            Description of every problem found (empty when intact)
+        """
+        problems = []
+        for ts_format in self.stored_formats(simulation_hash):
+            path = self.storage_dir / f"{simulation_hash}{self._TIMESERIES_SUFFIXES[ts_format]}"
+            try:
+                if ts_format == "parquet":
+                    pq.ParquetFile(path, page_checksum_verification=True).read()
+                elif ts_format == "arrow":
+                    with pa.memory_map(str(path), "r") as source:
+                        pa.ipc.open_file(source).read_all().validate(full=True)
+                elif ts_format == "chunked":
+                    for digest in set(self._manifest_digests(path)):
+                        if hashlib.sha256(self.chunk_pool.get(digest)).hexdigest() != digest:
+                            problems.append(f"chunk {digest} does not match its digest")
+            except Exception as e:
+                problems.append(f"{path.name}: {e}")
+        return problems
+
+    def move_results(self, simulation_hash: str, new_hash: str) -> bool:
+        """Rename a result's files to another hash.
+
+        Results in the ``dataset`` layout store their hash inside part
+        files and cannot be moved.
+
+        Returns:
+            True if the result had files and they were renamed
+        """
+        if self._dataset is not None or (self.storage_dir / "dataset").exists():
+            if self.dataset.locate(simulation_hash) is not None:
+                return False
+        moved = False
+        for suffix in self._RESULT_SUFFIXES:
+            file_path = self.storage_dir / f"{simulation_hash}{suffix}"
+            try:
+                os.replace(file_path, self.storage_dir / f"{new_hash}{suffix}")
+            except FileNotFoundError:
+                continue
+            moved = True
+        return moved
+
+    def sync(self, simulation_hashes: List[str]) -> None:
+        """Fsync the stored files of the given results and their directory."""
+        for simulation_hash in simulation_hashes:
+            for suffix in self._RESULT_SUFFIXES:
+                file_path = self.storage_dir / f"{simulation_hash}{suffix}"
+                try:
+                    fd = os.open(file_path, os.O_RDONLY)
+                except FileNotFoundError:
+                    continue
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+            manifest_path = self.storage_dir / f"{simulation_hash}.chunks"
+            if manifest_path.exists():
+                self.chunk_pool.sync(self._manifest_digests(manifest_path))
+
+        if self.settings.storage_layout == "dataset":
+            self.dataset.sync(simulation_hashes)
+
+        # Directory entries need their own fsync on POSIX; Windows cannot
+        # open directories
+        if os.name == "posix":
+            fd = os.open(self.storage_dir, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _store_parquet(self, simulation_hash: str, data: pd.DataFrame) -> Path:
+        """Store data in Parquet format.
+
+        Rows are split into row groups of ``cache.storage.row_group_size``
+        with min/max statistics, so time-window reads skip whole groups.
+        Float columns are byte-stream-split before compression, and codecs
+        and lossy encodings can be chosen per column (see ``codecs``). A
+        uniform time axis is stored as segments instead of a column.
+        """
         file_path = self.storage_dir / f"{simulation_hash}.parquet"
-        compression = self.config.cache.compression
+        settings = self._codec_settings(data)
+
+        table = self._implicit_time(encode_table(pa.Table.from_pandas(data), settings))
+        with atomic_write(file_path) as tmp_path:
+            pq.write_table(
+                table,
+                tmp_path,
+                row_group_size=self.settings.row_group_size,
+                write_statistics=True,
+                write_page_checksum=True,
+                **parquet_options(table, settings),
+            )
+        return file_path
+
+    def _codec_settings(self, data: pd.DataFrame) -> CodecSettings:
+        """Codec settings for ``data``, keeping its time axis lossless."""
+        time_col = self._time_column(list(data.columns))
+        return CodecSettings.from_config(
+            self.settings, protected_columns=[time_col] if time_col else []
+        )
+
+    def _implicit_time(self, table: pa.Table) -> pa.Table:
+        """Drop a (piecewise) uniform time column in favour of its segments."""
+        if not self.settings.implicit_time:
+            return table
+        return encode_time_axis(
+            table,
+            self._time_column(table.column_names),
+            self.settings.time_axis_tolerance,
+        )
 
-        table = pa.Table.from_pandas(data)
-        pq.write_table(table, file_path, compression=compression)
+    @staticmethod
+    def _time_column(names: List[str]) -> Optional[str]:
+        """Return the name of the time axis column, if any."""
+        return next((name for name in TIME_COLUMNS if name in names), None)
+
+    @classmethod
+    def _sort_by_time(cls, data: pd.DataFrame) -> pd.DataFrame:
+        """Return ``data`` ordered by its time column."""
+        time_col = cls._time_column(list(data.columns))
+        if time_col is None or data[time_col].is_monotonic_increasing:
+            return data
+        return data.sort_values(time_col, kind="stable", ignore_index=True)
+
+    @staticmethod
+    def _window_bounds(
+        times: np.ndarray, t_start: Optional[float], t_end: Optional[float]
+    ) -> Tuple[int, int]:
+        """Bisect a sorted time axis for the rows inside ``[t_start, t_end]``."""
+        lo = 0 if t_start is None else int(np.searchsorted(times, t_start, "left"))
+        hi = len(times) if t_end is None else int(np.searchsorted(times, t_end, "right"))
+        return lo, max(lo, hi)
+
+    @classmethod
+    def _slice_table(
+        cls, table: pa.Table, t_start: Optional[float], t_end: Optional[float]
+    ) -> pa.Table:
+        """Zero-copy slice of a time-sorted Arrow table to a time window."""
+        time_col = cls._time_column(table.column_names)
+        if time_col is None or (t_start is None and t_end is None):
+            return table
+        times = table.column(time_col).to_numpy()
+        lo, hi = cls._window_bounds(times, t_start, t_end)
+        return table.slice(lo, hi - lo)
+
+    @classmethod
+    def _slice_frame(
+        cls, data: pd.DataFrame, t_start: Optional[float], t_end: Optional[float]
+    ) -> pd.DataFrame:
+        """Slice a time-sorted DataFrame to a time window."""
+        time_col = cls._time_column(list(data.columns))
+        if time_col is None or (t_start is None and t_end is None):
+            return data
+        lo, hi = cls._window_bounds(data[time_col].to_numpy(), t_start, t_end)
+        return data.iloc[lo:hi].reset_index(drop=True)
+
+    @staticmethod
+    def _overlapping_row_groups(
+        metadata: pq.FileMetaData,
+        time_col: str,
+        t_start: Optional[float],
+        t_end: Optional[float],
+    ) -> List[int]:
+        """Select row groups whose time statistics overlap the window.
+
+        Row groups without statistics are always kept.
+        """
+        selected = []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            stats = None
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if column.path_in_schema == time_col:
+                    stats = column.statistics
+                    break
+            if stats is not None and stats.has_min_max:
+                if t_start is not None and stats.max < t_start:
+                    continue
+                if t_end is not None and stats.min > t_end:
+                    continue
+            selected.append(i)
+        return selected
+
+    @staticmethod
+    def _project(available: List[str], columns: Optional[List[str]]) -> List[str]:
+        """Resolve a column projection against the stored column names.
+
+        Keeps the stored order, always keeps the time column and drops
+        requested names that do not exist.
+        """
+        if columns is None:
+            return list(available)
+        wanted = set(columns) | set(TIME_COLUMNS)
+        return [name for name in available if name in wanted]
 
-    def _load_parquet(self, simulation_hash: str) -> Optional[pd.DataFrame]:
-        """Load data from Parquet format."""
+    def _load_parquet(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Load data from Parquet format.
+
+        Only the projected columns are read, and for a time window only the
+        row groups whose min/max time statistics overlap it are decoded.
+        """
         file_path = self.storage_dir / f"{simulation_hash}.parquet"
         if not file_path.exists():
             return None
 
         try:
-            table = pq.read_table(file_path)
+            parquet_file = pq.ParquetFile(file_path)
+            axis = read_time_axis(parquet_file.schema_arrow)
+            if axis is not None:
+                return self._read_implicit_parquet(
+                    parquet_file, axis, columns, t_start, t_end
+                ).to_pandas()
+
+            names = parquet_file.schema_arrow.names
+            projection = self._project(names, columns)
+            time_col = self._time_column(names)
+
+            if time_col is None or (t_start is None and t_end is None):
+                return decode_table(parquet_file.read(columns=projection)).to_pandas()
+
+            row_groups = self._overlapping_row_groups(
+                parquet_file.metadata, time_col, t_start, t_end
+            )
+            table = decode_table(parquet_file.read_row_groups(row_groups, columns=projection))
+            return self._slice_table(table, t_start, t_end).to_pandas()
+        except Exception:
+            return None
+
+    def _read_implicit_parquet(
+        self,
+        parquet_file: pq.ParquetFile,
+        axis: Dict[str, Any],
+        columns: Optional[List[str]],
+        t_start: Optional[float],
+        t_end: Optional[float],
+    ) -> pa.Table:
+        """Read a Parquet result whose time axis is stored as segments.
+
+        The window's row range is computed from the segments, so only the
+        row groups covering it are decoded and only its rows of the time
+        axis are rebuilt.
+        """
+        projection = self._project(parquet_file.schema_arrow.names, columns)
+        lo, hi = window_rows(axis["segments"], t_start, t_end)
+
+        metadata = parquet_file.metadata
+        row_groups = []
+        first_row = lo
+        offset = 0
+        for i in range(metadata.num_row_groups):
+            rows = metadata.row_group(i).num_rows
+            if offset < hi and offset + rows > lo:
+                if not row_groups:
+                    first_row = offset
+                row_groups.append(i)
+            offset += rows
+
+        if row_groups:
+            table = parquet_file.read_row_groups(row_groups, columns=projection)
+        else:
+            table = parquet_file.schema_arrow.empty_table().select(projection)
+        table = decode_table(table.slice(lo - first_row, hi - lo))
+        return insert_time_axis(table, axis, lo, hi)
+
+    def _store_arrow(self, simulation_hash: str, data: pd.DataFrame) -> Path:
+        """Store data in uncompressed Arrow IPC (Feather v2) format.
+
+        Buffers are left uncompressed so the file can be memory-mapped and
+        read without decoding. Lossy float32/quantized columns are still
+        applied; those columns are copied when read back.
+        """
+        file_path = self.storage_dir / f"{simulation_hash}.arrow"
+
+        table = encode_table(
+            pa.Table.from_pandas(data, preserve_index=False), self._codec_settings(data)
+        )
+        table = self._implicit_time(table)
+        with atomic_write(file_path) as tmp_path:
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        return file_path
+
+    def load_table(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[pa.Table]:
+        """Memory-map an Arrow IPC result as a zero-copy Arrow table.
+
+        Column buffers point straight into the mapped file, so opening a
+        result costs the same regardless of its size; pages are read from
+        disk only when a column is actually touched.
+
+        Args:
+            simulation_hash: Unique hash for this simulation
+            columns: Signals to select (None = all, time column always kept)
+            t_start: Window start; the mapped time column is bisected, so
+                only the pages around the window boundaries are touched.
+                An implicit time axis is resolved from its segments and
+                rebuilt for the selected rows only.
+            t_end: Window end (inclusive)
+
+        Returns:
+            Arrow table, or None if no Arrow result exists
+        """
+        file_path = self.storage_dir / f"{simulation_hash}.arrow"
+        if not file_path.exists():
+            return None
+
+        try:
+            source = pa.memory_map(str(file_path), "r")
+            table = pa.ipc.open_file(source).read_all()
+            axis = read_time_axis(table.schema)
+            if axis is None:
+                table = self._slice_table(table, t_start, t_end)
+                return decode_table(table.select(self._project(table.column_names, columns)))
+
+            lo, hi = window_rows(axis["segments"], t_start, t_end)
+            table = table.slice(lo, hi - lo)
+            table = decode_table(table.select(self._project(table.column_names, columns)))
+            return insert_time_axis(table, axis, lo, hi)
+        except Exception:
+            return None
+
+    def _load_arrow(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Load data from Arrow IPC format as NumPy views over the mapped file."""
+        table = self.load_table(simulation_hash, columns, t_start, t_end)
+        if table is None:
+            return None
+
+        # One block per column lets numeric columns wrap the mapped buffers
+        # instead of being consolidated into a freshly allocated 2-D block
+        return table.to_pandas(split_blocks=True)
+
+    @property
+    def chunk_pool(self) -> ChunkPool:
+        """Shared chunk pool of the ``chunked`` format, opened on first use."""
+        if self._chunk_pool is None:
+            with self._chunk_pool_lock:
+                if self._chunk_pool is None:
+                    self._chunk_pool = ChunkPool(
+                        str(self.storage_dir / "chunks"),
+                        compression=self.settings.compression,
+                        compression_level=self.settings.compression_level,
+                    )
+        return self._chunk_pool
+
+    @property
+    def dataset(self) -> SweepDataset:
+        """Per-model Parquet dataset of the ``dataset`` layout, opened on first use."""
+        if self._dataset is None:
+            self._dataset = SweepDataset(
+                str(self.storage_dir / "dataset"),
+                row_group_size=self.settings.row_group_size,
+                compact_threshold=self.settings.compact_threshold,
+                compression=self.settings.compression,
+                compression_level=self.settings.compression_level,
+            )
+        return self._dataset
+
+    def _load_dataset(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]],
+        t_start: Optional[float],
+        t_end: Optional[float],
+    ) -> Optional[Dict[str, Any]]:
+        """Load one run's row groups from the ``dataset`` layout."""
+        # A concurrent compaction may move the run between locating and
+        # reading it; the second attempt sees the new manifest
+        for _ in range(2):
+            location = self.dataset.locate(simulation_hash)
+            if location is None:
+                return None
+            try:
+                parquet_file = pq.ParquetFile(location.path)
+            except FileNotFoundError:
+                continue
+
+            projection = self._project(location.columns, columns)
+            time_col = self._time_column(location.columns)
+            row_groups = location.row_groups
+            if time_col is not None and (t_start is not None or t_end is not None):
+                overlapping = set(
+                    self._overlapping_row_groups(parquet_file.metadata, time_col, t_start, t_end)
+                )
+                row_groups = [i for i in row_groups if i in overlapping]
+
+            table = parquet_file.read_row_groups(row_groups, columns=projection)
+            table = self._slice_table(table, t_start, t_end)
+            return {"timeseries": table.to_pandas(), "metadata": location.metadata}
+        return None
+
+    def dedup_stats(self) -> Optional[Dict[str, Any]]:
+        """Chunk pool statistics, or None if the pool is not in use."""
+        if self._chunk_pool is None and self.settings.timeseries_format != "chunked":
+            return None
+        return self.chunk_pool.get_stats()
+
+    def clear_chunks(self) -> None:
+        """Drop every pooled chunk; used when the whole store is cleared."""
+        if self._chunk_pool is not None or (self.storage_dir / "chunks").exists():
+            self.chunk_pool.clear()
+
+    def clear_dataset(self) -> None:
+        """Delete the ``dataset`` layout's partitions."""
+        shutil.rmtree(self.storage_dir / "dataset", ignore_errors=True)
+        self._dataset = None
+
+    def close(self) -> None:
+        """Close the chunk pool index, if it was opened."""
+        if self._chunk_pool is not None:
+            self._chunk_pool.close()
+            self._chunk_pool = None
+
+    @staticmethod
+    def _manifest_digests(manifest_path: Path) -> List[str]:
+        """Every chunk reference held by a ``chunked`` result."""
+        manifest = json.loads(manifest_path.read_text())
+        return [
+            digest
+            for spec in manifest["columns"].values()
+            for digest, _, _ in spec["chunks"]
+        ]
+
+    def _store_chunked(self, simulation_hash: str, data: pd.DataFrame) -> Tuple[Path, int]:
+        """Store data as a manifest of deduplicated column chunks.
+
+        Fixed-width columns are cut into content-defined chunks (see
+        ``chunks``); other columns are stored as one Arrow IPC chunk. Lossy
+        codecs and the implicit time axis apply as for Parquet.
+
+        Returns:
+            Manifest path and the bytes newly written to the chunk pool
+        """
+        file_path = self.storage_dir / f"{simulation_hash}.chunks"
+        table = encode_table(
+            pa.Table.from_pandas(data, preserve_index=False), self._codec_settings(data)
+        )
+        table = self._implicit_time(table)
+
+        columns = {}
+        pooled = []
+        for field_ in table.schema:
+            column = table.column(field_.name)
+            dtype = field_.type.to_pandas_dtype() if column.null_count == 0 else None
+            if dtype is not None and np.dtype(dtype).kind in "biuf":
+                values = column.to_numpy()
+                chunks = split_column(values, self.settings.chunk_rows)
+                spec = {"dtype": values.dtype.str}
+            else:
+                sink = pa.BufferOutputStream()
+                single = pa.table({field_.name: column})
+                with pa.ipc.new_stream(sink, single.schema) as writer:
+                    writer.write_table(single)
+                data_bytes = sink.getvalue().to_pybytes()
+                digest = hashlib.sha256(data_bytes).hexdigest()
+                chunks = [(digest, len(column), data_bytes)]
+                spec = {"dtype": None}
+            spec["chunks"] = [[digest, rows, len(raw)] for digest, rows, raw in chunks]
+            columns[field_.name] = spec
+            pooled.extend((digest, raw) for digest, _, raw in chunks)
+
+        manifest = {
+            "num_rows": table.num_rows,
+            "schema": base64.b64encode(table.schema.serialize().to_pybytes()).decode(),
+            "columns": columns,
+        }
+        previous = self._manifest_digests(file_path) if file_path.exists() else []
+
+        written = self.chunk_pool.add(pooled)
+        with atomic_write(file_path) as tmp_path:
+            tmp_path.write_text(json.dumps(manifest))
+        if previous:
+            written -= self.chunk_pool.release(previous)
+        return file_path, written
+
+    def _load_chunked(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Load data stored as deduplicated chunks.
+
+        Only chunks of projected columns that overlap the time window are
+        read from the pool.
+        """
+        file_path = self.storage_dir / f"{simulation_hash}.chunks"
+        if not file_path.exists():
+            return None
+
+        try:
+            manifest = json.loads(file_path.read_text())
+            schema = pa.ipc.read_schema(pa.py_buffer(base64.b64decode(manifest["schema"])))
+            specs = manifest["columns"]
+            axis = read_time_axis(schema)
+            time_col = self._time_column(schema.names)
+
+            lo, hi = 0, manifest["num_rows"]
+            if axis is not None:
+                lo, hi = window_rows(axis["segments"], t_start, t_end)
+            elif time_col is not None and (t_start is not None or t_end is not None):
+                times = self._read_chunked_column(specs[time_col], 0, hi)
+                lo, hi = self._window_bounds(times.to_numpy(), t_start, t_end)
+
+            projection = self._project(schema.names, columns)
+            table = pa.Table.from_arrays(
+                [self._read_chunked_column(specs[name], lo, hi) for name in projection],
+                schema=pa.schema(
+                    [schema.field(name) for name in projection], metadata=schema.metadata
+                ),
+            )
+            table = decode_table(table)
+            if axis is not None:
+                table = insert_time_axis(table, axis, lo, hi)
             return table.to_pandas()
         except Exception:
             return None
 
-    def _store_hdf5(self, simulation_hash: str, data: pd.DataFrame) -> None:
+    def _read_chunked_column(self, spec: Dict[str, Any], lo: int, hi: int) -> pa.Array:
+        """Assemble rows ``[lo, hi)`` of one column from its chunks."""
+        if spec["dtype"] is None:
+            digest = spec["chunks"][0][0]
+            reader = pa.ipc.open_stream(pa.py_buffer(self.chunk_pool.get(digest)))
+            return reader.read_all().column(0).slice(lo, hi - lo).combine_chunks()
+
+        parts = []
+        first_row = lo
+        offset = 0
+        for digest, rows, _ in spec["chunks"]:
+            if offset < hi and offset + rows > lo:
+                if not parts:
+                    first_row = offset
+                parts.append(decode_chunk(self.chunk_pool.get(digest), spec["dtype"]))
+            offset += rows
+        dtype = np.dtype(spec["dtype"])
+        values = np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+        return pa.array(values[lo - first_row : hi - first_row])
+
+    def _store_hdf5(self, simulation_hash: str, data: pd.DataFrame) -> Path:
         """Store data in HDF5 format."""
         file_path = self.storage_dir / f"{simulation_hash}.h5"
-        data.to_hdf(file_path, key="timeseries", mode="w", complevel=9)
-
-    def _load_hdf5(self, simulation_hash: str) -> Optional[pd.DataFrame]:
-        """Load data from HDF5 format."""
+        with atomic_write(file_path) as tmp_path:
+            data.to_hdf(
+                tmp_path,
+                key="timeseries",
+                mode="w",
+                complevel=self.settings.hdf5_complevel,
+                complib=self.settings.hdf5_complib,
+            )
+        return file_path
+
+    def _load_hdf5(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Load data from HDF5 format.
+
+        The fixed HDF5 layout cannot be read column- or row-wise, so
+        projection and time windowing happen after loading.
+        """
         file_path = self.storage_dir / f"{simulation_hash}.h5"
         if not file_path.exists():
             return None
 
         try:
-            return pd.read_hdf(file_path, key="timeseries")
+            data = pd.read_hdf(file_path, key="timeseries")
+            data = self._slice_frame(data, t_start, t_end)
+            return data[self._project(list(data.columns), columns)]
         except Exception:
             return None
 
-    def _store_csv(self, simulation_hash: str, data: pd.DataFrame) -> None:
+    def _store_csv(self, simulation_hash: str, data: pd.DataFrame) -> Path:
         """Store data in CSV format."""
         file_path = self.storage_dir / f"{simulation_hash}.csv"
-        data.to_csv(file_path, index=False)
+        with atomic_write(file_path) as tmp_path:
+            data.to_csv(tmp_path, index=False)
+        return file_path
 
-    def _load_csv(self, simulation_hash: str) -> Optional[pd.DataFrame]:
-        """Load data from CSV format."""
+    def _load_csv(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Load data from CSV format, parsing only the projected columns."""
         file_path = self.storage_dir / f"{simulation_hash}.csv"
         if not file_path.exists():
             return None
 
+        wanted = None if columns is None else set(columns) | set(TIME_COLUMNS)
+
         try:
-            return pd.read_csv(file_path)
+            data = pd.read_csv(
+                file_path, usecols=(lambda name: name in wanted) if wanted else None
+            )
+            return self._slice_frame(data, t_start, t_end)
         except Exception:
             return None
 
     def _store_json_metadata(
         self, simulation_hash: str, metadata: Dict[str, Any]
-    ) -> None:
+    ) -> Path:
         """Store metadata in JSON format."""
         file_path = self.storage_dir / f"{simulation_hash}_metadata.json"
-        with open(file_path, "w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+        with atomic_write(file_path) as tmp_path:
+            with open(tmp_path, "w") as f:
+                json.dump(metadata, f, indent=2, default=str)
+        return file_path
 
     def _load_json_metadata(self, simulation_hash: str) -> Optional[Dict[str, Any]]:
         """Load metadata from JSON format."""
@@ -334,13 +1884,15 @@ class SimulationResultStore:
 
     def _store_yaml_metadata(
         self, simulation_hash: str, metadata: Dict[str, Any]
-    ) -> None:
+    ) -> Path:
         """Store metadata in YAML format."""
         import yaml
 
         file_path = self.storage_dir / f"{simulation_hash}_metadata.yml"
-        with open(file_path, "w") as f:
-            yaml.dump(metadata, f, default_flow_style=False)
+        with atomic_write(file_path) as tmp_path:
+            with open(tmp_path, "w") as f:
+                yaml.dump(metadata, f, default_flow_style=False)
+        return file_path
 
     def _load_yaml_metadata(self, simulation_hash: str) -> Optional[Dict[str, Any]]:
         """Load metadata from YAML format."""
@@ -367,6 +1919,8 @@ class SimulationCache(SimulationCacheBase):
         # Initialize cache backend
         if self.config.cache.type == "file":
             self.backend = FileCacheBackend(self.config.cache.directory)
+        elif self.config.cache.type == "sqlite":
+            self.backend = SqliteCacheBackend(self.config.cache.directory)
         else:
             raise ValueError(f"Unsupported cache type: {self.config.cache.type}")
 
@@ -375,14 +1929,124 @@ class SimulationCache(SimulationCacheBase):
             os.path.join(self.config.cache.directory, "results")
         )
 
+        # Incrementally maintained statistics; a cache without persisted
+        # counters, or whose totals disagree with the backend (a process
+        # died before flushing), is listed once to seed them
+        self.stats = CacheStats(self.config.cache.directory)
+        totals = self.backend.size_totals()
+        if self.stats.needs_rebuild or (
+            totals is not None and totals != (self.stats.total_entries, self.stats.total_bytes)
+        ):
+            self.stats.rebuild(self.backend.iter_entries())
+
+        # In-memory membership filter so definite misses skip all disk I/O;
+        # rebuilt when the backend's change token shows another process
+        # wrote to the index
+        self.bloom: Optional[BloomFilter] = None
+        self.bloom_stats = {"skipped_lookups": 0, "false_positives": 0, "refreshes": 0}
+        self._bloom_token: Optional[Any] = None
+        self._bloom_lock = threading.Lock()
+        if self.config.cache.bloom_enabled:
+            self._rebuild_bloom()
+
+        # Background TTL and size enforcement
+        max_size_mb = self.config.cache.max_size_mb
+        self.gc = CacheGarbageCollector(
+            self,
+            max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+            policy=self.config.cache.eviction_policy,
+            interval=self.config.cache.gc_interval,
+            batch_size=self.config.cache.gc_batch_size,
+            cost_weight=self.config.cache.cost_weight,
+        )
+        if self.config.cache.enabled and self.config.cache.gc_interval > 0:
+            self.gc.start()
+
+        # Heavily compressed cold tier for results that are no longer read
+        self.cold_store: Optional[SimulationResultStore] = None
+        self.tiers: Optional[CacheTierManager] = None
+        if self.config.cache.tiers_enabled:
+            self.cold_store = SimulationResultStore(
+                self.config.cache.cold_directory
+                or os.path.join(self.config.cache.directory, "cold"),
+                dataclasses.replace(
+                    self.config.cache,
+                    timeseries_format=self.config.cache.cold_format,
+                    compression=self.config.cache.cold_compression,
+                    compression_level=self.config.cache.cold_compression_level,
+                    column_compression={},
+                    storage_layout="flat",
+                ),
+            )
+            self.tiers = CacheTierManager(
+                self,
+                demote_after=self.config.cache.demote_after,
+                interval=self.config.cache.tier_interval,
+                batch_size=self.config.cache.tier_batch_size,
+            )
+            if self.config.cache.enabled and self.config.cache.tier_interval > 0:
+                self.tiers.start()
+
+        # Bounded pool for concurrent result loads in bulk lookups
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+
+        # Per-hash leases coordinating processes that share the directory;
+        # a lease is held from the decision to simulate until the result
+        # is indexed
+        self.leases = LeaseManager(os.path.join(self.config.cache.directory, "locks"))
+        self._held_leases: Dict[str, Lease] = {}
+        self._leases_lock = threading.Lock()
+
+        # Spatial index over cached parameter points for approximate lookups
+        self.approximate_index = ApproximateIndex()
+
+        # Negative cache of deterministic simulation failures
+        self.failures = FailureStore(os.path.join(self.config.cache.directory, "failures"))
+        self.states: Optional[SystemStateStore] = None
+        if self.config.cache.warm_start_enabled:
+            self.states = SystemStateStore(
+                os.path.join(self.config.cache.directory, "states"),
+                self.config.cache.warm_start_max_states,
+            )
+        self.failure_classes = failure_classes(self.config.cache.failure_classes)
+
+        # Write-behind persistence for enqueue_result
+        self.writer: Optional[CacheWriter] = None
+        if self.config.cache.enabled and self.config.cache.write_behind:
+            self.writer = CacheWriter(
+                self,
+                workers=self.config.cache.writer_workers,
+                batch_size=self.config.cache.writer_batch_size,
+                fsync=self.config.cache.writer_fsync,
+                max_pending=self.config.cache.writer_max_pending,
+            )
+            self.writer.start()
+
     def get_cached_result(
-        self, model_file: str, parameters: Dict[str, Any]
+        self,
+        model_file: str,
+        parameters: Dict[str, Any],
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+        client: Optional[str] = None,
+        use_bloom: bool = True,
+        variant: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """Get cached simulation result if available.
 
         Args:
             model_file: Path to PLECS model file
             parameters: Simulation parameters
+            columns: Signals to load (None = all). Only these columns are
+                read from disk; the time column is always included.
+            t_start: Only return samples at or after this time
+            t_end: Only return samples at or before this time
+            client: Requesting client, for per-client statistics
+            use_bloom: Let the Bloom filter answer definite misses. Pass
+                False when the result is expected to have just been
+                written, e.g. by another process's lease holder.
+            variant: Key space to look in (see ``SimulationHash.compute_hash``)
 
         Returns:
             Cached result or None if not found
@@ -390,12 +2054,301 @@ class SimulationCache(SimulationCacheBase):
         if not self.config.cache.enabled:
             return None
 
-        simulation_hash = self.hasher.compute_hash(
-            model_file, parameters, self.config.cache.include_files
+        simulation_hash = self.simulation_hash(model_file, parameters, variant)
+        return self._lookup(
+            simulation_hash, columns, t_start, t_end, model_file, client, use_bloom
+        )
+
+    def load_result(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+        client: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Load a cached result by its simulation hash.
+
+        Same as ``get_cached_result`` for callers that already hold the hash,
+        e.g. from a ``ResultHandle``.
+        """
+        if not self.config.cache.enabled:
+            return None
+        return self._lookup(simulation_hash, columns, t_start, t_end, None, client)
+
+    def _lookup(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]],
+        t_start: Optional[float],
+        t_end: Optional[float],
+        model_file: Optional[str],
+        client: Optional[str],
+        use_bloom: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """Serve one lookup and count it as a hit or miss."""
+        pending = self._pending_result(simulation_hash, columns, t_start, t_end)
+        if pending is not None:
+            self._record_hit(self._pending_entry(simulation_hash), model_file, client)
+            return pending
+
+        bloom = self.bloom if use_bloom else None
+        screened = bloom is not None and simulation_hash in bloom
+        if bloom is not None and not screened and self._refresh_bloom():
+            if simulation_hash not in self.bloom:
+                self._count_bloom("skipped_lookups")
+                self.stats.record_miss(model_file=model_file, client=client)
+                return None
+            screened = True
+
+        # The backend entry carries the TTL; an expired or unknown entry is
+        # a miss even if its results have not been collected yet
+        entry = self.backend.get(simulation_hash)
+        if entry is None:
+            if screened:
+                self._count_bloom("false_positives")
+            self.stats.record_miss(model_file=model_file, client=client)
+            return None
+
+        result = self._load_stored(simulation_hash, columns, t_start, t_end)
+        if result is None:
+            self.stats.record_miss(model_file=model_file or entry.get("model_file"), client=client)
+        else:
+            self._record_hit(entry, model_file, client)
+        return result
+
+    def _pending_entry(self, simulation_hash: str) -> Dict[str, Any]:
+        """Fields of a result queued for writing (empty once it is written)."""
+        item = self.writer.get_pending(simulation_hash) if self.writer is not None else None
+        return item or {}
+
+    def _record_hit(
+        self, entry: Dict[str, Any], model_file: Optional[str], client: Optional[str]
+    ) -> None:
+        """Count a hit with the stored size and the simulation time it saved."""
+        self.stats.record_hit(
+            model_file=model_file or entry.get("model_file"),
+            client=client,
+            bytes_read=int(entry.get("size_bytes") or 0),
+            seconds_saved=float(entry.get("execution_time") or 0.0),
         )
 
-        # Check if result exists in store
-        return self.result_store.load_results(simulation_hash)
+    def get_approximate_result(
+        self,
+        model_file: str,
+        parameters: Dict[str, Any],
+        tolerances: Optional[Dict[str, float]] = None,
+        mode: Optional[str] = None,
+        neighbors: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Answer a near miss from cached results close to ``parameters``.
+
+        Parameters with a tolerance may differ from the cached point by up
+        to that much; all others must match exactly. Requires the sqlite
+        backend, which indexes the parameters.
+
+        Args:
+            model_file: Path to PLECS model file
+            parameters: Requested simulation parameters
+            tolerances: Largest accepted difference per parameter
+                (default ``cache.approximate.tolerances``)
+            mode: ``nearest`` or ``interpolate``
+                (default ``cache.approximate.mode``)
+            neighbors: Neighbors blended in ``interpolate`` mode and used for
+                the error estimate (default ``cache.approximate.neighbors``)
+            columns: Signals to load (None = all)
+
+        Returns:
+            Result dict whose metadata has ``approximate: True`` and an
+            ``approximation`` record, or None if no cached point is within
+            tolerance
+        """
+        if not self.config.cache.enabled:
+            return None
+        if not isinstance(self.backend, SqliteCacheBackend):
+            raise UnsupportedCacheBackend(
+                f"Approximate lookups require cache type 'sqlite', not '{self.config.cache.type}'"
+            )
+        mode = mode or self.config.cache.approximate_mode
+        if mode not in APPROXIMATE_MODES:
+            raise ValueError(f"Unknown approximate mode: {mode}")
+        if tolerances is None:
+            tolerances = self.config.cache.approximate_tolerances
+
+        found = self.approximate_index.neighbors(
+            self.backend,
+            self.hasher.model_fingerprint(model_file),
+            parameters,
+            tolerances,
+            k=neighbors or self.config.cache.approximate_neighbors,
+        )
+        loaded = [
+            (neighbor, self._load_stored(neighbor.simulation_hash, columns))
+            for neighbor in found
+        ]
+        # Neighbors whose results were collected since the index was built
+        loaded = [(neighbor, result) for neighbor, result in loaded if result is not None]
+        if not loaded:
+            return None
+        return approximate_result(
+            [neighbor for neighbor, _ in loaded],
+            [result for _, result in loaded],
+            mode,
+            TIME_COLUMNS,
+        )
+
+    def get_cached_results_many(
+        self,
+        requests: Sequence[Tuple[Any, ...]],
+        clients: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Look up many simulations in one call.
+
+        Hashes are computed in bulk (the model file is read once per
+        model), definite misses are filtered by the Bloom filter, the
+        backend is queried once for the rest, and hits are loaded
+        concurrently on a pool of ``cache.io_workers`` threads.
+
+        Args:
+            requests: ``(model_file, parameters)`` or
+                ``(model_file, parameters, columns)`` tuples
+            clients: Requesting client per request, for per-client
+                statistics
+
+        Returns:
+            One entry per request, in order: the cached result (as from
+            ``get_cached_result``) or None for a miss
+        """
+        if not self.config.cache.enabled:
+            return [None] * len(requests)
+
+        include_files = self.config.cache.include_files
+        hashes = [
+            self.hasher.compute_hash(request[0], request[1], include_files)
+            for request in requests
+        ]
+
+        results: List[Optional[Dict[str, Any]]] = [
+            self._pending_result(h, request[2] if len(request) > 2 else None)
+            for h, request in zip(hashes, requests)
+        ]
+
+        candidates = {h for h, result in zip(hashes, results) if result is None}
+        screened = self.bloom is not None and self._refresh_bloom()
+        if screened:
+            candidates = {h for h in candidates if h in self.bloom}
+            skipped = sum(
+                1 for h, r in zip(hashes, results) if r is None and h not in candidates
+            )
+            self._count_bloom("skipped_lookups", skipped)
+
+        entries = self.backend.get_many(candidates) if candidates else {}
+        if screened:
+            self._count_bloom(
+                "false_positives", sum(1 for h in hashes if h in candidates and h not in entries)
+            )
+
+        def load(index: int) -> Optional[Dict[str, Any]]:
+            columns = requests[index][2] if len(requests[index]) > 2 else None
+            return self._load_stored(hashes[index], columns)
+
+        hit_indexes = [
+            i for i, h in enumerate(hashes) if results[i] is None and h in entries
+        ]
+        if hit_indexes:
+            for index, result in zip(hit_indexes, self._pool().map(load, hit_indexes)):
+                results[index] = result
+
+        clients = clients or [None] * len(requests)
+        for index, (h, result) in enumerate(zip(hashes, results)):
+            model_file = requests[index][0]
+            if result is None:
+                self.stats.record_miss(model_file=model_file, client=clients[index])
+            else:
+                entry = entries[h] if h in entries else self._pending_entry(h)
+                self._record_hit(entry, model_file, clients[index])
+        return results
+
+    def missing_points(self, model_file: str, points: Sequence[Dict[str, Any]]) -> List[int]:
+        """Indexes of parameter points that still need a simulation.
+
+        A point is covered if it has a cached (or queued) result, or a
+        recorded deterministic failure. Answered from the hash index
+        without loading any results or counting lookups, e.g. to plan
+        cache warming.
+
+        Args:
+            model_file: Path to PLECS model file
+            points: Parameter sets
+
+        Returns:
+            Indexes into ``points``, in order
+        """
+        if not self.config.cache.enabled:
+            return list(range(len(points)))
+
+        include_files = self.config.cache.include_files
+        hashes = [self.hasher.compute_hash(model_file, point, include_files) for point in points]
+        candidates = {
+            h for h in hashes if self.writer is None or self.writer.get_pending(h) is None
+        }
+        queued = set(hashes) - candidates
+        if self.bloom is not None and self._refresh_bloom():
+            indexed = {h for h in candidates if h in self.bloom}
+        else:
+            indexed = candidates
+        cached = set(self.backend.get_many(indexed)) if indexed else set()
+
+        return [
+            i
+            for i, h in enumerate(hashes)
+            if h not in queued
+            and h not in cached
+            and self.get_cached_failure(model_file, points[i], h) is None
+        ]
+
+    def _load_stored(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+        promote: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """Load stored results from the hot tier, falling back to the cold one.
+
+        A result found only in the cold tier is moved back to the hot tier
+        first when ``cache.tiers.promote_on_read`` is set (and ``promote``).
+        """
+        result = self.result_store.load_results(simulation_hash, columns, t_start, t_end)
+        if result is not None or self.cold_store is None:
+            return result
+        if promote and self.config.cache.promote_on_read and self.tiers.promote(simulation_hash):
+            return self.result_store.load_results(simulation_hash, columns, t_start, t_end)
+        return self.cold_store.load_results(simulation_hash, columns, t_start, t_end)
+
+    def _delete_stored(self, simulation_hash: str) -> int:
+        """Delete a result from every tier and return the bytes freed."""
+        freed = self.result_store.delete_results(simulation_hash)
+        if self.cold_store is not None:
+            freed += self.cold_store.delete_results(simulation_hash)
+        return freed
+
+    def store_for(self, simulation_hash: str) -> "SimulationResultStore":
+        """The result store (hot or cold tier) holding a result's files."""
+        if self.cold_store is not None and self.cold_store.stored_formats(simulation_hash):
+            return self.cold_store
+        return self.result_store
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Return the I/O pool, creating it on first use."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self.config.cache.io_workers,
+                thread_name_prefix="pyplecs-cache-io",
+            )
+        return self._io_pool
 
     def cache_result(
         self,
@@ -403,6 +2356,9 @@ class SimulationCache(SimulationCacheBase):
         parameters: Dict[str, Any],
         timeseries_data: pd.DataFrame,
         metadata: Dict[str, Any],
+        execution_time: float = 0.0,
+        client: Optional[str] = None,
+        variant: Optional[str] = None,
     ) -> str:
         """Cache simulation result.
 
@@ -411,6 +2367,12 @@ class SimulationCache(SimulationCacheBase):
             parameters: Simulation parameters
             timeseries_data: Time series simulation data
             metadata: Simulation metadata
+            execution_time: Seconds the simulation took, used by cost-aware
+                eviction
+            client: Client whose request produced the result, for
+                per-client statistics
+            variant: Key space to store the result in (see
+                ``SimulationHash.compute_hash``)
 
         Returns:
             Simulation hash for this cached result
@@ -418,24 +2380,210 @@ class SimulationCache(SimulationCacheBase):
         if not self.config.cache.enabled:
             return ""
 
-        simulation_hash = self.hasher.compute_hash(
-            model_file, parameters, self.config.cache.include_files
+        simulation_hash = self.simulation_hash(model_file, parameters, variant)
+
+        entry = self._store_result(
+            simulation_hash,
+            model_file,
+            parameters,
+            timeseries_data,
+            metadata,
+            execution_time,
+            client,
+            variant,
         )
+        self._index_entries([entry])
 
-        # Store in result store
-        self.result_store.store_results(simulation_hash, timeseries_data, metadata)
+        return simulation_hash
 
-        # Store hash in cache backend for quick lookup
-        cache_entry = {
+    def enqueue_result(
+        self,
+        model_file: str,
+        parameters: Dict[str, Any],
+        timeseries_data: pd.DataFrame,
+        metadata: Dict[str, Any],
+        execution_time: float = 0.0,
+        client: Optional[str] = None,
+        variant: Optional[str] = None,
+    ) -> str:
+        """Cache a simulation result without waiting for it to be written.
+
+        With ``cache.write_behind.enabled`` the result is handed to the
+        background writer and served from memory until it is on disk;
+        otherwise this is the same as ``cache_result``.
+
+        Returns:
+            Simulation hash for this cached result
+        """
+        if self.writer is None:
+            return self.cache_result(
+                model_file, parameters, timeseries_data, metadata, execution_time, client, variant
+            )
+        if not self.config.cache.enabled:
+            return ""
+
+        simulation_hash = self.simulation_hash(model_file, parameters, variant)
+        self.writer.submit(
+            simulation_hash,
+            {
+                "model_file": model_file,
+                "parameters": parameters,
+                "timeseries": timeseries_data,
+                "metadata": metadata,
+                "execution_time": execution_time,
+                "client": client,
+                "variant": variant,
+            },
+        )
+        return simulation_hash
+
+    def flush(self) -> None:
+        """Wait for queued writes and persist statistics."""
+        if self.writer is not None:
+            self.writer.flush()
+        self.stats.flush()
+
+    def _store_result(
+        self,
+        simulation_hash: str,
+        model_file: str,
+        parameters: Dict[str, Any],
+        timeseries_data: pd.DataFrame,
+        metadata: Dict[str, Any],
+        execution_time: float,
+        client: Optional[str] = None,
+        variant: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Write result files and return the backend entry describing them."""
+        fingerprint = self.hasher.model_fingerprint(model_file)
+        size_bytes = self.result_store.store_results(
+            simulation_hash,
+            timeseries_data,
+            metadata,
+            model_fingerprint=fingerprint,
+            parameters=parameters,
+        )
+        if self.cold_store is not None:
+            # A re-run supersedes a demoted copy
+            self.cold_store.delete_results(simulation_hash)
+        return {
             "model_file": model_file,
+            "model_fingerprint": fingerprint,
             "parameters": parameters,
             "simulation_hash": simulation_hash,
             "cached_at": time.time(),
+            "size_bytes": size_bytes,
+            "execution_time": execution_time,
+            "client": client,
+            "variant": variant,
+            "kpis": compute_kpis(
+                timeseries_data, TIME_COLUMNS, (metadata or {}).get("kpis")
+            ),
         }
 
-        self.backend.set(simulation_hash, cache_entry, self.config.cache.ttl)
+    def _index_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Record stored results in the backend, statistics and Bloom filter."""
+        replaced = {
+            entry["simulation_hash"]: self.backend.peek(entry["simulation_hash"])
+            for entry in entries
+        }
+        token = self.backend.change_token() if self.bloom is not None else None
+        self.backend.set_many(
+            {entry["simulation_hash"]: entry for entry in entries},
+            self.config.cache.ttl,
+        )
 
-        return simulation_hash
+        for entry in entries:
+            self.stats.record_write(
+                entry["model_file"],
+                entry["size_bytes"],
+                replaced=replaced[entry["simulation_hash"]],
+                client=entry.get("client"),
+            )
+
+        if self.bloom is not None:
+            with self._bloom_lock:
+                self.bloom.update(entry["simulation_hash"] for entry in entries)
+                # Our own write may move the token; adopt the new one unless
+                # another process had already moved it
+                if token is not None and token == self._bloom_token:
+                    self._bloom_token = self.backend.change_token()
+            if self.bloom.is_saturated:
+                self._rebuild_bloom()
+        self.approximate_index.invalidate()
+
+        # Results are visible to other processes now
+        for entry in entries:
+            self._release_result_leases(entry)
+
+    def _release_result_leases(self, entry: Dict[str, Any]) -> None:
+        """Release the leases a stored (or dropped) result ends.
+
+        A variant result, e.g. a warm-started run, was simulated under the
+        lease of the plain key, which waiters watch; that lease ends too.
+        """
+        self.release_lease(entry["simulation_hash"])
+        if entry.get("variant"):
+            self.release_lease(self.simulation_hash(entry["model_file"], entry["parameters"]))
+
+    def simulation_hash(
+        self, model_file: str, parameters: Dict[str, Any], variant: Optional[str] = None
+    ) -> str:
+        """Return the cache key for a model and parameter set."""
+        return self.hasher.compute_hash(
+            model_file, parameters, self.config.cache.include_files, variant
+        )
+
+    def acquire_lease(self, simulation_hash: str) -> bool:
+        """Claim the right to simulate ``simulation_hash``.
+
+        Returns False if this or another process already holds the lease;
+        the caller should then ``wait_for_lease`` and re-check the cache.
+        The lease is released when the result is indexed or by
+        ``release_lease``.
+        """
+        lease = self.leases.acquire(simulation_hash)
+        if lease is None:
+            return False
+        with self._leases_lock:
+            self._held_leases[simulation_hash] = lease
+        return True
+
+    def release_lease(self, simulation_hash: str) -> None:
+        """Give up a lease, e.g. after a failed simulation."""
+        with self._leases_lock:
+            lease = self._held_leases.pop(simulation_hash, None)
+        if lease is not None:
+            lease.release()
+
+    def wait_for_lease(
+        self, simulation_hash: str, timeout: Optional[float] = None
+    ) -> bool:
+        """Block until no process holds the lease for ``simulation_hash``.
+
+        Returns:
+            True once the holder finished, False on timeout
+        """
+        return self.leases.wait(simulation_hash, timeout)
+
+    def _pending_result(
+        self,
+        simulation_hash: str,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Serve a result that is queued for writing but not yet on disk."""
+        if self.writer is None:
+            return None
+        item = self.writer.get_pending(simulation_hash)
+        if item is None:
+            return None
+
+        store = self.result_store
+        timeseries = store._slice_frame(item["timeseries"], t_start, t_end)
+        timeseries = timeseries[store._project(list(timeseries.columns), columns)]
+        return {"timeseries": timeseries, "metadata": item["metadata"]}
 
     def invalidate_cache(self, model_file: str, parameters: Dict[str, Any]) -> bool:
         """Invalidate cached result for specific model and parameters.
@@ -451,30 +2599,483 @@ class SimulationCache(SimulationCacheBase):
             model_file, parameters, self.config.cache.include_files
         )
 
-        return self.backend.delete(simulation_hash)
+        if self.writer is not None:
+            self.writer.discard(simulation_hash)
+            self.writer.flush()
+        self.release_lease(simulation_hash)
+
+        entry = self.backend.peek(simulation_hash)
+        deleted = self.backend.delete(simulation_hash)
+        freed = self._delete_stored(simulation_hash)
+        self.approximate_index.invalidate()
+        self.failures.delete(simulation_hash)
+        if entry is not None:
+            self.stats.record_removal(entry.get("model_file"), freed)
+        return deleted
+
+    def record_failure(
+        self,
+        model_file: str,
+        parameters: Dict[str, Any],
+        error: str,
+        simulation_hash: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Remember a failed simulation if its failure is deterministic.
+
+        The error message is matched against the failure classes
+        (``cache.failures.classes``); unrecognized failures are transient
+        and not recorded.
+
+        Args:
+            model_file: Path to PLECS model file
+            parameters: Simulation parameters
+            error: Failure message
+            simulation_hash: Cache key, if already computed
+
+        Returns:
+            The stored failure record, or None if the failure is transient
+            or negative caching is disabled
+        """
+        if not (self.config.cache.enabled and self.config.cache.negative_cache_enabled):
+            return None
+        failure_class = classify_failure(error, self.failure_classes)
+        if failure_class is None:
+            return None
+        if simulation_hash is None:
+            simulation_hash = self.simulation_hash(model_file, parameters)
+        return self.failures.record(
+            simulation_hash, error, failure_class, model_file, parameters
+        )
+
+    def get_cached_failure(
+        self,
+        model_file: str,
+        parameters: Dict[str, Any],
+        simulation_hash: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the unexpired deterministic failure recorded for a simulation.
+
+        Returns:
+            Record with ``error``, ``failure_class`` and ``expires_at``, or None
+        """
+        if not (self.config.cache.enabled and self.config.cache.negative_cache_enabled):
+            return None
+        if simulation_hash is None:
+            simulation_hash = self.simulation_hash(model_file, parameters)
+        return self.failures.get(simulation_hash)
+
+    def record_system_state(
+        self,
+        model_file: str,
+        parameters: Dict[str, Any],
+        state: Any,
+        simulation_time: Optional[float] = None,
+    ) -> bool:
+        """Remember the final system state of a completed run.
+
+        Returns:
+            True if the state was stored (``cache.warm_start.enabled``)
+        """
+        if self.states is None or state is None:
+            return False
+        return self.states.record(
+            self.hasher.model_fingerprint(model_file),
+            self.hasher.key_parameters(parameters, model_file),
+            state,
+            simulation_time,
+        )
+
+    def find_system_state(
+        self, model_file: str, parameters: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored state of the closest recorded operating point.
+
+        Returns:
+            Record with ``state``, ``parameters`` and ``distance``, or None
+            if warm starts are disabled or no point is within
+            ``cache.warm_start.max_distance``
+        """
+        if self.states is None:
+            return None
+        return self.states.nearest(
+            self.hasher.model_fingerprint(model_file),
+            self.hasher.key_parameters(parameters, model_file),
+            self.config.cache.warm_start_max_distance,
+        )
+
+    def query_entries(
+        self,
+        model_file: Optional[str] = None,
+        parameter_ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Range query over cached entries (requires the sqlite backend).
+
+        Args:
+            model_file: Restrict to entries for this model's current content
+            parameter_ranges: Inclusive ``(low, high)`` bounds per parameter
+            **kwargs: Forwarded to ``SqliteCacheBackend.query``
+
+        Returns:
+            List of index entries
+        """
+        if not isinstance(self.backend, SqliteCacheBackend):
+            raise UnsupportedCacheBackend(
+                f"Range queries require cache type 'sqlite', not '{self.config.cache.type}'"
+            )
+
+        fingerprint = self.hasher.model_fingerprint(model_file) if model_file else None
+        return self.backend.query(
+            model_fingerprint=fingerprint, parameter_ranges=parameter_ranges, **kwargs
+        )
+
+    def find_results(
+        self,
+        model_file: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        kpis: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        order_by: str = "created_at",
+        descending: bool = False,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+    ) -> List[ResultHandle]:
+        """Find cached results by parameter values and KPIs (sqlite backend).
+
+        Args:
+            model_file: Restrict to results for this model's current content
+            parameters: ``{name: value}`` equality or ``{name: (low, high)}``
+                inclusive range filters, e.g. ``{"Vi": (10, 48), "fs": 100e3}``
+            kpis: Inclusive ``(low, high)`` ranges on indexed KPIs, e.g.
+                ``{"Vo.mean": (11.5, 12.5)}``
+            order_by: Entry column, ``param:<name>`` or ``kpi:<name>``
+            descending: Sort in descending order
+            limit: Page size (None = no limit)
+            offset: Number of matches to skip
+
+        Returns:
+            Handles of matching results; ``handle.load()`` reads the waveforms
+        """
+        if not isinstance(self.backend, SqliteCacheBackend):
+            raise UnsupportedCacheBackend(
+                f"Result queries require cache type 'sqlite', not '{self.config.cache.type}'"
+            )
+        # Results still queued by the write-behind writer are not indexed yet
+        if self.writer is not None:
+            self.writer.flush()
+
+        parameter_ranges, parameter_values = split_filters(parameters)
+        fingerprint = self.hasher.model_fingerprint(model_file) if model_file else None
+        entries = self.backend.query(
+            model_fingerprint=fingerprint,
+            parameter_ranges=parameter_ranges,
+            parameter_values=parameter_values,
+            kpi_ranges=kpis,
+            order_by=order_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
+        return [ResultHandle.from_entry(entry, cache=self) for entry in entries]
+
+    def export_bundle(
+        self,
+        path: str,
+        model_file: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        kpis: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        simulation_hashes: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Pack a selection of cached results into one bundle file.
+
+        Args:
+            path: Bundle file to write (see ``pyplecs.cache.bundle``)
+            model_file: Only results for this model's current content
+            since: Only results cached at or after this Unix time
+            until: Only results cached at or before this Unix time
+            parameters: Parameter filters as for ``find_results`` (sqlite)
+            kpis: KPI ranges as for ``find_results`` (sqlite)
+            simulation_hashes: Only these results
+
+        Returns:
+            Number of results and bytes written
+        """
+        if self.writer is not None:
+            self.writer.flush()
+        keys = self._select_keys(model_file, since, until, parameters, kpis)
+        if simulation_hashes is not None:
+            wanted = set(simulation_hashes)
+            keys = [key for key in keys if key in wanted]
+
+        def results():
+            for key in keys:
+                entry = self.backend.peek(key)
+                result = self._load_stored(key, promote=False) if entry is not None else None
+                if result is None:
+                    # Collected since it was selected
+                    continue
+                table = pa.Table.from_pandas(result["timeseries"], preserve_index=False)
+                yield key, entry, result["metadata"], table
+
+        selection = {
+            "model_file": model_file,
+            "since": since,
+            "until": until,
+            "parameters": parameters,
+            "kpis": kpis,
+        }
+        return write_bundle(path, results(), {"selection": selection})
+
+    def _select_keys(
+        self,
+        model_file: Optional[str],
+        since: Optional[float],
+        until: Optional[float],
+        parameters: Optional[Dict[str, Any]],
+        kpis: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]],
+    ) -> List[str]:
+        """Keys of unexpired entries matching an export selection."""
+        fingerprint = self.hasher.model_fingerprint(model_file) if model_file else None
+        if isinstance(self.backend, SqliteCacheBackend):
+            parameter_ranges, parameter_values = split_filters(parameters)
+            entries = self.backend.query(
+                model_fingerprint=fingerprint,
+                ranges={"created_at": (since, until)},
+                parameter_ranges=parameter_ranges,
+                parameter_values=parameter_values,
+                kpi_ranges=kpis,
+            )
+            return [entry["key"] for entry in entries]
+
+        if parameters or kpis:
+            raise UnsupportedCacheBackend(
+                f"Parameter and KPI selection require cache type 'sqlite', "
+                f"not '{self.config.cache.type}'"
+            )
+        now = time.time()
+        keys = []
+        for entry in self.backend.iter_entries():
+            created_at = entry.get("created_at") or 0.0
+            if (entry.get("expires_at") or now) < now:
+                continue
+            if (since is not None and created_at < since) or (
+                until is not None and created_at > until
+            ):
+                continue
+            if fingerprint is not None:
+                value = self.backend.peek(entry["key"]) or {}
+                if value.get("model_fingerprint") != fingerprint:
+                    continue
+            keys.append(entry["key"])
+        return keys
+
+    def import_bundle(self, path: str) -> Dict[str, int]:
+        """Merge the results of a bundle file into this cache.
+
+        Only keys missing here are imported; every imported result must
+        match its checksum. Results are stored in this cache's configured
+        format and layout and indexed with this cache's TTL.
+
+        Args:
+            path: Bundle file written by ``export_bundle``
+
+        Returns:
+            Counts of ``imported``, ``skipped`` (already cached) and
+            ``corrupt`` (checksum mismatch) results
+        """
+        if not self.config.cache.enabled:
+            raise RuntimeError("Cannot import into a disabled cache")
+        hashes = read_manifest(path)["simulation_hashes"]
+        present = set(self.backend.get_many(hashes)) if hashes else set()
+        counts = {"imported": 0, "skipped": len(present), "corrupt": 0}
+
+        entries: List[Dict[str, Any]] = []
+        for simulation_hash, result in iter_bundle(path, skip=present):
+            if result is None:
+                counts["corrupt"] += 1
+                continue
+            entry = result["entry"]
+            entry["size_bytes"] = self.result_store.store_results(
+                simulation_hash,
+                result["timeseries"].to_pandas(),
+                result["metadata"],
+                model_fingerprint=entry.get("model_fingerprint"),
+                parameters=entry.get("parameters"),
+            )
+            entry["simulation_hash"] = simulation_hash
+            entries.append(entry)
+            if len(entries) >= self.config.cache.writer_batch_size:
+                self._index_entries(entries)
+                entries = []
+            counts["imported"] += 1
+        if entries:
+            self._index_entries(entries)
+        return counts
+
+    def scan_sweep(
+        self,
+        model_file: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filter: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """Read every cached run of a model in one scan (``dataset`` layout).
+
+        Args:
+            model_file: Model whose runs to read (None = every model)
+            columns: Signals, ``simulation_hash`` and ``param_<name>``
+                columns to read (None = all)
+            filter: ``pyarrow.dataset`` expression, e.g.
+                ``pyarrow.dataset.field("param_Vi") > 10``
+
+        Returns:
+            One row per sample of every matching run
+        """
+        if self.config.cache.storage_layout != "dataset":
+            raise UnsupportedCacheBackend(
+                "Sweep scans require cache.storage.layout 'dataset', "
+                f"not '{self.config.cache.storage_layout}'"
+            )
+        if self.writer is not None:
+            self.writer.flush()
+        fingerprint = self.hasher.model_fingerprint(model_file) if model_file else None
+        return self.result_store.dataset.scan(fingerprint, columns, filter).to_pandas()
+
+    def evict(self, simulation_hash: str, reason: str = "eviction") -> int:
+        """Drop a cache entry together with its stored results.
+
+        Args:
+            simulation_hash: Hash of the entry to drop
+            reason: ``"eviction"`` or ``"expiration"``, for statistics
+
+        Returns:
+            Number of result bytes freed
+        """
+        entry = self.backend.peek(simulation_hash)
+        self.backend.delete(simulation_hash)
+        freed = self._delete_stored(simulation_hash)
+        self.approximate_index.invalidate()
+        if entry is not None:
+            # Statistics mirror the indexed size, which a cold copy does not change
+            self.stats.record_removal(
+                entry.get("model_file"),
+                int(entry.get("size_bytes") or freed),
+                reason,
+                client=entry.get("client"),
+            )
+        return freed
+
+    def close(self) -> None:
+        """Stop background collection, persist statistics and release the backend."""
+        if self.writer is not None:
+            self.writer.stop()
+        with self._leases_lock:
+            leases, self._held_leases = list(self._held_leases.values()), {}
+        for lease in leases:
+            lease.release()
+        self.gc.stop()
+        if self.tiers is not None:
+            self.tiers.stop()
+            self.cold_store.close()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+        self.stats.flush()
+        self.result_store.close()
+        self.backend.close()
+
+    def _rebuild_bloom(self) -> None:
+        """Rebuild the membership filter from the backend's keys.
+
+        The filter is sized for at least twice the current number of
+        entries, so it is rebuilt (and its stale bits for removed keys
+        dropped) only after the cache has doubled.
+        """
+        with self._bloom_lock:
+            # Read the token first: a write racing the listing moves it again
+            token = self.backend.change_token()
+            keys = list(self.backend.iter_keys())
+            bloom = BloomFilter(
+                capacity=max(self.config.cache.bloom_capacity, 2 * len(keys)),
+                fp_rate=self.config.cache.bloom_fp_rate,
+            )
+            bloom.update(keys)
+            self.bloom, self._bloom_token = bloom, token
+
+    def _refresh_bloom(self) -> bool:
+        """Rebuild the filter if another process may have written entries.
+
+        Returns:
+            True if negative answers of the filter can be trusted
+        """
+        token = self.backend.change_token()
+        if token is None:
+            return False
+        if token != self._bloom_token:
+            self._rebuild_bloom()
+            self._count_bloom("refreshes")
+        return True
+
+    def _count_bloom(self, name: str, count: int = 1) -> None:
+        """Bump a filter counter; lookups run on several threads."""
+        with self._bloom_lock:
+            self.bloom_stats[name] += count
 
     def clear_cache(self) -> None:
         """Clear all cached results."""
+        if self.writer is not None:
+            self.writer.flush()
         self.backend.clear()
+        if self.bloom is not None:
+            self.bloom.clear()
+        self.approximate_index.invalidate()
+        self.failures.clear()
+        if self.states is not None:
+            self.states.clear()
 
         # Also clear result store
         for file_path in self.result_store.storage_dir.glob("*"):
             if file_path.is_file():
                 file_path.unlink()
+        self.result_store.clear_chunks()
+        self.result_store.clear_dataset()
+        if self.cold_store is not None:
+            for file_path in self.cold_store.storage_dir.glob("*"):
+                if file_path.is_file():
+                    file_path.unlink()
+            self.cold_store.clear_chunks()
 
-    def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache usage statistics."""
-        cache_dir = Path(self.config.cache.directory)
+        self.stats.reset()
 
-        if not cache_dir.exists():
-            return {"total_entries": 0, "total_size_bytes": 0}
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache usage statistics.
 
-        total_entries = len(list(cache_dir.glob("*.cache")))
-        total_size = sum(f.stat().st_size for f in cache_dir.rglob("*") if f.is_file())
+        Served from incrementally maintained counters, so the cost does not
+        depend on the number of cached entries.
+        """
+        return {
+            **self.stats.snapshot(),
+            "cache_directory": str(self.config.cache.directory),
+            "gc": self.gc.get_stats(),
+            "bloom": self._bloom_stats(),
+            "writer": self.writer.get_stats() if self.writer is not None else None,
+            "dedup": self.result_store.dedup_stats(),
+            "failures": self.failures.get_stats(),
+            "warm_start": self.states.get_stats() if self.states is not None else None,
+            "tiers": self.tiers.get_stats() if self.tiers is not None else None,
+        }
 
+    def _bloom_stats(self) -> Optional[Dict[str, Any]]:
+        """Filter sizing plus observed false positives among absent keys."""
+        if self.bloom is None:
+            return None
+        with self._bloom_lock:
+            counters = dict(self.bloom_stats)
+        skipped = counters["skipped_lookups"]
+        false_positives = counters["false_positives"]
+        negatives = skipped + false_positives
         return {
-            "total_entries": total_entries,
-            "total_size_bytes": total_size,
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "cache_directory": str(cache_dir),
+            **self.bloom.get_stats(),
+            **counters,
+            "observed_fp_rate": round(false_positives / negatives, 6) if negatives else 0.0,
         }
@@ -0,0 +1,300 @@
+"""Approximate lookups: answer near-miss requests from neighboring results.
+
+Optimizers on continuous parameters rarely request a point that is cached
+exactly, but early iterations do not need an exact simulation when dense
+neighbors exist. ``ApproximateIndex`` keeps a k-d tree per model over the
+cached parameter points, each parameter scaled by its tolerance, so the
+neighbors of a request are the points inside the unit box around it.
+
+A lookup then either returns the nearest neighbor's result or blends the
+neighbors' waveforms and KPIs with inverse-distance weights. Either way the
+result's metadata is flagged ``approximate`` and carries the neighbors used
+and a per-KPI error estimate.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+APPROXIMATE_MODES = ("nearest", "interpolate")
+
+
+@dataclass
+class Neighbor:
+    """A cached result close to a requested parameter point."""
+
+    simulation_hash: str
+    parameters: Dict[str, Any]
+    kpis: Dict[str, float]
+    distance: float
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ApproximateIndex:
+    """Per-model k-d trees over tolerance-scaled parameter points.
+
+    Trees are built from the backend on first use and dropped by
+    ``invalidate`` whenever this process indexes or removes results; they
+    are also rebuilt after ``max_age`` seconds to pick up results written
+    by other processes.
+    """
+
+    def __init__(self, max_age: float = 30.0):
+        """Initialize an empty index.
+
+        Args:
+            max_age: Seconds after which a tree is rebuilt from the backend
+        """
+        self.max_age = max_age
+        self._trees: Dict[Tuple[Any, ...], Tuple[float, Any, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop every tree; they are rebuilt on the next lookup."""
+        with self._lock:
+            self._trees.clear()
+
+    def neighbors(
+        self,
+        backend: Any,
+        model_fingerprint: str,
+        parameters: Dict[str, Any],
+        tolerances: Dict[str, float],
+        k: int = 4,
+    ) -> List[Neighbor]:
+        """Find cached points within tolerance of ``parameters``.
+
+        Parameters with a positive tolerance may differ by up to that
+        tolerance; all other parameters must match exactly.
+
+        Args:
+            backend: ``SqliteCacheBackend`` holding the indexed parameters
+            model_fingerprint: Model content fingerprint to search
+            parameters: Requested parameter point
+            tolerances: Largest accepted absolute difference per parameter
+            k: Maximum number of neighbors returned
+
+        Returns:
+            Up to ``k`` neighbors, nearest first (Euclidean distance in
+            tolerance units)
+        """
+        dims = tuple(
+            sorted(
+                name
+                for name, value in parameters.items()
+                if _is_number(value) and tolerances.get(name, 0) > 0
+            )
+        )
+        if not dims:
+            return []
+        exact = {name: value for name, value in parameters.items() if name not in dims}
+        scale = np.array([float(tolerances[name]) for name in dims])
+
+        tree, entries = self._tree(backend, model_fingerprint, dims, scale, exact, parameters)
+        if tree is None:
+            return []
+
+        point = np.array([float(parameters[name]) for name in dims]) / scale
+        # A hair over 1 so points exactly at the tolerance are kept
+        inside = tree.query_ball_point(point, r=1.0 + 1e-9, p=np.inf)
+        if not inside:
+            return []
+        distances = np.linalg.norm(tree.data[inside] - point, axis=1)
+        order = np.argsort(distances, kind="stable")[:k]
+        return [
+            Neighbor(
+                simulation_hash=entries[inside[i]]["key"],
+                parameters=entries[inside[i]].get("parameters") or {},
+                kpis=entries[inside[i]].get("kpis") or {},
+                distance=float(distances[i]),
+            )
+            for i in order
+        ]
+
+    def _tree(
+        self,
+        backend: Any,
+        model_fingerprint: str,
+        dims: Tuple[str, ...],
+        scale: np.ndarray,
+        exact: Dict[str, Any],
+        parameters: Dict[str, Any],
+    ) -> Tuple[Optional[cKDTree], List[Dict[str, Any]]]:
+        """Return the (possibly cached) tree for one model and exact match set."""
+        key = (
+            model_fingerprint,
+            dims,
+            tuple(scale),
+            tuple(sorted((name, repr(value)) for name, value in exact.items())),
+        )
+        now = time.monotonic()
+        with self._lock:
+            cached = self._trees.get(key)
+        if cached is not None and now - cached[0] < self.max_age:
+            return cached[1], cached[2]
+
+        entries = [
+            entry
+            for entry in backend.query(
+                model_fingerprint=model_fingerprint,
+                parameter_values=exact,
+                order_by="key",
+            )
+            if self._comparable(entry.get("parameters") or {}, dims, exact, parameters)
+        ]
+        tree = None
+        if entries:
+            points = np.array(
+                [[float(entry["parameters"][name]) for name in dims] for entry in entries]
+            )
+            tree = cKDTree(points / scale)
+
+        with self._lock:
+            self._trees[key] = (now, tree, entries)
+        return tree, entries
+
+    @staticmethod
+    def _comparable(
+        stored: Dict[str, Any],
+        dims: Tuple[str, ...],
+        exact: Dict[str, Any],
+        parameters: Dict[str, Any],
+    ) -> bool:
+        """Whether a stored point has the same parameters as the request."""
+        if stored.keys() != parameters.keys():
+            return False
+        if not all(_is_number(stored[name]) for name in dims):
+            return False
+        return all(stored[name] == value for name, value in exact.items())
+
+
+def idw_weights(distances: Sequence[float], power: float = 2.0) -> np.ndarray:
+    """Inverse-distance weights; an exact match takes all the weight."""
+    distances = np.asarray(distances, dtype=np.float64)
+    exact = distances <= 1e-12
+    if exact.any():
+        weights = exact.astype(np.float64)
+    else:
+        weights = 1.0 / distances**power
+    return weights / weights.sum()
+
+
+def blend_kpis(
+    neighbors: Sequence[Neighbor], weights: np.ndarray
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Interpolate KPIs shared by all neighbors.
+
+    Returns:
+        ``(kpis, spread)``: the weighted mean of each KPI and the weighted
+        standard deviation of the neighbors around it
+    """
+    names = set.intersection(*(set(neighbor.kpis) for neighbor in neighbors))
+    kpis: Dict[str, float] = {}
+    spread: Dict[str, float] = {}
+    for name in sorted(names):
+        values = np.array([neighbor.kpis[name] for neighbor in neighbors], dtype=np.float64)
+        mean = float(np.dot(weights, values))
+        kpis[name] = mean
+        spread[name] = float(np.sqrt(np.dot(weights, (values - mean) ** 2)))
+    return kpis, spread
+
+
+def blend_waveforms(
+    frames: Sequence[pd.DataFrame], weights: np.ndarray, time_columns: Sequence[str]
+) -> pd.DataFrame:
+    """Interpolate waveforms onto the first frame's time axis.
+
+    Numeric signals present in every frame are resampled onto the time
+    axis of ``frames[0]`` (the nearest neighbor) and combined with
+    ``weights``; other columns are taken from ``frames[0]`` unchanged.
+    """
+    base = frames[0]
+    time_col = next((name for name in time_columns if name in base.columns), None)
+    if time_col is None and any(len(frame) != len(base) for frame in frames):
+        return base.copy()
+    times = base[time_col].to_numpy(dtype=np.float64) if time_col else None
+
+    blended = base.copy()
+    for name in base.columns:
+        if name == time_col or not all(
+            name in frame.columns and pd.api.types.is_numeric_dtype(frame[name])
+            for frame in frames
+        ):
+            continue
+        total = np.zeros(len(base), dtype=np.float64)
+        for weight, frame in zip(weights, frames):
+            values = frame[name].to_numpy(dtype=np.float64)
+            if times is not None:
+                values = np.interp(times, frame[time_col].to_numpy(dtype=np.float64), values)
+            total += weight * values
+        blended[name] = total
+    return blended
+
+
+def approximate_result(
+    neighbors: Sequence[Neighbor],
+    results: Sequence[Dict[str, Any]],
+    mode: str,
+    time_columns: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """Assemble an approximate result from loaded neighbor results.
+
+    Args:
+        neighbors: Neighbors, nearest first
+        results: Loaded result (``timeseries``/``metadata``) per neighbor
+        mode: ``nearest`` to return the nearest result, ``interpolate`` to
+            blend all neighbors
+        time_columns: Column names treated as time axes
+
+    Returns:
+        Result dict whose metadata has ``approximate: True`` and an
+        ``approximation`` record (mode, neighbors, distance, KPIs and a
+        per-KPI error estimate)
+    """
+    if mode not in APPROXIMATE_MODES:
+        raise ValueError(f"Unknown approximate mode: {mode}")
+
+    weights = idw_weights([neighbor.distance for neighbor in neighbors])
+    estimate, spread = blend_kpis(neighbors, weights)
+    if mode == "interpolate":
+        timeseries = blend_waveforms(
+            [result["timeseries"] for result in results], weights, time_columns
+        )
+        kpis, error = estimate, spread
+    else:
+        timeseries = results[0]["timeseries"]
+        kpis = {name: neighbors[0].kpis[name] for name in estimate}
+        # Disagreement with the interpolated estimate; unknown for one neighbor
+        error = (
+            {name: abs(kpis[name] - estimate[name]) for name in estimate}
+            if len(neighbors) > 1
+            else {}
+        )
+
+    used = weights if mode == "interpolate" else np.eye(len(neighbors))[0]
+    metadata = dict(results[0].get("metadata") or {})
+    metadata["approximate"] = True
+    metadata["approximation"] = {
+        "mode": mode,
+        "distance": neighbors[0].distance,
+        "neighbors": [
+            {
+                "simulation_hash": neighbor.simulation_hash,
+                "parameters": neighbor.parameters,
+                "distance": neighbor.distance,
+                "weight": float(weight),
+            }
+            for neighbor, weight in zip(neighbors, used)
+        ],
+        "kpis": kpis,
+        "error_estimate": error,
+    }
+    return {"timeseries": timeseries, "metadata": metadata}
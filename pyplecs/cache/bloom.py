@@ -0,0 +1,102 @@
+"""In-memory membership filter over stored simulation hashes.
+
+A Bloom filter answers "definitely not cached" without touching disk, so
+the misses that dominate a fresh parameter sweep cost a few bit lookups.
+Positive answers may be false and are confirmed against the backend.
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterable
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter keyed by hexadecimal digests.
+
+    Simulation hashes are already uniformly distributed, so the bit
+    positions are derived from the key itself by double hashing instead of
+    hashing it again. Removed keys cannot be cleared; their stale bits only
+    raise the false-positive rate, which ``estimated_fp_rate`` reports.
+    """
+
+    def __init__(self, capacity: int = 100_000, fp_rate: float = 0.01):
+        """Size the filter for ``capacity`` keys at the target ``fp_rate``.
+
+        Args:
+            capacity: Expected number of stored keys
+            fp_rate: Target false-positive probability at ``capacity`` keys
+        """
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("Bloom filter fp_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, int(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._bits_set = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, key: str) -> Iterable[int]:
+        """Yield the bit positions for ``key``."""
+        try:
+            h1 = int(key[:16], 16)
+            h2 = int(key[16:32], 16) | 1
+        except ValueError:
+            h1 = hash(key)
+            h2 = hash(key[::-1]) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Record ``key`` as possibly stored."""
+        with self._lock:
+            for pos in self._positions(key):
+                byte, mask = pos >> 3, 1 << (pos & 7)
+                if not self._bits[byte] & mask:
+                    self._bits[byte] |= mask
+                    self._bits_set += 1
+            self.count += 1
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Record every key in ``keys``."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Return False if ``key`` was definitely never added."""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
+            self._bits_set = 0
+            self.count = 0
+
+    @property
+    def is_saturated(self) -> bool:
+        """True once more keys were added than the filter was sized for."""
+        return self.count > self.capacity
+
+    @property
+    def estimated_fp_rate(self) -> float:
+        """Current false-positive probability, from the fraction of set bits."""
+        return (self._bits_set / self.num_bits) ** self.num_hashes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return sizing and fill statistics."""
+        return {
+            "capacity": self.capacity,
+            "keys_added": self.count,
+            "num_bits": self.num_bits,
+            "num_hashes": self.num_hashes,
+            "memory_bytes": len(self._bits),
+            "fill_ratio": round(self._bits_set / self.num_bits, 4),
+            "estimated_fp_rate": round(self.estimated_fp_rate, 6),
+        }
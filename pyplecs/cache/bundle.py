@@ -0,0 +1,162 @@
+"""Single-file cache bundles for moving results between machines.
+
+A cache directory holds several small files per result (waveforms,
+metadata, index entry), which copy slowly over network shares. A bundle
+packs a selection of results into one Arrow IPC file: one record batch per
+result, holding its index entry, metadata, waveforms (as a compressed
+Arrow IPC stream) and a SHA-256 checksum over all three. The IPC file
+footer indexes the batches, so a reader memory-maps the bundle and decodes
+only the results it needs; a manifest describing the export is kept in the
+schema metadata.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+import pyarrow as pa
+
+from .locking import atomic_write
+
+BUNDLE_FORMAT = "pyplecs-cache-bundle"
+BUNDLE_VERSION = 1
+MANIFEST_METADATA_KEY = b"pyplecs.bundle"
+
+BUNDLE_SCHEMA = pa.schema(
+    [
+        ("simulation_hash", pa.string()),
+        ("entry", pa.string()),
+        ("metadata", pa.string()),
+        ("timeseries", pa.large_binary()),
+        ("sha256", pa.string()),
+    ]
+)
+
+
+def checksum(entry: str, metadata: str, timeseries: bytes) -> str:
+    """SHA-256 over a bundled result's entry, metadata and waveforms."""
+    digest = hashlib.sha256()
+    for part in (entry.encode(), metadata.encode(), timeseries):
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def encode_timeseries(table: pa.Table) -> bytes:
+    """Serialize waveforms as a zstd-compressed Arrow IPC stream."""
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def decode_timeseries(data: bytes) -> pa.Table:
+    """Undo ``encode_timeseries``."""
+    return pa.ipc.open_stream(data).read_all()
+
+
+def write_bundle(
+    path: str,
+    results: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any], pa.Table]],
+    manifest: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Write results to a bundle file, replacing it atomically.
+
+    Args:
+        path: Bundle file to create
+        results: ``(simulation_hash, entry, metadata, timeseries)`` tuples
+        manifest: Extra manifest fields, e.g. the export selection
+
+    Returns:
+        Number of results and bytes written
+    """
+    header = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "created_at": time.time(),
+        **(manifest or {}),
+    }
+    schema = BUNDLE_SCHEMA.with_metadata({MANIFEST_METADATA_KEY: json.dumps(header)})
+
+    count = 0
+    path = Path(path)
+    with atomic_write(path) as tmp_path:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for simulation_hash, entry, metadata, table in results:
+                    entry_json = json.dumps(entry, sort_keys=True, default=str)
+                    metadata_json = json.dumps(metadata, sort_keys=True, default=str)
+                    payload = encode_timeseries(table)
+                    writer.write_batch(
+                        pa.record_batch(
+                            [
+                                pa.array([simulation_hash]),
+                                pa.array([entry_json]),
+                                pa.array([metadata_json]),
+                                pa.array([payload], type=pa.large_binary()),
+                                pa.array([checksum(entry_json, metadata_json, payload)]),
+                            ],
+                            schema=schema,
+                        )
+                    )
+                    count += 1
+    return {"results": count, "bytes": path.stat().st_size}
+
+
+def read_manifest(path: str) -> Dict[str, Any]:
+    """Return a bundle's manifest plus the hashes it contains."""
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        manifest = _manifest(reader.schema)
+        manifest["simulation_hashes"] = [
+            reader.get_batch(i).column(0)[0].as_py() for i in range(reader.num_record_batches)
+        ]
+    return manifest
+
+
+def _manifest(schema: pa.Schema) -> Dict[str, Any]:
+    raw = (schema.metadata or {}).get(MANIFEST_METADATA_KEY)
+    if raw is None:
+        raise ValueError("Not a pyplecs cache bundle")
+    manifest = json.loads(raw)
+    if manifest.get("format") != BUNDLE_FORMAT or manifest.get("version", 0) > BUNDLE_VERSION:
+        raise ValueError(
+            f"Unsupported cache bundle: {manifest.get('format')} v{manifest.get('version')}"
+        )
+    return manifest
+
+
+def iter_bundle(
+    path: str, skip: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """Yield ``(simulation_hash, result)`` for every result in a bundle.
+
+    Batches are read from the memory-mapped file one at a time; results
+    whose hash is in ``skip`` are not decoded. ``result`` is None for a
+    result that fails its checksum, else a dict with ``entry``,
+    ``metadata`` and ``timeseries`` (an Arrow table that may reference the
+    mapped file, so consume it before advancing the iterator).
+    """
+    skip = set(skip or ())
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        _manifest(reader.schema)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            simulation_hash = batch.column(0)[0].as_py()
+            if simulation_hash in skip:
+                continue
+            entry_json = batch.column(1)[0].as_py()
+            metadata_json = batch.column(2)[0].as_py()
+            payload = batch.column(3)[0].as_buffer()
+            if checksum(entry_json, metadata_json, payload) != batch.column(4)[0].as_py():
+                yield simulation_hash, None
+                continue
+            yield simulation_hash, {
+                "entry": json.loads(entry_json),
+                "metadata": json.loads(metadata_json),
+                "timeseries": decode_timeseries(payload),
+            }
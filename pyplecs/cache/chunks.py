@@ -0,0 +1,331 @@
+"""Content-defined chunking and a shared chunk pool for stored waveforms.
+
+Results of one sweep often share whole columns (signals the swept
+parameter does not affect) or long identical prefixes (the start-up
+transient). Compressing each result file on its own cannot see that.
+
+Columns are therefore cut into chunks at rows chosen from a rolling hash of
+the sample values themselves, so equal runs of samples produce equal chunks
+regardless of what precedes or follows them. Each distinct chunk is stored
+once in a content-addressed ``ChunkPool`` and reference counted by the
+results that use it.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from .locking import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Samples hashed by the rolling window that picks chunk boundaries
+_WINDOW = 16
+_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def chunk_boundaries(values: np.ndarray, avg_rows: int = 4096) -> List[int]:
+    """Choose content-defined chunk boundaries for a column.
+
+    A boundary follows every window of ``_WINDOW`` samples whose hash hits
+    a ``1 / avg_rows`` target, with chunks kept between a quarter and four
+    times ``avg_rows`` rows.
+
+    Returns:
+        End row of every chunk; the last one is ``len(values)``
+    """
+    n = len(values)
+    min_rows, max_rows = max(avg_rows // 4, 1), avg_rows * 4
+    if n <= min_rows:
+        return [n] if n else []
+
+    hashed = _as_words(values) * _MULTIPLIER
+    hashed ^= hashed >> np.uint64(29)
+    sums = np.cumsum(hashed, dtype=np.uint64)
+    rolling = sums[_WINDOW - 1 :].copy()
+    rolling[1:] -= sums[:-_WINDOW]
+
+    mask = np.uint64((1 << max(int(avg_rows).bit_length() - 1, 0)) - 1)
+    candidates = np.flatnonzero(((rolling >> np.uint64(32)) & mask) == 0) + _WINDOW
+
+    boundaries = []
+    last = 0
+    while n - last > min_rows:
+        i = int(np.searchsorted(candidates, last + min_rows))
+        cut = int(candidates[i]) if i < len(candidates) else n
+        cut = min(cut, last + max_rows)
+        if cut >= n:
+            break
+        boundaries.append(cut)
+        last = cut
+    boundaries.append(n)
+    return boundaries
+
+
+def _as_words(values: np.ndarray) -> np.ndarray:
+    """Reinterpret fixed-width samples as unsigned 64-bit words."""
+    values = np.ascontiguousarray(values)
+    return values.view(f"u{values.dtype.itemsize}").astype(np.uint64)
+
+
+def split_column(values: np.ndarray, avg_rows: int = 4096) -> List[Tuple[str, int, bytes]]:
+    """Cut a fixed-width column into content-defined chunks.
+
+    Float chunks are byte-stream-split (all first bytes, then all second
+    bytes, ...) so the pool's compressor sees the slowly varying exponent
+    bytes together.
+
+    Returns:
+        ``(digest, rows, data)`` for every chunk, in row order
+    """
+    chunks = []
+    start = 0
+    for end in chunk_boundaries(values, avg_rows):
+        data = encode_chunk(values[start:end])
+        chunks.append((hashlib.sha256(data).hexdigest(), end - start, data))
+        start = end
+    return chunks
+
+
+def encode_chunk(values: np.ndarray) -> bytes:
+    """Serialize one chunk of samples."""
+    values = np.ascontiguousarray(values)
+    if values.dtype.kind != "f":
+        return values.tobytes()
+    itemsize = values.dtype.itemsize
+    return values.view(np.uint8).reshape(-1, itemsize).T.tobytes()
+
+
+def decode_chunk(data: bytes, dtype: np.dtype) -> np.ndarray:
+    """Undo ``encode_chunk``."""
+    dtype = np.dtype(dtype)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if dtype.kind != "f":
+        return raw.view(dtype)
+    return raw.reshape(dtype.itemsize, -1).T.copy().view(dtype).ravel()
+
+
+class ChunkPool:
+    """Content-addressed, reference-counted chunk files.
+
+    Chunks live under ``<pool>/<digest[:2]>/<digest>``, compressed, with a
+    short header naming the codec and raw size so a chunk can be decoded
+    without the index. Reference counts are kept in ``<pool>/refs.sqlite``;
+    updates run in ``BEGIN IMMEDIATE`` transactions so processes sharing
+    the pool never drop a chunk another result is adding a reference to.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS chunks (
+            digest TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            stored_size INTEGER NOT NULL,
+            refs INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_chunks_refs ON chunks(refs);
+    """
+
+    def __init__(
+        self,
+        pool_dir: str,
+        compression: str = "zstd",
+        compression_level: Optional[int] = 3,
+    ):
+        """Initialize the pool.
+
+        Args:
+            pool_dir: Directory holding chunk files and the reference index
+            compression: Arrow buffer codec for new chunks (``none`` to store raw)
+            compression_level: Codec level, if the codec supports one
+        """
+        self.pool_dir = Path(pool_dir)
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        self.compression = compression.lower()
+        self._codec = self._make_codec(self.compression, compression_level)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.pool_dir / "refs.sqlite"),
+            check_same_thread=False,
+            timeout=30.0,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    @staticmethod
+    def _make_codec(name: str, level: Optional[int]) -> Optional[pa.Codec]:
+        if name in ("none", "uncompressed"):
+            return None
+        if level is not None and pa.Codec.supports_compression_level(name):
+            return pa.Codec(name, compression_level=level)
+        return pa.Codec(name)
+
+    def _path(self, digest: str) -> Path:
+        return self.pool_dir / digest[:2] / digest
+
+    def add(self, chunks: Iterable[Tuple[str, bytes]]) -> int:
+        """Take one reference on each chunk, storing those not pooled yet.
+
+        Args:
+            chunks: ``(digest, data)`` pairs; a digest listed twice takes
+                two references
+
+        Returns:
+            Bytes written to disk for new chunks
+        """
+        written = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for digest, data in chunks:
+                    row = self._conn.execute(
+                        "SELECT 1 FROM chunks WHERE digest = ?", (digest,)
+                    ).fetchone()
+                    if row is not None and self._path(digest).exists():
+                        self._conn.execute(
+                            "UPDATE chunks SET refs = refs + 1 WHERE digest = ?", (digest,)
+                        )
+                        continue
+                    stored_size = self._write(digest, data)
+                    self._conn.execute(
+                        "INSERT INTO chunks (digest, size, stored_size, refs) "
+                        "VALUES (?, ?, ?, 1) ON CONFLICT(digest) DO UPDATE SET "
+                        "refs = refs + 1, stored_size = excluded.stored_size",
+                        (digest, len(data), stored_size),
+                    )
+                    written += stored_size
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return written
+
+    def _write(self, digest: str, data: bytes) -> int:
+        """Compress and atomically write one chunk file."""
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        if self._codec is None:
+            codec, payload = "none", data
+        else:
+            codec, payload = self.compression, self._codec.compress(data, asbytes=True)
+        header = f"{codec} {len(data)}\n".encode()
+        with atomic_write(path) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(payload)
+        return len(header) + len(payload)
+
+    def get(self, digest: str) -> bytes:
+        """Read and decompress one chunk."""
+        with open(self._path(digest), "rb") as f:
+            header = f.readline().split()
+            payload = f.read()
+        codec, size = header[0].decode(), int(header[1])
+        if codec == "none":
+            return payload
+        return pa.Codec(codec).decompress(payload, decompressed_size=size, asbytes=True)
+
+    def release(self, digests: Iterable[str]) -> int:
+        """Drop one reference per digest and delete unreferenced chunks.
+
+        Returns:
+            Bytes freed on disk
+        """
+        freed = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "UPDATE chunks SET refs = refs - 1 WHERE digest = ?",
+                    [(digest,) for digest in digests],
+                )
+                orphans = self._conn.execute(
+                    "SELECT digest, stored_size FROM chunks WHERE refs <= 0"
+                ).fetchall()
+                self._conn.execute("DELETE FROM chunks WHERE refs <= 0")
+                for digest, stored_size in orphans:
+                    try:
+                        self._path(digest).unlink()
+                    except FileNotFoundError:
+                        continue
+                    freed += stored_size
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return freed
+
+    def sync(self, digests: Iterable[str]) -> None:
+        """Fsync the given chunk files and their directories."""
+        directories = set()
+        for digest in set(digests):
+            path = self._path(digest)
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            directories.add(path.parent)
+
+        if os.name == "posix":
+            for directory in directories:
+                fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+    def clear(self) -> None:
+        """Delete every chunk and reference."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for (digest,) in self._conn.execute("SELECT digest FROM chunks").fetchall():
+                    try:
+                        self._path(digest).unlink()
+                    except FileNotFoundError:
+                        pass
+                self._conn.execute("DELETE FROM chunks")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool size and deduplication ratios.
+
+        ``dedup_ratio`` is the raw size of all references over the raw size
+        of the distinct chunks; ``storage_ratio`` also accounts for
+        compression (referenced raw bytes over bytes on disk).
+        """
+        with self._lock:
+            chunks, refs, unique, stored, logical = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(refs), 0), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(stored_size), 0), COALESCE(SUM(size * refs), 0) FROM chunks"
+            ).fetchone()
+        return {
+            "chunks": chunks,
+            "references": refs,
+            "logical_bytes": logical,
+            "unique_bytes": unique,
+            "stored_bytes": stored,
+            "dedup_ratio": round(logical / unique, 3) if unique else 1.0,
+            "storage_ratio": round(logical / stored, 3) if stored else 1.0,
+        }
+
+    def close(self) -> None:
+        """Close the reference index."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,170 @@
+"""Column codecs for stored simulation waveforms.
+
+Switching-converter waveforms are piecewise-smooth doubles. Splitting the
+bytes of each float into separate streams (Parquet ``BYTE_STREAM_SPLIT``)
+groups the slowly changing sign/exponent bytes together, which a general
+purpose compressor like zstd then packs far better than raw float64.
+
+Two optional lossy encodings trade precision for size, each with the
+resulting error bound recorded in the file:
+
+- ``float32``: the column is stored in single precision
+- ``quantize``: the column is stored as integers ``round(x / (2 * e))``
+  for a declared absolute error ``e``, delta-encoded in Parquet
+
+The time column is never stored lossily, and neither is a quantized
+column holding NaN, infinite or integer-overflowing values, which have no
+integer representation.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+CODECS_METADATA_KEY = b"pyplecs.codecs"
+
+# Parquet codecs that accept a compression level
+_LEVELLED_CODECS = ("zstd", "gzip", "brotli")
+
+# Largest quantized magnitude stored; keeps the int64 cast exact
+_MAX_QUANTIZED = 2.0**62
+
+
+@dataclass
+class CodecSettings:
+    """Compression settings for one stored result."""
+
+    compression: str = "zstd"
+    compression_level: Optional[int] = 3
+    column_compression: Dict[str, str] = field(default_factory=dict)
+    float32_columns: List[str] = field(default_factory=list)
+    quantize_columns: Dict[str, float] = field(default_factory=dict)
+    protected_columns: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_config(cls, cache_config, protected_columns=()) -> "CodecSettings":
+        """Build settings from a ``CacheConfig``."""
+        return cls(
+            compression=cache_config.compression,
+            compression_level=cache_config.compression_level,
+            column_compression=dict(cache_config.column_compression or {}),
+            float32_columns=list(cache_config.float32_columns or []),
+            quantize_columns=dict(cache_config.quantize_columns or {}),
+            protected_columns=list(protected_columns),
+        )
+
+
+def encode_table(table: pa.Table, settings: CodecSettings) -> pa.Table:
+    """Apply the configured lossy encodings to ``table``.
+
+    Returns:
+        Table with float32/quantized columns and a ``pyplecs.codecs``
+        schema entry describing them (absent if nothing was encoded)
+    """
+    codecs: Dict[str, Dict[str, Any]] = {}
+
+    for name in table.column_names:
+        if name in settings.protected_columns:
+            if name in settings.quantize_columns or name in settings.float32_columns:
+                logger.warning(f"Column {name} is the time axis; storing it losslessly")
+            continue
+
+        column = table.column(name)
+        if not pa.types.is_floating(column.type):
+            continue
+
+        if name in settings.quantize_columns:
+            error = float(settings.quantize_columns[name])
+            if error <= 0:
+                raise ValueError(f"Quantization error bound for {name} must be positive")
+            step = 2.0 * error
+            scaled = column.to_numpy(zero_copy_only=False) / step
+            if not (np.isfinite(scaled).all() and np.all(np.abs(scaled) < _MAX_QUANTIZED)):
+                logger.warning(f"Column {name} has non-finite or out-of-range values; storing it losslessly")
+                continue
+            encoded = pa.array(np.round(scaled).astype(np.int64))
+            codecs[name] = {"codec": "quantize", "step": step, "max_error": error}
+        elif name in settings.float32_columns:
+            values = column.to_numpy(zero_copy_only=False)
+            single = values.astype(np.float32)
+            finite = np.isfinite(values)
+            if not np.array_equal(finite, np.isfinite(single)):
+                logger.warning(f"Column {name} overflows float32; storing it losslessly")
+                continue
+            # NaN and infinities round-trip exactly; measure the finite samples
+            max_error = float(np.max(np.abs(values[finite] - single[finite]))) if finite.any() else 0.0
+            encoded = pa.array(single)
+            codecs[name] = {"codec": "float32", "max_error": max_error}
+        else:
+            continue
+
+        table = table.set_column(table.schema.get_field_index(name), name, encoded)
+
+    if not codecs:
+        return table
+    metadata = dict(table.schema.metadata or {})
+    metadata[CODECS_METADATA_KEY] = json.dumps(codecs).encode()
+    return table.replace_schema_metadata(metadata)
+
+
+def decode_table(table: pa.Table) -> pa.Table:
+    """Undo ``encode_table``: lossy columns come back as float64."""
+    codecs = column_codecs(table.schema)
+    for name, spec in codecs.items():
+        index = table.schema.get_field_index(name)
+        if index < 0:
+            continue
+        column = table.column(index)
+        if spec["codec"] == "quantize":
+            decoded = pc.multiply(column.cast(pa.float64()), spec["step"])
+        else:
+            decoded = column.cast(pa.float64())
+        table = table.set_column(index, name, decoded)
+    return table
+
+
+def column_codecs(schema: pa.Schema) -> Dict[str, Dict[str, Any]]:
+    """Return the lossy encodings recorded in a stored schema."""
+    raw = (schema.metadata or {}).get(CODECS_METADATA_KEY)
+    return json.loads(raw) if raw else {}
+
+
+def parquet_options(table: pa.Table, settings: CodecSettings) -> Dict[str, Any]:
+    """Per-column ``pq.write_table`` options for an encoded table.
+
+    Float columns get ``BYTE_STREAM_SPLIT`` and quantized integer columns
+    ``DELTA_BINARY_PACKED``; other columns keep dictionary encoding.
+    """
+    quantized = set(column_codecs(table.schema))
+    compression = {}
+    compression_level = {}
+    column_encoding = {}
+    dictionary = []
+
+    for field_ in table.schema:
+        name = field_.name
+        codec = settings.column_compression.get(name, settings.compression).lower()
+        compression[name] = codec
+        if codec in _LEVELLED_CODECS and settings.compression_level is not None:
+            compression_level[name] = settings.compression_level
+
+        if pa.types.is_floating(field_.type):
+            column_encoding[name] = "BYTE_STREAM_SPLIT"
+        elif name in quantized and pa.types.is_integer(field_.type):
+            column_encoding[name] = "DELTA_BINARY_PACKED"
+        else:
+            dictionary.append(name)
+
+    return {
+        "compression": compression,
+        "compression_level": compression_level or None,
+        "column_encoding": column_encoding or None,
+        "use_dictionary": dictionary,
+    }
@@ -0,0 +1,451 @@
+"""Per-model, hive-partitioned Parquet dataset of sweep results.
+
+With ``cache.storage.layout: dataset`` results are not written as one
+Parquet file plus one metadata file each. Instead every model gets a
+directory ``model=<fingerprint>`` under ``<results>/dataset``:
+
+- New results are staged as ``staging/<hash>.parquet``; once
+  ``cache.storage.compact_threshold`` runs are staged they are compacted
+  into one large ``part-*.parquet`` file, one row-group set per run.
+- Every row carries ``simulation_hash`` and one ``param_<name>`` column per
+  simulation parameter, so a whole sweep can be filtered and analyzed with
+  a single scan (see ``SweepDataset.scan``).
+- ``_manifest.json`` maps each compacted run to its file and row groups,
+  along with its signal columns, parameters and metadata.
+
+Compaction and manifest updates take a per-model lease, so processes
+sharing the cache directory never rewrite the same model concurrently.
+"""
+
+import copy
+import json
+import math
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .locking import LeaseManager, atomic_write
+
+RUN_METADATA_KEY = b"pyplecs.run"
+HASH_COLUMN = "simulation_hash"
+PARAM_PREFIX = "param_"
+
+_MANIFEST = "_manifest.json"
+
+
+@dataclass
+class RunLocation:
+    """Where one stored run lives inside the dataset."""
+
+    path: Path
+    row_groups: List[int]
+    columns: List[str]
+    metadata: Dict[str, Any]
+
+
+class SweepDataset:
+    """Hive-partitioned Parquet store with one partition per model."""
+
+    def __init__(
+        self,
+        root: str,
+        row_group_size: int = 65536,
+        compact_threshold: int = 64,
+        compression: str = "zstd",
+        compression_level: Optional[int] = 3,
+        lock_timeout: float = 60.0,
+    ):
+        """Initialize the dataset.
+
+        Args:
+            root: Dataset directory holding the ``model=...`` partitions
+            row_group_size: Maximum rows per Parquet row group
+            compact_threshold: Staged runs of a model that trigger compaction
+            compression: Parquet codec
+            compression_level: Codec level, if the codec supports one
+            lock_timeout: Seconds to wait for another process's compaction
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+        self.compact_threshold = compact_threshold
+        self.lock_timeout = lock_timeout
+
+        self.compression = compression
+        self.compression_level = compression_level
+
+        self.leases = LeaseManager(str(self.root / ".locks"))
+        self._manifests: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _model_dir(self, fingerprint: str) -> Path:
+        return self.root / f"model={fingerprint}"
+
+    def _model_dirs(self) -> List[Path]:
+        return sorted(self.root.glob("model=*"))
+
+    @contextmanager
+    def _model_lease(self, fingerprint: str, blocking: bool = True) -> Iterator[bool]:
+        """Hold the model's compaction lease; yields False if not acquired."""
+        key = f"compact-{fingerprint}"
+        lease = self.leases.acquire(key)
+        while lease is None and blocking:
+            if not self.leases.wait(key, self.lock_timeout):
+                raise TimeoutError(f"Dataset partition {fingerprint} is locked")
+            lease = self.leases.acquire(key)
+        try:
+            yield lease is not None
+        finally:
+            if lease is not None:
+                lease.release()
+
+    def _manifest(self, model_dir: Path) -> Dict[str, Any]:
+        """Load a model's manifest, re-reading it only when it changed."""
+        path = model_dir / _MANIFEST
+        try:
+            signature = self._signature(path)
+        except FileNotFoundError:
+            return {"runs": {}, "parts": {}}
+        with self._lock:
+            cached = self._manifests.get(str(path))
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+        manifest = json.loads(path.read_text())
+        with self._lock:
+            self._manifests[str(path)] = (signature, manifest)
+        return manifest
+
+    @staticmethod
+    def _signature(path: Path):
+        # Every write replaces the file, so the inode changes even when the
+        # filesystem's mtime granularity does not
+        st = path.stat()
+        return st.st_mtime_ns, st.st_ino, st.st_size
+
+    def _write_manifest(self, model_dir: Path, manifest: Dict[str, Any]) -> None:
+        path = model_dir / _MANIFEST
+        with atomic_write(path) as tmp_path:
+            tmp_path.write_text(json.dumps(manifest))
+        with self._lock:
+            self._manifests[str(path)] = (self._signature(path), manifest)
+
+    def _write_options(self, schema: pa.Schema) -> Dict[str, Any]:
+        """``pq.write_table`` options for a run or part schema.
+
+        Floats are byte-stream-split; only the hash column repeats enough
+        for dictionary encoding.
+        """
+        options: Dict[str, Any] = {
+            "compression": self.compression,
+            "use_byte_stream_split": [
+                field_.name for field_ in schema if pa.types.is_floating(field_.type)
+            ],
+            "use_dictionary": [HASH_COLUMN],
+            "write_page_checksum": True,
+        }
+        level = self.compression_level
+        if level is not None and pa.Codec.supports_compression_level(self.compression):
+            options["compression_level"] = level
+        return options
+
+    @staticmethod
+    def _param_column(value: Any) -> pa.DataType:
+        return pa.float64() if isinstance(value, (bool, int, float)) else pa.string()
+
+    @classmethod
+    def _run_table(
+        cls, simulation_hash: str, parameters: Dict[str, Any], table: pa.Table
+    ) -> pa.Table:
+        """Append the hash and parameter columns to a run's signals."""
+        rows = table.num_rows
+        table = table.replace_schema_metadata(None)
+        table = table.append_column(HASH_COLUMN, pa.array([simulation_hash] * rows))
+        for name, value in sorted(parameters.items()):
+            dtype = cls._param_column(value)
+            if dtype == pa.string() and not isinstance(value, str):
+                value = json.dumps(value, sort_keys=True, default=str)
+            elif dtype == pa.float64():
+                value = float(value)
+            table = table.append_column(
+                f"{PARAM_PREFIX}{name}", pa.array([value] * rows, type=dtype)
+            )
+        return table
+
+    def write(
+        self,
+        simulation_hash: str,
+        fingerprint: str,
+        parameters: Dict[str, Any],
+        table: pa.Table,
+        metadata: Dict[str, Any],
+    ) -> int:
+        """Stage one run, compacting the model's partition when it is due.
+
+        Returns:
+            Bytes written for the staged file
+        """
+        staging = self._model_dir(fingerprint) / "staging"
+        staging.mkdir(parents=True, exist_ok=True)
+
+        run = {
+            "columns": table.column_names,
+            "parameters": parameters,
+            "metadata": metadata,
+        }
+        run_table = self._run_table(simulation_hash, parameters, table)
+        run_table = run_table.replace_schema_metadata(
+            {RUN_METADATA_KEY: json.dumps(run, default=str).encode()}
+        )
+
+        path = staging / f"{simulation_hash}.parquet"
+        with atomic_write(path) as tmp_path:
+            pq.write_table(
+                run_table,
+                tmp_path,
+                row_group_size=self.row_group_size,
+                **self._write_options(run_table.schema),
+            )
+        size = path.stat().st_size
+
+        if sum(1 for _ in staging.glob("*.parquet")) >= self.compact_threshold:
+            self.compact(fingerprint, blocking=False)
+        return size
+
+    def locate(self, simulation_hash: str) -> Optional[RunLocation]:
+        """Find a run in any model's staging area or manifest.
+
+        A staged run is newer than a compacted one with the same hash.
+        """
+        for model_dir in self._model_dirs():
+            staged = model_dir / "staging" / f"{simulation_hash}.parquet"
+            if staged.exists():
+                try:
+                    parquet_file = pq.ParquetFile(staged)
+                except FileNotFoundError:
+                    parquet_file = None
+                if parquet_file is not None:
+                    run = json.loads(parquet_file.schema_arrow.metadata[RUN_METADATA_KEY])
+                    return RunLocation(
+                        path=staged,
+                        row_groups=list(range(parquet_file.metadata.num_row_groups)),
+                        columns=run["columns"],
+                        metadata=run["metadata"],
+                    )
+
+            run = self._manifest(model_dir)["runs"].get(simulation_hash)
+            if run is not None:
+                return RunLocation(
+                    path=model_dir / run["file"],
+                    row_groups=run["row_groups"],
+                    columns=run["columns"],
+                    metadata=run["metadata"],
+                )
+        return None
+
+    def delete(self, simulation_hash: str) -> int:
+        """Remove a run from the dataset.
+
+        A compacted run is dropped from the manifest; its part file is
+        deleted once no live run remains in it and is otherwise rewritten
+        by the next compaction.
+
+        Returns:
+            Bytes freed (or, for compacted runs, bytes of its row groups)
+        """
+        freed = 0
+        for model_dir in self._model_dirs():
+            staged = model_dir / "staging" / f"{simulation_hash}.parquet"
+            try:
+                freed += staged.stat().st_size
+                staged.unlink()
+            except FileNotFoundError:
+                pass
+
+            if simulation_hash not in self._manifest(model_dir)["runs"]:
+                continue
+            fingerprint = model_dir.name.split("=", 1)[1]
+            with self._model_lease(fingerprint):
+                manifest = copy.deepcopy(self._manifest(model_dir))
+                run = manifest["runs"].pop(simulation_hash, None)
+                if run is None:
+                    continue
+                freed += run.get("bytes", 0)
+                part = manifest["parts"][run["file"]]
+                part["dead"] = part.get("dead", 0) + 1
+                if part["dead"] >= part["runs"]:
+                    del manifest["parts"][run["file"]]
+                self._write_manifest(model_dir, manifest)
+                if run["file"] not in manifest["parts"]:
+                    try:
+                        (model_dir / run["file"]).unlink()
+                    except FileNotFoundError:
+                        pass
+        return freed
+
+    def compact(self, fingerprint: str, blocking: bool = True) -> int:
+        """Merge a model's staged runs into one part file.
+
+        Parts that have lost at least half of their runs to deletion are
+        rewritten into the same new part.
+
+        Args:
+            fingerprint: Model fingerprint of the partition
+            blocking: Wait for a compaction running in another process
+                instead of skipping
+
+        Returns:
+            Number of runs written to the new part
+        """
+        model_dir = self._model_dir(fingerprint)
+        with self._model_lease(fingerprint, blocking) as acquired:
+            if not acquired:
+                return 0
+
+            manifest = copy.deepcopy(self._manifest(model_dir))
+            staged = sorted((model_dir / "staging").glob("*.parquet"))
+            sparse = [
+                name
+                for name, part in manifest["parts"].items()
+                if part.get("dead", 0) * 2 >= part["runs"]
+            ]
+            if not staged and not sparse:
+                return 0
+
+            runs = []  # (hash, run entry, table)
+            for path in staged:
+                table = pq.read_table(path)
+                run = json.loads(table.schema.metadata[RUN_METADATA_KEY])
+                runs.append((path.stem, run, table.replace_schema_metadata(None)))
+            for name in sparse:
+                parquet_file = pq.ParquetFile(model_dir / name)
+                for simulation_hash, run in manifest["runs"].items():
+                    if run["file"] == name:
+                        table = parquet_file.read_row_groups(run["row_groups"])
+                        runs.append((simulation_hash, run, table.replace_schema_metadata(None)))
+
+            part_name = f"part-{uuid.uuid4().hex[:16]}.parquet"
+            self._write_part(model_dir / part_name, runs)
+
+            row_groups = pq.ParquetFile(model_dir / part_name).metadata
+            group = 0
+            for simulation_hash, run, table in runs:
+                count = math.ceil(table.num_rows / self.row_group_size)
+                indices = list(range(group, group + count))
+                group += count
+                replaced = manifest["runs"].get(simulation_hash)
+                if replaced is not None and replaced["file"] in manifest["parts"]:
+                    part = manifest["parts"][replaced["file"]]
+                    part["dead"] = part.get("dead", 0) + 1
+                manifest["runs"][simulation_hash] = {
+                    "file": part_name,
+                    "row_groups": indices,
+                    "rows": table.num_rows,
+                    "bytes": sum(row_groups.row_group(i).total_byte_size for i in indices),
+                    "columns": run["columns"],
+                    "parameters": run["parameters"],
+                    "metadata": run["metadata"],
+                }
+            for name in sparse:
+                del manifest["parts"][name]
+            manifest["parts"][part_name] = {"runs": len(runs), "dead": 0}
+            self._write_manifest(model_dir, manifest)
+
+            for path in staged:
+                path.unlink()
+            for name in sparse:
+                try:
+                    (model_dir / name).unlink()
+                except FileNotFoundError:
+                    pass
+            return len(runs)
+
+    def _write_part(self, path: Path, runs: List[Any]) -> None:
+        """Write runs into one Parquet file, each as its own row groups."""
+        schema = pa.unify_schemas([table.schema for _, _, table in runs])
+        with atomic_write(path) as tmp_path:
+            with pq.ParquetWriter(tmp_path, schema, **self._write_options(schema)) as writer:
+                for _, _, table in runs:
+                    for field_ in schema:
+                        if field_.name not in table.column_names:
+                            table = table.append_column(
+                                field_, pa.nulls(table.num_rows, field_.type)
+                            )
+                    table = table.select(schema.names).cast(schema)
+                    if table.num_rows:
+                        writer.write_table(table, row_group_size=self.row_group_size)
+
+    def files(self, fingerprint: Optional[str] = None) -> List[Path]:
+        """Data files (parts and staged runs) of one or every model."""
+        model_dirs = (
+            [self._model_dir(fingerprint)] if fingerprint is not None else self._model_dirs()
+        )
+        files = []
+        for model_dir in model_dirs:
+            files.extend(model_dir / name for name in self._manifest(model_dir)["parts"])
+            files.extend(sorted((model_dir / "staging").glob("*.parquet")))
+        return files
+
+    def scan(
+        self,
+        fingerprint: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        filter: Optional[ds.Expression] = None,
+    ) -> pa.Table:
+        """Read a whole sweep (or every model) in one dataset scan.
+
+        Args:
+            fingerprint: Model fingerprint to restrict the scan to
+            columns: Columns to read, including ``simulation_hash``,
+                ``param_<name>`` and the ``model`` partition column
+            filter: ``pyarrow.dataset`` filter expression, e.g.
+                ``ds.field("param_Vi") > 10``
+
+        Returns:
+            Arrow table with one row per sample of every matching run
+        """
+        files = [path for path in self.files(fingerprint) if path.exists()]
+        if not files:
+            return pa.table({})
+        partitioning = ds.partitioning(pa.schema([("model", pa.string())]), flavor="hive")
+        schema = pa.unify_schemas(
+            [pq.read_schema(path).remove_metadata() for path in files]
+            + [pa.schema([("model", pa.string())])]
+        )
+        dataset = ds.dataset(
+            [str(path) for path in files],
+            schema=schema,
+            format="parquet",
+            partitioning=partitioning,
+            partition_base_dir=str(self.root),
+        )
+        return dataset.to_table(columns=columns, filter=filter)
+
+    def sync(self, simulation_hashes: List[str]) -> None:
+        """Fsync the staged files of the given runs and their directories."""
+        directories = set()
+        for simulation_hash in simulation_hashes:
+            location = self.locate(simulation_hash)
+            if location is None:
+                continue
+            fd = os.open(location.path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            directories.add(location.path.parent)
+
+        if os.name == "posix":
+            for directory in directories:
+                fd = os.open(directory, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
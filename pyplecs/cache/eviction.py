@@ -0,0 +1,152 @@
+"""Background garbage collection for the simulation cache.
+
+The collector enforces ``cache.ttl`` and ``cache.max_size_mb`` in small
+steps on a daemon thread. Each step asks the cache backend for at most
+``batch_size`` expired keys or eviction candidates, so a large cache is
+never scanned in one stop-the-world pass.
+
+The size budget is checked against the backend's own totals where it can
+aggregate them (``SUM(size_bytes)`` in SQLite), so entries written by other
+processes sharing the directory count as soon as they are indexed.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+EVICTION_POLICIES = ("lru", "cost")
+
+
+class CacheGarbageCollector:
+    """Incremental TTL and size-bound enforcement for a ``SimulationCache``.
+
+    Eviction policies:
+    - ``lru``: evict the least recently accessed entries first
+    - ``cost``: like LRU, but every second an entry took to simulate counts
+      as ``cost_weight`` seconds of extra recency, so expensive results
+      are kept longer than cheap ones
+    """
+
+    def __init__(
+        self,
+        cache,
+        max_size_bytes: Optional[int] = None,
+        policy: str = "lru",
+        interval: float = 30.0,
+        batch_size: int = 500,
+        cost_weight: float = 3600.0,
+        low_watermark: float = 0.9,
+    ):
+        """Initialize the collector.
+
+        Args:
+            cache: SimulationCache whose backend and result store are collected
+            max_size_bytes: Disk budget for cached results (None = unbounded)
+            policy: Eviction policy, one of ``EVICTION_POLICIES``
+            interval: Seconds between collection steps
+            batch_size: Maximum keys examined per step
+            cost_weight: Seconds of recency credited per simulated second
+                (``cost`` policy only)
+            low_watermark: Fraction of ``max_size_bytes`` to evict down to
+                once the budget is exceeded
+        """
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unsupported eviction policy: {policy}")
+
+        self.cache = cache
+        self.max_size_bytes = max_size_bytes
+        self.policy = policy
+        self.interval = interval
+        self.batch_size = batch_size
+        self.cost_weight = cost_weight
+        self.low_watermark = low_watermark
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            "runs": 0,
+            "expired": 0,
+            "evicted": 0,
+            "bytes_freed": 0,
+        }
+
+    def start(self) -> None:
+        """Start the background collection thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pyplecs-cache-gc", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread and wait for the current step."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Thread body: run collection steps until stopped."""
+        while not self._stop_event.is_set():
+            try:
+                self.step()
+                self.cache.stats.flush()
+            except Exception as e:
+                logger.error(f"Cache GC step failed: {e}")
+            self._stop_event.wait(self.interval)
+
+    def step(self) -> Dict[str, int]:
+        """Run one bounded collection step.
+
+        Returns:
+            Dict with the number of ``expired`` and ``evicted`` entries
+        """
+        backend = self.cache.backend
+        stats = self.cache.stats
+        expired = 0
+        evicted = 0
+
+        for key in backend.expired_keys(time.time(), self.batch_size):
+            self.stats["bytes_freed"] += self.cache.evict(key, reason="expiration")
+            expired += 1
+
+        totals = backend.size_totals() if self.max_size_bytes else None
+        total_bytes = totals[1] if totals is not None else stats.total_bytes
+        if self.max_size_bytes and total_bytes > self.max_size_bytes:
+            target = self.max_size_bytes * self.low_watermark
+            candidates = backend.eviction_candidates(
+                self.policy, self.batch_size, self.cost_weight
+            )
+            for key in candidates:
+                if total_bytes <= target:
+                    break
+                entry = backend.peek(key) or {}
+                freed = self.cache.evict(key)
+                self.stats["bytes_freed"] += freed
+                total_bytes -= int(entry.get("size_bytes") or freed)
+                evicted += 1
+
+        self.stats["runs"] += 1
+        self.stats["expired"] += expired
+        self.stats["evicted"] += evicted
+
+        if expired or evicted:
+            logger.info(f"Cache GC expired {expired} and evicted {evicted} entries")
+
+        return {"expired": expired, "evicted": evicted}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return collector counters and configuration."""
+        return {
+            **self.stats,
+            "policy": self.policy,
+            "max_size_bytes": self.max_size_bytes,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
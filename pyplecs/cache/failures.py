@@ -0,0 +1,220 @@
+"""Negative cache for deterministic simulation failures.
+
+Some parameter sets make the PLECS solver fail every time (a singular
+system matrix, a step size driven below its minimum). Retrying them only
+burns ``orchestration.retry_attempts`` runs, and the next sweep over the
+same point burns them again. Failure messages are therefore classified:
+a message matching a deterministic failure class is recorded under the
+simulation hash for that class's TTL and served on resubmission, while
+anything unrecognized is treated as transient and retried as before.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from .locking import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FailureClass:
+    """A family of deterministic failures recognized by their message."""
+
+    name: str
+    patterns: List[str] = field(default_factory=list)
+    ttl: float = 86400.0
+
+    def __post_init__(self):
+        self._regex = re.compile("|".join(f"(?:{p})" for p in self.patterns), re.IGNORECASE)
+
+    def matches(self, message: str) -> bool:
+        """Whether ``message`` reports a failure of this class."""
+        return bool(self.patterns) and self._regex.search(message) is not None
+
+
+# Solver and model errors that recur for the same model and parameters
+DEFAULT_FAILURE_CLASSES = {
+    "singular_matrix": FailureClass(
+        "singular_matrix",
+        [r"singular", r"ill[- ]conditioned", r"not invertible"],
+        ttl=7 * 86400.0,
+    ),
+    "step_size": FailureClass(
+        "step_size",
+        [
+            r"step[- ]size (?:underflow|too small)",
+            r"minimum step[- ]size",
+            r"could not (?:reduce|meet) .*tolerance",
+        ],
+        ttl=86400.0,
+    ),
+    "algebraic_loop": FailureClass(
+        "algebraic_loop", [r"algebraic loop"], ttl=7 * 86400.0
+    ),
+    "model_error": FailureClass(
+        "model_error",
+        [r"undefined (?:variable|function|symbol)", r"error (?:evaluating|in) initialization"],
+        ttl=3600.0,
+    ),
+}
+
+
+def failure_classes(overrides: Optional[Dict[str, Any]] = None) -> List[FailureClass]:
+    """Default failure classes updated from ``cache.failures.classes``.
+
+    Args:
+        overrides: ``{name: {"patterns": [...], "ttl": seconds}}``; a known
+            name updates that class, a new name adds one, and a TTL of 0
+            disables the class
+
+    Returns:
+        Enabled failure classes, in matching order
+    """
+    classes = dict(DEFAULT_FAILURE_CLASSES)
+    for name, options in (overrides or {}).items():
+        base = classes.get(name, FailureClass(name))
+        classes[name] = FailureClass(
+            name,
+            list(options.get("patterns", base.patterns)),
+            float(options.get("ttl", base.ttl)),
+        )
+    return [failure for failure in classes.values() if failure.ttl > 0]
+
+
+def classify_failure(
+    message: Optional[str], classes: List[FailureClass]
+) -> Optional[FailureClass]:
+    """Return the deterministic class of a failure, or None if transient."""
+    if not message:
+        return None
+    return next((failure for failure in classes if failure.matches(message)), None)
+
+
+class FailureStore:
+    """Recorded deterministic failures, one JSON file per simulation hash.
+
+    The hashes with a record are also kept in memory, so a lookup for a
+    hash that never failed touches no file. The set is relisted from the
+    directory when its mtime shows another process added or removed a
+    record.
+    """
+
+    def __init__(self, failures_dir: str):
+        """Initialize the store.
+
+        Args:
+            failures_dir: Directory holding ``<hash>.json`` records
+        """
+        self.failures_dir = Path(failures_dir)
+        self.failures_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.counters = {"recorded": 0, "hits": 0}
+        self._known: Set[str] = set()
+        self._token: Optional[int] = None
+        self._rescan()
+
+    def _path(self, simulation_hash: str) -> Path:
+        return self.failures_dir / f"{simulation_hash}.json"
+
+    def _dir_token(self) -> Optional[int]:
+        """The directory's mtime, which moves whenever a record is added or removed."""
+        try:
+            return self.failures_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _rescan(self) -> None:
+        """Relist the hashes that have a record."""
+        # Read the token first: a record written during the listing moves it again
+        token = self._dir_token()
+        known = {path.stem for path in self.failures_dir.glob("*.json")}
+        with self._lock:
+            self._known, self._token = known, token
+
+    def _may_have(self, simulation_hash: str) -> bool:
+        """Whether a record may exist for a hash; False is definite."""
+        token = self._dir_token()
+        if token is None or token != self._token:
+            self._rescan()
+        with self._lock:
+            return simulation_hash in self._known
+
+    def record(
+        self,
+        simulation_hash: str,
+        error: str,
+        failure_class: FailureClass,
+        model_file: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Store a failure for its class's TTL and return the record."""
+        now = time.time()
+        record = {
+            "simulation_hash": simulation_hash,
+            "error": error,
+            "failure_class": failure_class.name,
+            "model_file": model_file,
+            "parameters": parameters or {},
+            "created_at": now,
+            "expires_at": now + failure_class.ttl,
+        }
+        with atomic_write(self._path(simulation_hash)) as tmp_path:
+            tmp_path.write_text(json.dumps(record, default=str))
+        with self._lock:
+            self._known.add(simulation_hash)
+            self.counters["recorded"] += 1
+        return record
+
+    def get(self, simulation_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the unexpired failure recorded for a hash, if any."""
+        if not self._may_have(simulation_hash):
+            return None
+        path = self._path(simulation_hash)
+        try:
+            record = json.loads(path.read_text())
+        except FileNotFoundError:
+            with self._lock:
+                self._known.discard(simulation_hash)
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable failure record {path.name}: {e}")
+            self.delete(simulation_hash)
+            return None
+
+        if record.get("expires_at", 0) < time.time():
+            self.delete(simulation_hash)
+            return None
+        with self._lock:
+            self.counters["hits"] += 1
+        return record
+
+    def delete(self, simulation_hash: str) -> bool:
+        """Forget the failure recorded for a hash."""
+        with self._lock:
+            self._known.discard(simulation_hash)
+        try:
+            self._path(simulation_hash).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def clear(self) -> None:
+        """Forget every recorded failure."""
+        for path in self.failures_dir.glob("*.json"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._rescan()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return failures recorded and served by this process."""
+        with self._lock:
+            return dict(self.counters)
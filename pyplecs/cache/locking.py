@@ -0,0 +1,189 @@
+"""Cross-process coordination for a shared cache directory.
+
+Several orchestrator processes may use the same ``cache.directory``. Two
+mechanisms keep them consistent:
+
+- ``atomic_write`` writes every cache file to a temporary name and renames
+  it into place, so readers never see a partially written file.
+- ``file_lock`` serializes read-modify-write updates of shared files such
+  as ``stats.json``.
+- ``LeaseManager`` hands out advisory, per-simulation-hash file locks. The
+  process holding a lease is simulating that hash; others wait for it to
+  finish and then read the result from the cache instead of re-simulating.
+  Locks are released by the OS if the holder dies.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[Path]:
+    """Yield a temporary path that replaces ``path`` on success.
+
+    The temporary file lives in the same directory so the final
+    ``os.replace`` is atomic; it is removed if the write fails.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive non-blocking lock on ``fd``."""
+    try:
+        if os.name == "nt":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(fd: int) -> None:
+    """Release the lock taken by ``_try_lock``."""
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` for the block.
+
+    Blocks until the lock is free. The lock file is kept afterwards, so
+    every holder locks the same inode.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        delay = 0.001
+        while not _try_lock(fd):
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+class Lease:
+    """An exclusive lease on one simulation hash."""
+
+    def __init__(self, key: str, path: Path, fd: int):
+        self.key = key
+        self.path = path
+        self._fd: Optional[int] = fd
+
+    @property
+    def held(self) -> bool:
+        """True until the lease is released."""
+        return self._fd is not None
+
+    def release(self) -> None:
+        """Release the lease; safe to call more than once."""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            # Unlink while still locked so a waiter that already opened the
+            # file notices the inode changed and retries on a fresh one.
+            # Windows cannot delete an open file; the lock file is kept.
+            if os.name != "nt":
+                try:
+                    self.path.unlink()
+                except OSError:
+                    pass
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+
+class LeaseManager:
+    """Per-hash advisory lock files under ``<cache>/locks``."""
+
+    def __init__(self, lock_dir: str):
+        self.lock_dir = Path(lock_dir)
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.lock_dir / f"{key}.lock"
+
+    def acquire(self, key: str) -> Optional[Lease]:
+        """Try to take the lease for ``key`` without blocking.
+
+        Returns:
+            The lease, or None if another holder has it
+        """
+        path = self._path(key)
+        while True:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            if not _try_lock(fd):
+                os.close(fd)
+                return None
+
+            # The previous holder may have unlinked the file between our
+            # open and lock; only a lock on the current inode counts
+            if os.name == "nt" or self._same_file(fd, path):
+                return Lease(key, path, fd)
+            os.close(fd)
+
+    @staticmethod
+    def _same_file(fd: int, path: Path) -> bool:
+        try:
+            return os.fstat(fd).st_ino == os.stat(path).st_ino
+        except FileNotFoundError:
+            return False
+
+    def is_held(self, key: str) -> bool:
+        """True if some process currently holds the lease for ``key``."""
+        lease = self.acquire(key)
+        if lease is None:
+            return True
+        lease.release()
+        return False
+
+    def wait(self, key: str, timeout: Optional[float] = None) -> bool:
+        """Block until nobody holds the lease for ``key``.
+
+        Args:
+            key: Simulation hash
+            timeout: Maximum seconds to wait (None = forever)
+
+        Returns:
+            True if the lease was released, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.05
+        while self.is_held(key):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        return True
@@ -0,0 +1,406 @@
+"""Offline maintenance of a cache directory.
+
+These operations back the ``pyplecs-cache`` command. They walk every
+entry, so they are meant for idle caches (between campaigns, from a
+scheduled job) rather than for the serving path:
+
+- ``verify``: check that every indexed result is readable and matches its
+  checksums, and find result files no entry refers to
+- ``collect_garbage``: drop expired and over-budget entries and orphans
+- ``compact``: rewrite results into the configured format and codecs
+- ``rekey``: move results to the hashes the current hasher computes
+- ``disk_usage``: bytes used per cache subdirectory or per model
+
+With ``cache.tiers`` enabled every operation covers the cold tier too;
+results stay in the tier they are in.
+
+Per-result work runs on a thread pool with one worker per core by
+default; Parquet, Arrow and zstd release the GIL while decoding.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _parallel(func: Callable[[str], T], keys: Iterable[str], workers: Optional[int]) -> List[T]:
+    """Map ``func`` over ``keys`` on a pool of ``workers`` threads."""
+    keys = list(keys)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(keys) <= 1:
+        return [func(key) for key in keys]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pyplecs-cache-maint") as pool:
+        return list(pool.map(func, keys))
+
+
+def _remaining_ttl(expires_at: Optional[float], now: float) -> Optional[int]:
+    """TTL that keeps an entry's expiry when it is indexed again."""
+    if not expires_at:
+        return None
+    return max(1, int(expires_at - now))
+
+
+def _stores(cache: Any) -> List[Any]:
+    """The cache's result stores, hot tier first."""
+    return [store for store in (cache.result_store, cache.cold_store) if store is not None]
+
+
+def orphan_files(cache: Any) -> List[Path]:
+    """Result files in the results directories that no entry refers to."""
+    keys = set(cache.backend.iter_keys())
+    orphans = []
+    for store in _stores(cache):
+        with os.scandir(store.storage_dir) as it:
+            for dir_entry in it:
+                if not dir_entry.is_file():
+                    continue
+                for suffix in store._RESULT_SUFFIXES:
+                    if dir_entry.name.endswith(suffix):
+                        if dir_entry.name[: -len(suffix)] not in keys:
+                            orphans.append(Path(dir_entry.path))
+                        break
+    return orphans
+
+
+def _content_matches(model_file: str, fingerprint: Optional[str]) -> bool:
+    """Whether a model file still has the content it was fingerprinted with.
+
+    The fingerprint may come from a previous ``cache.hash_algorithm``, so
+    every guaranteed algorithm with the same digest length is tried.
+    """
+    if not fingerprint or not os.path.isfile(model_file):
+        return False
+    with open(model_file, "rb") as f:
+        content = f.read()
+    for algorithm in sorted(hashlib.algorithms_guaranteed):
+        if algorithm.startswith("shake_"):
+            continue
+        hasher = hashlib.new(algorithm)
+        if hasher.digest_size * 2 == len(fingerprint):
+            hasher.update(content)
+            if hasher.hexdigest() == fingerprint:
+                return True
+    return False
+
+
+def _remove_files(paths: Iterable[Path]) -> int:
+    """Delete files and return the bytes freed."""
+    freed = 0
+    for path in paths:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except (FileNotFoundError, PermissionError):
+            continue
+        freed += size
+    return freed
+
+
+def verify(cache: Any, repair: bool = False, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Check every indexed result for readability and checksum errors.
+
+    Each result is classified as ``ok``, ``missing`` (no stored files),
+    ``stale`` (stored only in a format other than the configured one;
+    ``compact`` converts it) or ``corrupt`` (a checksum mismatch or a
+    read error).
+
+    Args:
+        cache: ``SimulationCache`` to check
+        repair: Evict missing and corrupt entries and delete orphan files
+        workers: Threads checking results in parallel (None = one per core)
+
+    Returns:
+        Counts per status, orphan files, the problems found and, with
+        ``repair``, the number of entries and files removed
+    """
+    if cache.writer is not None:
+        cache.writer.flush()
+
+    def check(key: str) -> Dict[str, Any]:
+        store = cache.store_for(key)
+        problems = store.verify_results(key)
+        if problems:
+            return {"simulation_hash": key, "status": "corrupt", "errors": problems}
+        if store.load_results(key) is not None:
+            return {"simulation_hash": key, "status": "ok"}
+        metadata_format = store.stored_metadata_format(key)
+        for ts_format in store.stored_formats(key):
+            result = store.load_results(
+                key, timeseries_format=ts_format, metadata_format=metadata_format
+            )
+            if result is not None:
+                return {"simulation_hash": key, "status": "stale", "format": ts_format}
+        if store.stored_formats(key):
+            return {"simulation_hash": key, "status": "corrupt", "errors": ["unreadable"]}
+        return {"simulation_hash": key, "status": "missing"}
+
+    results = _parallel(check, cache.backend.iter_keys(), workers)
+    orphans = orphan_files(cache)
+
+    report: Dict[str, Any] = {"checked": len(results), "ok": 0, "stale": 0, "missing": 0, "corrupt": 0}
+    for result in results:
+        report[result["status"]] += 1
+    report["orphan_files"] = [path.name for path in orphans]
+    report["problems"] = [result for result in results if result["status"] != "ok"]
+
+    if repair:
+        evicted = 0
+        for result in report["problems"]:
+            if result["status"] in ("missing", "corrupt"):
+                cache.evict(result["simulation_hash"])
+                evicted += 1
+        report["repaired"] = {"evicted": evicted, "orphan_bytes_freed": _remove_files(orphans)}
+        if evicted:
+            logger.info(f"Cache verify evicted {evicted} damaged entries")
+    return report
+
+
+def collect_garbage(cache: Any, max_steps: int = 10000) -> Dict[str, int]:
+    """Run collection steps until nothing expires or exceeds the size budget.
+
+    Orphan result files are deleted as well.
+
+    Returns:
+        Entries ``expired`` and ``evicted``, ``orphan_files`` removed and
+        ``bytes_freed`` in total
+    """
+    if cache.writer is not None:
+        cache.writer.flush()
+    before = cache.gc.stats["bytes_freed"]
+    totals = {"expired": 0, "evicted": 0}
+    for _ in range(max_steps):
+        step = cache.gc.step()
+        totals["expired"] += step["expired"]
+        totals["evicted"] += step["evicted"]
+        if not (step["expired"] or step["evicted"]):
+            break
+
+    orphans = orphan_files(cache)
+    orphan_bytes = _remove_files(orphans)
+    cache.stats.flush()
+    return {
+        **totals,
+        "orphan_files": len(orphans),
+        "bytes_freed": cache.gc.stats["bytes_freed"] - before + orphan_bytes,
+    }
+
+
+def compact(cache: Any, workers: Optional[int] = None) -> Dict[str, int]:
+    """Rewrite every result into the configured layout, format and codecs.
+
+    Results are loaded from whatever format they are stored in, written
+    anew and only then are files in other formats removed, so an
+    interrupted compaction leaves every result readable. Entries are
+    re-indexed with their new size and their remaining TTL. In the
+    ``dataset`` layout each model's staged runs are merged afterwards.
+
+    Args:
+        cache: ``SimulationCache`` to compact
+        workers: Threads rewriting results in parallel (None = one per core)
+
+    Returns:
+        Results ``rewritten`` and ``failed`` (unreadable), and the total
+        ``bytes_before`` and ``bytes_after``
+    """
+    if cache.writer is not None:
+        cache.writer.flush()
+    dataset_layout = cache.config.cache.storage_layout == "dataset"
+    entries = {entry["key"]: entry for entry in cache.backend.iter_entries()}
+
+    def keep_suffixes(store: Any) -> List[str]:
+        settings = store.settings
+        if settings.storage_layout == "dataset":
+            # Metadata lives in the dataset manifest as well
+            return ["dataset"]
+        return [
+            store._TIMESERIES_SUFFIXES[settings.timeseries_format.lower()],
+            store._METADATA_SUFFIXES[settings.metadata_format.lower()],
+        ]
+
+    def rewrite(key: str) -> Optional[Dict[str, Any]]:
+        value = cache.backend.peek(key)
+        if value is None:
+            return None
+        store = cache.store_for(key)
+        formats = store.stored_formats(key)
+        if store is cache.result_store and dataset_layout and not formats:
+            # Already in the dataset; merged by the per-model compaction
+            return None
+        result = store.load_results(key)
+        if result is None and formats:
+            result = store.load_results(
+                key,
+                timeseries_format=formats[0],
+                metadata_format=store.stored_metadata_format(key),
+            )
+        if result is None:
+            return {"key": key, "failed": True}
+        size = store.store_results(
+            key,
+            result["timeseries"],
+            result["metadata"],
+            model_fingerprint=value.get("model_fingerprint"),
+            parameters=value.get("parameters"),
+        )
+        store.delete_results(key, keep=keep_suffixes(store))
+        return {"key": key, "value": value, "size_bytes": size, "cold": store is cache.cold_store}
+
+    report = {"rewritten": 0, "failed": 0, "bytes_before": 0, "bytes_after": 0}
+    now = time.time()
+    for done in _parallel(rewrite, list(entries), workers):
+        if done is None:
+            continue
+        if done.get("failed"):
+            report["failed"] += 1
+            continue
+        previous = done["value"]
+        value = {**previous, "size_bytes": done["size_bytes"]}
+        entry = entries[done["key"]]
+        cache.backend.set(done["key"], value, _remaining_ttl(entry.get("expires_at"), now))
+        if done["cold"]:
+            cache.backend.set_tier(done["key"], "cold")
+        cache.stats.record_write(value.get("model_file"), done["size_bytes"], replaced=previous)
+        report["rewritten"] += 1
+        report["bytes_before"] += int(previous.get("size_bytes") or 0)
+        report["bytes_after"] += done["size_bytes"]
+
+    if dataset_layout:
+        fingerprints = {
+            (cache.backend.peek(key) or {}).get("model_fingerprint") for key in entries
+        }
+        for fingerprint in sorted(fp for fp in fingerprints if fp):
+            cache.result_store.dataset.compact(fingerprint)
+
+    cache.stats.flush()
+    logger.info(
+        f"Cache compaction rewrote {report['rewritten']} results "
+        f"({report['bytes_before']} -> {report['bytes_after']} bytes)"
+    )
+    return report
+
+
+def rekey(cache: Any, dry_run: bool = False) -> Dict[str, int]:
+    """Move results to the hashes the current configuration computes.
+
+    Changing ``cache.hash_algorithm``, ``cache.exclude_fields`` or
+    ``cache.hash.drop_unreferenced`` changes every simulation hash, which
+    would turn the whole cache into misses.
+    Entries whose model file still exists with the content they were
+    cached for are renamed to their new hash; when the new hash is already
+    cached the old entry is a duplicate and is evicted.
+
+    Args:
+        cache: ``SimulationCache`` to rekey
+        dry_run: Only count what would change
+
+    Returns:
+        Entries ``checked``, ``rekeyed``, ``merged`` (duplicates evicted),
+        ``unchanged`` and ``skipped`` (model missing or modified, or a
+        ``dataset`` result)
+    """
+    if cache.writer is not None:
+        cache.writer.flush()
+    report = {"checked": 0, "rekeyed": 0, "merged": 0, "unchanged": 0, "skipped": 0}
+    now = time.time()
+    for entry in list(cache.backend.iter_entries()):
+        report["checked"] += 1
+        key = entry["key"]
+        value = cache.backend.peek(key)
+        model_file = (value or {}).get("model_file")
+        if not model_file or not _content_matches(model_file, value.get("model_fingerprint")):
+            report["skipped"] += 1
+            continue
+
+        new_key = cache.simulation_hash(
+            model_file, value.get("parameters") or {}, value.get("variant")
+        )
+        if new_key == key:
+            report["unchanged"] += 1
+            continue
+        if cache.backend.exists(new_key):
+            report["merged"] += 1
+            if not dry_run:
+                cache.evict(key)
+            continue
+        if dry_run:
+            report["rekeyed"] += 1
+            continue
+        store = cache.store_for(key)
+        if not store.move_results(key, new_key):
+            report["skipped"] += 1
+            continue
+
+        cache.backend.set(
+            new_key,
+            {
+                **value,
+                "simulation_hash": new_key,
+                "model_fingerprint": cache.hasher.model_fingerprint(model_file),
+            },
+            _remaining_ttl(entry.get("expires_at"), now),
+        )
+        if store is cache.cold_store:
+            cache.backend.set_tier(new_key, "cold")
+        cache.backend.delete(key)
+        cache.failures.delete(key)
+        if cache.bloom is not None:
+            cache.bloom.add(new_key)
+        report["rekeyed"] += 1
+
+    cache.approximate_index.invalidate()
+    return report
+
+
+def disk_usage(cache: Any, by_model: bool = False) -> Dict[str, Any]:
+    """Bytes used by the cache directory.
+
+    Args:
+        cache: ``SimulationCache`` to measure
+        by_model: Also break indexed result sizes down per model file
+
+    Returns:
+        ``total_bytes`` and ``by_directory`` (top-level entries of the
+        cache directory), plus ``by_model`` with ``entries`` and ``bytes``
+        per model when requested
+    """
+    root = Path(cache.config.cache.directory)
+    by_directory: Dict[str, int] = {}
+    for child in root.iterdir():
+        if child.is_file():
+            by_directory[child.name] = child.stat().st_size
+            continue
+        size = 0
+        for dirpath, _, filenames in os.walk(child):
+            for filename in filenames:
+                try:
+                    size += os.stat(os.path.join(dirpath, filename)).st_size
+                except FileNotFoundError:
+                    continue
+        by_directory[child.name] = size
+    cold_dir = cache.cold_store.storage_dir.resolve() if cache.cold_store is not None else None
+    if cold_dir is not None and root.resolve() not in cold_dir.parents:
+        by_directory[str(cold_dir)] = sum(
+            path.stat().st_size for path in cold_dir.rglob("*") if path.is_file()
+        )
+
+    usage: Dict[str, Any] = {
+        "cache_directory": str(root),
+        "total_bytes": sum(by_directory.values()),
+        "by_directory": dict(sorted(by_directory.items(), key=lambda item: -item[1])),
+    }
+    if by_model:
+        models: Dict[str, Dict[str, int]] = {}
+        for entry in cache.backend.iter_entries():
+            model = models.setdefault(entry.get("model_file") or "unknown", {"entries": 0, "bytes": 0})
+            model["entries"] += 1
+            model["bytes"] += int(entry.get("size_bytes") or 0)
+        usage["by_model"] = dict(sorted(models.items(), key=lambda item: -item[1]["bytes"]))
+    return usage
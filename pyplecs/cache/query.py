@@ -0,0 +1,120 @@
+"""Scalar KPIs and lightweight handles for parameter queries on the cache.
+
+Every stored result is indexed with its simulation parameters and a set of
+scalar KPIs (``<signal>.<statistic>`` for each signal, plus any numeric
+values the caller passes as ``metadata["kpis"]``). ``SimulationCache.find_results``
+filters and sorts on both and returns ``ResultHandle`` objects, which carry
+the index data only; waveforms are loaded on demand.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+KPI_STATISTICS = ("mean", "rms", "min", "max", "final")
+
+
+def compute_kpis(
+    timeseries: pd.DataFrame,
+    time_columns: Tuple[str, ...] = (),
+    extra: Optional[Dict[str, Any]] = None,
+) -> Dict[str, float]:
+    """Compute the scalar KPIs indexed for a result.
+
+    Args:
+        timeseries: Result waveforms
+        time_columns: Columns that are time axes rather than signals
+        extra: Caller-supplied KPIs; numeric values are kept as is
+
+    Returns:
+        Mapping of ``<signal>.<statistic>`` (and ``extra`` names) to values
+    """
+    kpis: Dict[str, float] = {}
+    for name in timeseries.columns:
+        if name in time_columns or not pd.api.types.is_numeric_dtype(timeseries[name]):
+            continue
+        values = timeseries[name].to_numpy(dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            continue
+        kpis[f"{name}.mean"] = float(values.mean())
+        kpis[f"{name}.rms"] = float(np.sqrt(np.mean(values * values)))
+        kpis[f"{name}.min"] = float(values.min())
+        kpis[f"{name}.max"] = float(values.max())
+        kpis[f"{name}.final"] = float(values[-1])
+
+    for name, value in (extra or {}).items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            kpis[str(name)] = float(value)
+    return kpis
+
+
+def split_filters(
+    filters: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Tuple[Optional[float], Optional[float]]], Dict[str, Any]]:
+    """Split ``{name: value | (low, high)}`` filters into ranges and equalities.
+
+    A two-element tuple or list is an inclusive range (either bound may be
+    None); any other value is an equality filter.
+    """
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+    equals: Dict[str, Any] = {}
+    for name, value in (filters or {}).items():
+        if isinstance(value, (tuple, list)) and len(value) == 2:
+            ranges[name] = (value[0], value[1])
+        else:
+            equals[name] = value
+    return ranges, equals
+
+
+@dataclass
+class ResultHandle:
+    """Index data of one cached result; waveforms are loaded on demand."""
+
+    simulation_hash: str
+    model_file: Optional[str]
+    parameters: Dict[str, Any]
+    kpis: Dict[str, float]
+    created_at: float
+    size_bytes: int
+    execution_time: float
+    cache: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any], cache: Any = None) -> "ResultHandle":
+        """Build a handle from a backend query entry."""
+        return cls(
+            simulation_hash=entry["key"],
+            model_file=entry.get("model_file"),
+            parameters=entry.get("parameters") or {},
+            kpis=entry.get("kpis") or {},
+            created_at=entry.get("created_at") or 0.0,
+            size_bytes=entry.get("size_bytes") or 0,
+            execution_time=entry.get("execution_time") or 0.0,
+            cache=cache,
+        )
+
+    def load(
+        self,
+        columns: Optional[List[str]] = None,
+        t_start: Optional[float] = None,
+        t_end: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Load the result's waveforms and metadata from the cache."""
+        if self.cache is None:
+            raise RuntimeError("Result handle is not attached to a cache")
+        return self.cache.load_result(self.simulation_hash, columns, t_start, t_end)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, without the cache reference."""
+        return {
+            "simulation_hash": self.simulation_hash,
+            "model_file": self.model_file,
+            "parameters": self.parameters,
+            "kpis": self.kpis,
+            "created_at": self.created_at,
+            "size_bytes": self.size_bytes,
+            "execution_time": self.execution_time,
+        }
@@ -0,0 +1,96 @@
+"""Which ModelVars a PLECS model actually references.
+
+Clients often send parameters the model never uses (bookkeeping fields,
+variables of other topologies); each distinct value of such a field would
+otherwise create a new cache key. A ``.plecs`` file stores every
+expression as a quoted string property, long ones split over several
+quoted lines:
+
+    InitializationCommands "Vi = 24;\\nVo_ref=12;\\n"
+    "D=Vo_ref/Vi\\n"
+
+Every identifier in those strings (initialization commands, component
+parameter values, mask and script code) counts as referenced. That
+over-approximates, which only costs cache hits: a parameter is dropped
+from the cache key only if its name appears nowhere in the model.
+
+No reference set is returned (and nothing is dropped) when the file is not
+a parsable PLECS model, has no initialization commands, or its
+initialization code evaluates code dynamically (``eval``, ``run``,
+``load``, ...), where names may be built at run time or come from other
+files.
+"""
+
+import re
+from typing import FrozenSet, Iterator, Optional, Tuple
+
+_PROPERTY = re.compile(r'^\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*$')
+_CONTINUATION = re.compile(r'^\s*"((?:[^"\\]|\\.)*)"\s*$')
+_ESCAPE = re.compile(r"\\(.)")
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+_COMMENT = re.compile(r"%.*$", re.MULTILINE)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+# Functions through which initialization code can define or read variables
+# whose names do not appear literally in the model
+DYNAMIC_FUNCTIONS = frozenset(
+    {"eval", "evalin", "evalc", "feval", "run", "load", "assignin", "str2func", "exist", "who", "whos"}
+)
+_DYNAMIC_CALL = re.compile(r"\b(?:%s)\b(?!\s*=[^=])" % "|".join(sorted(DYNAMIC_FUNCTIONS)))
+
+# Model and mask properties holding initialization code
+CODE_PROPERTIES = frozenset({"InitializationCommands", "Initialization"})
+
+
+def _unescape(value: str) -> str:
+    return _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def string_properties(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(name, value)`` for every quoted property of a ``.plecs`` file.
+
+    Continuation lines are joined to their property and escapes decoded.
+    """
+    name: Optional[str] = None
+    parts = []
+    for line in text.splitlines():
+        if name is not None:
+            continuation = _CONTINUATION.match(line)
+            if continuation:
+                parts.append(continuation.group(1))
+                continue
+            yield name, _unescape("".join(parts))
+            name = None
+        match = _PROPERTY.match(line)
+        if match:
+            name, parts = match.group(1), [match.group(2)]
+    if name is not None:
+        yield name, _unescape("".join(parts))
+
+
+def referenced_names(model_file: str) -> Optional[FrozenSet[str]]:
+    """Identifiers referenced anywhere in a PLECS model's expressions.
+
+    Returns:
+        The set of names, or None if references cannot be determined
+    """
+    try:
+        with open(model_file, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+    except OSError:
+        return None
+    if not text.lstrip().startswith("Plecs {"):
+        return None
+
+    names = set()
+    has_init = False
+    for name, value in string_properties(text):
+        if name in CODE_PROPERTIES:
+            has_init = has_init or name == "InitializationCommands"
+            if _DYNAMIC_CALL.search(_COMMENT.sub("", value)):
+                return None
+        names.update(_IDENTIFIER.findall(value))
+    if not has_init:
+        return None
+    return frozenset(names)
@@ -0,0 +1,156 @@
+"""Final system states of completed runs, for warm-started simulations.
+
+Converter models spend most of their simulated time reaching steady
+state. With ``cache.warm_start.enabled`` the final ``SystemState`` of every
+completed run is recorded under its model fingerprint and parameters, and
+a new request is started from the state of the closest recorded operating
+point instead of from the model's initial state.
+
+Closeness is the largest relative difference over the numeric parameters
+(all other parameters must match exactly); points farther than
+``max_distance`` are not used. States are opaque to the cache: whatever
+the simulation server returns is stored as JSON and handed back to it.
+
+A warm-started run's waveforms depend on the state it started from, so
+they must not answer lookups for a cold start. They are cached under the
+``WARM_START_VARIANT`` key space instead (the start point is in their
+``metadata["warm_start"]``), which only lookups that accept a warm start
+consult. Their final states are recorded like any other.
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .locking import atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Cache key variant of warm-started results (``SimulationHash.compute_hash``)
+WARM_START_VARIANT = "warm_start"
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def parameter_distance(a: Dict[str, Any], b: Dict[str, Any]) -> Optional[float]:
+    """Largest relative difference between two parameter points.
+
+    Returns:
+        The distance, or None if the points have different parameter
+        names or differ in a non-numeric parameter
+    """
+    if a.keys() != b.keys():
+        return None
+    distance = 0.0
+    for name, value in a.items():
+        other = b[name]
+        if _is_number(value) and _is_number(other):
+            scale = max(abs(float(value)), abs(float(other)))
+            if scale > 0:
+                distance = max(distance, abs(float(value) - float(other)) / scale)
+        elif value != other:
+            return None
+    return distance
+
+
+class SystemStateStore:
+    """Recorded final states, one JSON file per model fingerprint."""
+
+    def __init__(self, states_dir: str, max_states: int = 256):
+        """Initialize the store.
+
+        Args:
+            states_dir: Directory holding ``<fingerprint>.json`` files
+            max_states: States kept per model; the oldest are dropped
+        """
+        self.states_dir = Path(states_dir)
+        self.states_dir.mkdir(parents=True, exist_ok=True)
+        self.max_states = max_states
+        self._lock = threading.Lock()
+        self.counters = {"recorded": 0, "warm_starts": 0, "cold_starts": 0}
+
+    def _path(self, model_fingerprint: str) -> Path:
+        return self.states_dir / f"{model_fingerprint}.json"
+
+    def _read(self, model_fingerprint: str) -> List[Dict[str, Any]]:
+        path = self._path(model_fingerprint)
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable system states {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return []
+
+    def record(
+        self,
+        model_fingerprint: str,
+        parameters: Dict[str, Any],
+        state: Any,
+        simulation_time: Optional[float] = None,
+    ) -> bool:
+        """Store the final state of a run, replacing one for the same point.
+
+        Returns:
+            False if the state is not JSON-serializable and was not stored
+        """
+        record = {
+            "parameters": parameters,
+            "state": state,
+            "simulation_time": simulation_time,
+            "created_at": time.time(),
+        }
+        try:
+            json.dumps(record)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cannot store system state: {e}")
+            return False
+
+        with self._lock:
+            records = [r for r in self._read(model_fingerprint) if r["parameters"] != parameters]
+            records.append(record)
+            records = records[-self.max_states :]
+            with atomic_write(self._path(model_fingerprint)) as tmp_path:
+                tmp_path.write_text(json.dumps(records))
+            self.counters["recorded"] += 1
+        return True
+
+    def nearest(
+        self, model_fingerprint: str, parameters: Dict[str, Any], max_distance: float
+    ) -> Optional[Dict[str, Any]]:
+        """Return the recorded state closest to ``parameters``.
+
+        Args:
+            model_fingerprint: Model content fingerprint
+            parameters: Requested parameter point
+            max_distance: Largest accepted relative parameter difference
+
+        Returns:
+            The record (``parameters``, ``state``, ``simulation_time``) plus
+            its ``distance``, or None if no state is close enough
+        """
+        best = None
+        for record in self._read(model_fingerprint):
+            distance = parameter_distance(parameters, record["parameters"])
+            if distance is not None and distance <= max_distance:
+                if best is None or distance < best["distance"]:
+                    best = {**record, "distance": distance}
+        with self._lock:
+            self.counters["warm_starts" if best is not None else "cold_starts"] += 1
+        return best
+
+    def clear(self) -> None:
+        """Forget every recorded state."""
+        for path in self.states_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return states recorded and warm starts served by this process."""
+        with self._lock:
+            return dict(self.counters)
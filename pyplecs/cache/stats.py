@@ -0,0 +1,398 @@
+"""Incrementally maintained cache statistics.
+
+Counters are updated on every write, eviction, hit and miss, and are
+persisted to ``stats.json`` in the cache directory, so reading them never
+walks the cache and survives restarts.
+
+Several processes may share a cache directory. Each flush therefore adds
+this process's changes since its previous flush to the persisted counters
+(under a lock on ``stats.json.lock``) instead of overwriting them, and
+picks up what the other processes flushed in the meantime.
+
+Besides totals, usage counters (hits, misses, coalesced requests, bytes
+read and written, simulation seconds saved, evictions) are kept per model
+and per client, to find models and clients for which the cache does not
+pay off. A client is whatever identifies the submitter
+(``SimulationRequest.client_id``); lookups without one only count per model.
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .locking import atomic_write, file_lock
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE = "stats.json"
+STATS_LOCK_FILE = "stats.json.lock"
+
+_COUNTERS = ("hits", "misses", "evictions", "expirations")
+
+_USAGE = (
+    "hits",
+    "misses",
+    "coalesced",
+    "bytes_read",
+    "bytes_written",
+    "seconds_saved",
+    "evictions",
+)
+
+
+def _usage_counters() -> Dict[str, float]:
+    return {name: 0 for name in _USAGE}
+
+
+def _with_hit_rate(counters: Dict[str, float]) -> Dict[str, float]:
+    lookups = counters["hits"] + counters["misses"]
+    return {**counters, "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0}
+
+
+def _flatten(data: Dict[str, Any]) -> Dict[Tuple[str, ...], float]:
+    """Map every counter of a snapshot to a path tuple, for merging."""
+    flat: Dict[Tuple[str, ...], float] = {
+        ("total_entries",): data.get("total_entries", 0),
+        ("total_size_bytes",): data.get("total_size_bytes", 0),
+    }
+    for name in _COUNTERS:
+        flat[(name,)] = data.get(name, 0)
+    for model, v in data.get("per_model", {}).items():
+        for name in ("entries", "bytes", *_USAGE):
+            flat[("per_model", model, name)] = v.get(name, 0)
+    for client, v in data.get("per_client", {}).items():
+        for name in _USAGE:
+            flat[("per_client", client, name)] = v.get(name, 0)
+    return flat
+
+
+def _unflatten(flat: Dict[Tuple[str, ...], float]) -> Dict[str, Any]:
+    """Inverse of ``_flatten``; groups that are all zero are dropped."""
+    data: Dict[str, Any] = {"per_model": {}, "per_client": {}}
+    for path, value in flat.items():
+        if len(path) == 1:
+            data[path[0]] = value
+        elif value:
+            data[path[0]].setdefault(path[1], {})[path[2]] = value
+    return data
+
+
+class CacheStats:
+    """Thread-safe cache counters with JSON persistence."""
+
+    def __init__(self, cache_dir: str):
+        """Load persisted counters from ``cache_dir``, if any.
+
+        Args:
+            cache_dir: Cache directory holding ``stats.json``
+        """
+        self.path = Path(cache_dir) / STATS_FILE
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._dirty = False
+        # Overwrite instead of merging on the next flush (after a reset or
+        # rebuild, whose totals are absolute)
+        self._replace = False
+        self._reset_counters()
+
+        persisted = self.read_snapshot(cache_dir)
+        self.needs_rebuild = persisted is None
+        if persisted is not None:
+            self._load(persisted)
+        # Counter values as of the last read or write of ``stats.json``
+        self._base = _flatten(self._data())
+
+    def _reset_counters(self) -> None:
+        """Zero every counter."""
+        self.total_entries = 0
+        self.total_bytes = 0
+        self.counters = {name: 0 for name in _COUNTERS}
+        self.per_model: Dict[str, Dict[str, float]] = {}
+        self.per_client: Dict[str, Dict[str, float]] = {}
+
+    def _load(self, data: Dict[str, Any]) -> None:
+        """Restore counters from a persisted snapshot."""
+        self.total_entries = int(data.get("total_entries", 0))
+        self.total_bytes = int(data.get("total_size_bytes", 0))
+        for name in _COUNTERS:
+            self.counters[name] = int(data.get(name, 0))
+        self.per_model = {
+            model: {
+                "entries": int(v.get("entries", 0)),
+                "bytes": int(v.get("bytes", 0)),
+                **{name: v.get(name, 0) for name in _USAGE},
+            }
+            for model, v in data.get("per_model", {}).items()
+        }
+        self.per_client = {
+            client: {name: v.get(name, 0) for name in _USAGE}
+            for client, v in data.get("per_client", {}).items()
+        }
+
+    def _model_counters(self, model_file: Optional[str]) -> Dict[str, float]:
+        """Return (creating if needed) the counters for one model."""
+        return self.per_model.setdefault(
+            model_file or "unknown", {"entries": 0, "bytes": 0, **_usage_counters()}
+        )
+
+    def _usage(self, model_file: Optional[str], client: Optional[str]) -> List[Dict[str, float]]:
+        """Usage counters to bump for a model and client; caller holds the lock."""
+        usage = [self._model_counters(model_file)]
+        if client is not None:
+            usage.append(self.per_client.setdefault(client, _usage_counters()))
+        return usage
+
+    def record_write(
+        self,
+        model_file: Optional[str],
+        size_bytes: int,
+        replaced: Optional[Dict[str, Any]] = None,
+        client: Optional[str] = None,
+    ) -> None:
+        """Account for a newly cached result.
+
+        Args:
+            model_file: Model the result belongs to
+            size_bytes: Bytes written for the result
+            replaced: Previous backend entry for the same key, if any
+            client: Client whose request produced the result
+        """
+        with self._lock:
+            if replaced is not None:
+                self._remove(replaced.get("model_file"), replaced.get("size_bytes", 0))
+            self.total_entries += 1
+            self.total_bytes += size_bytes
+            model = self._model_counters(model_file)
+            model["entries"] += 1
+            model["bytes"] += size_bytes
+            for usage in self._usage(model_file, client):
+                usage["bytes_written"] += size_bytes
+            self._dirty = True
+
+    def record_removal(
+        self,
+        model_file: Optional[str],
+        size_bytes: int,
+        reason: Optional[str] = None,
+        client: Optional[str] = None,
+    ) -> None:
+        """Account for a removed result.
+
+        Args:
+            model_file: Model the result belonged to
+            size_bytes: Bytes freed
+            reason: ``"eviction"`` or ``"expiration"`` to bump that counter
+            client: Client whose request produced the result
+        """
+        with self._lock:
+            self._remove(model_file, size_bytes)
+            if reason == "eviction":
+                self.counters["evictions"] += 1
+                for usage in self._usage(model_file, client):
+                    usage["evictions"] += 1
+            elif reason == "expiration":
+                self.counters["expirations"] += 1
+            self._dirty = True
+
+    def _remove(self, model_file: Optional[str], size_bytes: int) -> None:
+        """Subtract one entry; caller holds the lock."""
+        size_bytes = int(size_bytes or 0)
+        self.total_entries = max(0, self.total_entries - 1)
+        self.total_bytes = max(0, self.total_bytes - size_bytes)
+        key = model_file or "unknown"
+        if key in self.per_model:
+            model = self.per_model[key]
+            model["entries"] = max(0, model["entries"] - 1)
+            model["bytes"] = max(0, model["bytes"] - size_bytes)
+            # Keep usage history of models that no longer have entries
+            if model["entries"] == 0 and not any(model[name] for name in _USAGE):
+                del self.per_model[key]
+
+    def record_hit(
+        self,
+        count: int = 1,
+        model_file: Optional[str] = None,
+        client: Optional[str] = None,
+        bytes_read: int = 0,
+        seconds_saved: float = 0.0,
+    ) -> None:
+        """Count ``count`` cache hits.
+
+        Args:
+            count: Number of hits
+            model_file: Model looked up, to count the hits per model
+            client: Client that looked it up
+            bytes_read: Stored bytes of the results served
+            seconds_saved: Recorded simulation time of the results served
+        """
+        with self._lock:
+            self.counters["hits"] += count
+            if model_file is not None or client is not None:
+                for usage in self._usage(model_file, client):
+                    usage["hits"] += count
+                    usage["bytes_read"] += bytes_read
+                    usage["seconds_saved"] += seconds_saved
+            self._dirty = True
+
+    def record_miss(
+        self, count: int = 1, model_file: Optional[str] = None, client: Optional[str] = None
+    ) -> None:
+        """Count ``count`` cache misses, per model and client if given."""
+        with self._lock:
+            self.counters["misses"] += count
+            if model_file is not None or client is not None:
+                for usage in self._usage(model_file, client):
+                    usage["misses"] += count
+            self._dirty = True
+
+    def record_coalesced(
+        self, model_file: Optional[str], client: Optional[str] = None, seconds_saved: float = 0.0
+    ) -> None:
+        """Count a request answered by an identical in-flight simulation."""
+        with self._lock:
+            for usage in self._usage(model_file, client):
+                usage["coalesced"] += 1
+                usage["seconds_saved"] += seconds_saved
+            self._dirty = True
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Recompute entry and byte totals from a full backend listing.
+
+        Needed when no persisted snapshot exists, e.g. for a cache created
+        before statistics were tracked, or when the persisted totals
+        disagree with the backend because a process died before flushing.
+        Hit/miss and usage counters are kept.
+
+        Args:
+            entries: Backend entries with ``model_file`` and ``size_bytes``
+        """
+        total_entries = 0
+        total_bytes = 0
+        per_model: Dict[str, Dict[str, int]] = {}
+        for entry in entries:
+            size_bytes = int(entry.get("size_bytes") or 0)
+            total_entries += 1
+            total_bytes += size_bytes
+            model = per_model.setdefault(
+                entry.get("model_file") or "unknown",
+                {"entries": 0, "bytes": 0, **_usage_counters()},
+            )
+            model["entries"] += 1
+            model["bytes"] += size_bytes
+
+        with self._lock:
+            for name, previous in self.per_model.items():
+                model = per_model.get(name)
+                if model is None and any(previous[usage] for usage in _USAGE):
+                    model = per_model[name] = {"entries": 0, "bytes": 0}
+                if model is not None:
+                    model.update({usage: previous[usage] for usage in _USAGE})
+            self.total_entries = total_entries
+            self.total_bytes = total_bytes
+            self.per_model = per_model
+            self.needs_rebuild = False
+            self._replace = True
+            self._dirty = True
+        self.flush()
+
+    def reset(self) -> None:
+        """Zero all counters, e.g. after the cache is cleared."""
+        with self._lock:
+            self._reset_counters()
+            self.needs_rebuild = False
+            self._replace = True
+            self._dirty = True
+        self.flush()
+
+    def _data(self) -> Dict[str, Any]:
+        """All counters in the persisted layout; caller holds the lock."""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            "total_entries": self.total_entries,
+            "total_size_bytes": self.total_bytes,
+            "total_size_mb": round(self.total_bytes / (1024 * 1024), 2),
+            **self.counters,
+            "hit_rate": round(self.counters["hits"] / lookups, 4) if lookups else 0.0,
+            "per_model": {model: _with_hit_rate(v) for model, v in self.per_model.items()},
+            "per_client": {client: _with_hit_rate(v) for client, v in self.per_client.items()},
+            "updated_at": time.time(),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of all counters."""
+        with self._lock:
+            return self._data()
+
+    def _merge(self, persisted: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add local changes since the last flush to ``persisted``.
+
+        Adopts the merged counters locally; caller holds the lock.
+
+        Returns:
+            The merged snapshot to write
+        """
+        current = _flatten(self._data())
+        if self._replace or persisted is None:
+            merged = current
+        else:
+            merged = _flatten(persisted)
+            for path in current.keys() | self._base.keys():
+                delta = current.get(path, 0) - self._base.get(path, 0)
+                merged[path] = max(0, merged.get(path, 0) + delta)
+        self._reset_counters()
+        self._load(_unflatten(merged))
+        self._base = _flatten(self._data())
+        self._replace = False
+        return self._data()
+
+    def flush(self) -> None:
+        """Merge counter changes into ``stats.json`` if there are any."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+
+        try:
+            with self._flush_lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with file_lock(self.path.with_name(STATS_LOCK_FILE)):
+                    persisted = self.read_snapshot(str(self.path.parent))
+                    with self._lock:
+                        base, replace = self._base, self._replace
+                        data = self._merge(persisted)
+                    try:
+                        with atomic_write(self.path) as tmp_path:
+                            with open(tmp_path, "w") as f:
+                                json.dump(data, f)
+                    except OSError:
+                        # Not persisted: count the merged changes again on
+                        # the next flush
+                        with self._lock:
+                            if replace or persisted is None:
+                                self._base, self._replace = base, replace
+                            else:
+                                self._base = _flatten(persisted)
+                        raise
+        except OSError as e:
+            logger.warning(f"Could not persist cache statistics: {e}")
+            with self._lock:
+                self._dirty = True
+
+    @staticmethod
+    def read_snapshot(cache_dir: str) -> Optional[Dict[str, Any]]:
+        """Read the persisted counters without opening the cache.
+
+        Args:
+            cache_dir: Cache directory holding ``stats.json``
+
+        Returns:
+            Persisted snapshot, or None if there is none
+        """
+        try:
+            with open(Path(cache_dir) / STATS_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
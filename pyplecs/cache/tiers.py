@@ -0,0 +1,157 @@
+"""Hot/cold storage tiers for cached results.
+
+The hot tier is the regular result store, configured for fast reads (e.g.
+the memory-mapped ``arrow`` format on a local SSD). With ``cache.tiers``
+enabled, results that have not been read for ``demote_after`` seconds are
+moved in small background steps to a cold store written with heavy
+compression, possibly on a network path; a read that finds a result only
+in the cold tier moves it back. The index entry stays where it is and
+records the tier, so lookups, queries and statistics are unaffected.
+
+A result is always written to its new tier before it is deleted from the
+old one, so a concurrent reader finds it in one of the two.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheTierManager:
+    """Moves results between the hot and cold stores of a ``SimulationCache``."""
+
+    def __init__(
+        self,
+        cache,
+        demote_after: float = 7 * 86400.0,
+        interval: float = 3600.0,
+        batch_size: int = 100,
+    ):
+        """Initialize the tier manager.
+
+        Args:
+            cache: SimulationCache with a ``cold_store``
+            demote_after: Seconds since last access before a result is demoted
+            interval: Seconds between background demotion steps
+            batch_size: Maximum results demoted per step
+        """
+        self.cache = cache
+        self.demote_after = demote_after
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "runs": 0,
+            "demoted": 0,
+            "promoted": 0,
+            "bytes_demoted": 0,
+            "bytes_promoted": 0,
+        }
+
+    def start(self) -> None:
+        """Start the background demotion thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pyplecs-cache-tiers", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread and wait for the current step."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Thread body: run demotion steps until stopped."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.step()
+            except Exception as e:
+                logger.error(f"Cache tier step failed: {e}")
+
+    def step(self, now: Optional[float] = None) -> int:
+        """Demote one batch of idle results.
+
+        Args:
+            now: Reference time for idleness (default: current time)
+
+        Returns:
+            Number of results demoted
+        """
+        before = (now if now is not None else time.time()) - self.demote_after
+        demoted = 0
+        for key in self.cache.backend.demotion_candidates(before, self.batch_size):
+            if self._stop_event.is_set():
+                break
+            if self.demote(key):
+                demoted += 1
+        with self._lock:
+            self.stats["runs"] += 1
+        if demoted:
+            logger.info(f"Cache tiers demoted {demoted} idle results")
+        return demoted
+
+    def demote(self, simulation_hash: str) -> bool:
+        """Move a result from the hot to the cold store."""
+        written = self._move(simulation_hash, self.cache.result_store, self.cache.cold_store, "cold")
+        if written is None:
+            return False
+        with self._lock:
+            self.stats["demoted"] += 1
+            self.stats["bytes_demoted"] += written
+        return True
+
+    def promote(self, simulation_hash: str) -> bool:
+        """Move a result from the cold to the hot store."""
+        written = self._move(simulation_hash, self.cache.cold_store, self.cache.result_store, "hot")
+        if written is None:
+            return False
+        with self._lock:
+            self.stats["promoted"] += 1
+            self.stats["bytes_promoted"] += written
+        return True
+
+    def _move(self, simulation_hash: str, source, target, tier: str) -> Optional[int]:
+        """Copy a result between stores, then drop the source copy.
+
+        Returns:
+            Bytes written to ``target``, or None if the result was not in
+            ``source``
+        """
+        entry = self.cache.backend.peek(simulation_hash)
+        result = source.load_results(simulation_hash) if entry is not None else None
+        if result is None:
+            return None
+        written = target.store_results(
+            simulation_hash,
+            result["timeseries"],
+            result["metadata"],
+            model_fingerprint=entry.get("model_fingerprint"),
+            parameters=entry.get("parameters"),
+        )
+        source.delete_results(simulation_hash)
+        self.cache.backend.set_tier(simulation_hash, tier)
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return tier counters and configuration."""
+        with self._lock:
+            stats = dict(self.stats)
+        return {
+            **stats,
+            "demote_after": self.demote_after,
+            "cold_directory": str(self.cache.cold_store.storage_dir),
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
@@ -0,0 +1,161 @@
+"""Implicit storage of uniform time axes.
+
+Fixed-step PLECS outputs have a ``Time`` vector that is fully described by
+a few ``(t0, dt, n)`` segments: one for a uniform axis, a handful for an
+axis whose step changes piecewise. Storing the segments in the file's
+schema metadata instead of a float64 column halves two-column results,
+and windowed reads can compute their row range from the segments without
+materializing the axis at all.
+"""
+
+import json
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+TIME_AXIS_METADATA_KEY = b"pyplecs.time_axis"
+
+Segment = Tuple[float, float, int]
+
+# Only worth it when the segments are far smaller than the column
+_MIN_POINTS_PER_SEGMENT = 16
+
+
+def detect_segments(times, tolerance: float = 1e-6) -> Optional[List[Segment]]:
+    """Describe a time vector as piecewise-uniform ``(t0, dt, n)`` segments.
+
+    Args:
+        times: Monotonic time vector
+        tolerance: Largest reconstruction error accepted, as a fraction of
+            the local time step
+
+    Returns:
+        Segments reproducing ``times`` within ``tolerance``, or None if the
+        axis is not (piecewise) uniform, e.g. from a variable-step solver
+    """
+    t = np.asarray(times, dtype=np.float64)
+    n = len(t)
+    if n < 2:
+        return None
+
+    steps = np.diff(t)
+    scale = np.maximum(np.abs(steps[1:]), np.abs(steps[:-1]))
+    changes = np.flatnonzero(np.abs(np.diff(steps)) > tolerance * scale) + 1
+    if len(changes) + 1 > n / _MIN_POINTS_PER_SEGMENT:
+        return None
+
+    # Each run of equal steps [a, b) covers points a..b; a point shared
+    # with the previous run belongs to that run
+    segments: List[Segment] = []
+    next_point = 0
+    for a, b in zip(np.r_[0, changes], np.r_[changes, len(steps)]):
+        start, end = max(int(a), next_point), int(b)
+        if start > end:
+            continue
+        count = end - start + 1
+        dt = (t[end] - t[start]) / (count - 1) if count > 1 else 0.0
+        segments.append((float(t[start]), float(dt), count))
+        next_point = end + 1
+
+    rebuilt = expand_segments(segments)
+    step = np.abs(steps).max()
+    if len(rebuilt) != n or np.abs(rebuilt - t).max() > tolerance * step:
+        return None
+    return segments
+
+
+def expand_segments(
+    segments: List[Segment], start: int = 0, stop: Optional[int] = None
+) -> np.ndarray:
+    """Rebuild rows ``[start, stop)`` of the time vector from its segments."""
+    total = sum(n for _, _, n in segments)
+    stop = total if stop is None else min(stop, total)
+    parts = []
+    offset = 0
+    for t0, dt, n in segments:
+        lo, hi = max(start - offset, 0), min(stop - offset, n)
+        if lo < hi:
+            parts.append(t0 + dt * np.arange(lo, hi, dtype=np.float64))
+        offset += n
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+
+
+def window_rows(
+    segments: List[Segment], t_start: Optional[float], t_end: Optional[float]
+) -> Tuple[int, int]:
+    """Row range ``[lo, hi)`` of samples inside ``[t_start, t_end]``.
+
+    Computed from the segments alone, without building the time vector.
+    """
+    total = sum(n for _, _, n in segments)
+    lo = 0 if t_start is None else _first_row(segments, t_start, inclusive=True)
+    hi = total if t_end is None else _first_row(segments, t_end, inclusive=False)
+    return lo, max(lo, hi)
+
+
+def _first_row(segments: List[Segment], t: float, inclusive: bool) -> int:
+    """Index of the first row with time ``>= t`` (or ``> t``)."""
+
+    def after(x: float) -> bool:
+        return x >= t if inclusive else x > t
+
+    offset = 0
+    for t0, dt, n in segments:
+        if after(t0 + dt * (n - 1)):
+            k = min(max(math.ceil((t - t0) / dt), 0), n - 1) if dt > 0 else 0
+            # Settle rounding against the samples expand_segments rebuilds
+            while k > 0 and after(t0 + dt * (k - 1)):
+                k -= 1
+            while not after(t0 + dt * k):
+                k += 1
+            return offset + k
+        offset += n
+    return offset
+
+
+def encode_time_axis(
+    table: pa.Table, time_col: Optional[str], tolerance: float = 1e-6
+) -> pa.Table:
+    """Replace a (piecewise) uniform time column by schema metadata.
+
+    The table is returned unchanged if there is no such column.
+    """
+    if time_col is None or time_col not in table.column_names:
+        return table
+    index = table.schema.get_field_index(time_col)
+    column = table.column(index)
+    if not pa.types.is_floating(column.type) or column.null_count:
+        return table
+
+    segments = detect_segments(column.to_numpy(), tolerance)
+    if segments is None:
+        return table
+
+    axis = {"column": time_col, "index": index, "segments": segments}
+    metadata = dict(table.schema.metadata or {})
+    metadata[TIME_AXIS_METADATA_KEY] = json.dumps(axis).encode()
+    return table.remove_column(index).replace_schema_metadata(metadata)
+
+
+def read_time_axis(schema: pa.Schema) -> Optional[dict]:
+    """Return the implicit time axis recorded in a stored schema, if any."""
+    raw = (schema.metadata or {}).get(TIME_AXIS_METADATA_KEY)
+    if not raw:
+        return None
+    axis = json.loads(raw)
+    axis["segments"] = [tuple(segment) for segment in axis["segments"]]
+    return axis
+
+
+def insert_time_axis(table: pa.Table, axis: dict, start: int, stop: int) -> pa.Table:
+    """Add rows ``[start, stop)`` of an implicit time axis back as a column."""
+    metadata = dict(table.schema.metadata or {})
+    metadata.pop(TIME_AXIS_METADATA_KEY, None)
+    times = pa.array(expand_segments(axis["segments"], start, stop))
+    if table.num_columns == 0:
+        return pa.table({axis["column"]: times}, metadata=metadata)
+    index = min(axis["index"], table.num_columns)
+    table = table.add_column(index, axis["column"], times)
+    return table.replace_schema_metadata(metadata)
@@ -0,0 +1,209 @@
+"""Write-behind persistence for the simulation cache.
+
+``CacheWriter`` takes finished results off the caller's thread: they are
+queued in memory, then encoded and written by background workers in
+batches. Until a result is on disk it is served from the pending table,
+so a lookup right after a write is still a hit.
+
+``submit`` never blocks: once ``max_pending`` results are queued, further
+results are written one by one on the cache's I/O pool instead, so a
+caller on an event loop is not stalled by a slow disk.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+FSYNC_POLICIES = ("none", "batch", "always")
+
+
+class CacheWriter:
+    """Background writer pool for ``SimulationCache`` results.
+
+    Fsync policies:
+    - ``none``: leave flushing to the operating system
+    - ``batch``: fsync every result file of a batch before indexing it
+    - ``always``: fsync each result's files right after writing them
+    """
+
+    def __init__(
+        self,
+        cache,
+        workers: int = 2,
+        batch_size: int = 16,
+        fsync: str = "batch",
+        max_pending: int = 256,
+    ):
+        """Initialize the writer.
+
+        Args:
+            cache: SimulationCache that encodes and indexes the results
+            workers: Number of writer threads
+            batch_size: Maximum results indexed per backend transaction
+            fsync: Durability policy, one of ``FSYNC_POLICIES``
+            max_pending: Queued results before ``submit`` writes on the
+                cache's I/O pool instead
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unsupported fsync policy: {fsync}")
+
+        self.cache = cache
+        self.workers = workers
+        self.batch_size = batch_size
+        self.fsync = fsync
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._overflow: Set[Future] = set()
+
+        self.stats = {"queued": 0, "written": 0, "batches": 0, "failed": 0, "overflowed": 0}
+
+    def start(self) -> None:
+        """Start the writer threads."""
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"pyplecs-cache-writer-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, simulation_hash: str, item: Dict[str, Any]) -> None:
+        """Queue a result for persistence.
+
+        Args:
+            simulation_hash: Hash the result is stored under
+            item: ``model_file``, ``parameters``, ``timeseries``,
+                ``metadata`` and ``execution_time`` of the result
+        """
+        with self._lock:
+            self._pending[simulation_hash] = item
+            self.stats["queued"] += 1
+        try:
+            self._queue.put_nowait((simulation_hash, item))
+        except queue.Full:
+            future = self.cache._pool().submit(self._persist, [(simulation_hash, item)])
+            with self._lock:
+                self.stats["overflowed"] += 1
+                self._overflow.add(future)
+            future.add_done_callback(self._overflow_done)
+
+    def _overflow_done(self, future: Future) -> None:
+        with self._lock:
+            self._overflow.discard(future)
+
+    def get_pending(self, simulation_hash: str) -> Optional[Dict[str, Any]]:
+        """Return a queued result that is not yet on disk, if any."""
+        return self._pending.get(simulation_hash)
+
+    def discard(self, simulation_hash: str) -> None:
+        """Drop a queued result so it is not persisted."""
+        with self._lock:
+            self._pending.pop(simulation_hash, None)
+
+    def _run(self) -> None:
+        """Thread body: persist queued results in batches until stopped."""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                return
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    # Another thread's stop sentinel: hand it back
+                    self._queue.put_nowait(None)
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+
+            try:
+                self._persist(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _persist(self, batch: List[Any]) -> None:
+        """Write a batch and drop it from the pending table."""
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            self.stats["failed"] += len(batch)
+            logger.error(f"Cache write-behind batch failed: {e}")
+            for simulation_hash, item in batch:
+                self.cache._release_result_leases({**item, "simulation_hash": simulation_hash})
+        finally:
+            for simulation_hash, item in batch:
+                with self._lock:
+                    if self._pending.get(simulation_hash) is item:
+                        del self._pending[simulation_hash]
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        """Encode, optionally fsync, and index one batch of results."""
+        entries = {}
+        for simulation_hash, item in batch:
+            # Skip results discarded or superseded since they were queued
+            if self._pending.get(simulation_hash) is not item:
+                continue
+            entries[simulation_hash] = self.cache._store_result(
+                simulation_hash,
+                item["model_file"],
+                item["parameters"],
+                item["timeseries"],
+                item["metadata"],
+                item["execution_time"],
+                item.get("client"),
+                item.get("variant"),
+            )
+            if self.fsync == "always":
+                self.cache.result_store.sync([simulation_hash])
+
+        if not entries:
+            return
+        if self.fsync == "batch":
+            self.cache.result_store.sync(list(entries))
+
+        self.cache._index_entries(list(entries.values()))
+        self.stats["written"] += len(entries)
+        self.stats["batches"] += 1
+
+    def _wait_overflow(self) -> None:
+        """Block until results written on the I/O pool are persisted."""
+        with self._lock:
+            futures = list(self._overflow)
+        wait(futures)
+
+    def flush(self) -> None:
+        """Block until every queued result has been persisted."""
+        self._queue.join()
+        self._wait_overflow()
+
+    def stop(self) -> None:
+        """Persist everything queued, then stop the writer threads."""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._wait_overflow()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return writer counters and configuration."""
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "fsync": self.fsync,
+            "running": bool(self._threads),
+        }
@@ -0,0 +1,126 @@
+"""Cache maintenance CLI for PyPLECS, exposed as `pyplecs-cache`.
+
+Subcommands:
+- stats: cache counters (entries, bytes, hit rate, ...)
+- verify: check every result for readability and checksum errors
+- gc: drop expired and over-budget entries and orphan files
+- compact: rewrite results into the configured format and codecs
+- rekey: move results to the hashes the current configuration computes
+- du: disk usage per cache subdirectory or, with --by-model, per model
+
+The cache is opened with the configuration found the usual way (or given
+with --config); run maintenance while no simulations are writing to it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any, Dict, List
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def print_report(title: str, report: Dict[str, Any]) -> None:
+    print(f"\n=== pyplecs-cache {title} ===")
+    for k, v in report.items():
+        if isinstance(v, dict):
+            print(f"- {k}:")
+            for name, value in v.items():
+                print(f"    {name}: {value}")
+        elif isinstance(v, list):
+            print(f"- {k}: {len(v)}")
+            for item in v[:20]:
+                print(f"    {item}")
+            if len(v) > 20:
+                print(f"    ... {len(v) - 20} more")
+        else:
+            print(f"- {k}: {v}")
+
+
+def print_usage(usage: Dict[str, Any]) -> None:
+    print(f"{_format_bytes(usage['total_bytes']):>10}  {usage['cache_directory']}")
+    for name, size in usage["by_directory"].items():
+        print(f"{_format_bytes(size):>10}  {name}")
+    if "by_model" in usage:
+        print()
+        for model, counters in usage["by_model"].items():
+            print(f"{_format_bytes(counters['bytes']):>10}  {counters['entries']:>7} entries  {model}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="pyplecs-cache", description="PyPLECS simulation cache maintenance"
+    )
+    parser.add_argument("--config", "-c", default=None, help="Path to a PyPLECS config file")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    sub = parser.add_subparsers(dest="cmd")
+
+    sub.add_parser("stats", help="Show cache statistics")
+    sub_verify = sub.add_parser("verify", help="Check results for readability and checksum errors")
+    sub_verify.add_argument(
+        "--repair", action="store_true", help="Evict damaged entries and delete orphan files"
+    )
+    sub.add_parser("gc", help="Drop expired and over-budget entries and orphan files")
+    sub.add_parser("compact", help="Rewrite results into the configured format and codecs")
+    sub_rekey = sub.add_parser("rekey", help="Move results to the current hash scheme")
+    sub_rekey.add_argument(
+        "--dry-run", action="store_true", help="Only report what would be rekeyed"
+    )
+    sub_du = sub.add_parser("du", help="Show disk usage of the cache directory")
+    sub_du.add_argument("--by-model", action="store_true", help="Break usage down per model file")
+    for sub_parallel in (sub_verify, sub.choices["compact"]):
+        sub_parallel.add_argument(
+            "--workers",
+            "-j",
+            type=int,
+            default=None,
+            help="Parallel workers (default: one per CPU core)",
+        )
+
+    args = parser.parse_args(argv)
+    if args.cmd is None:
+        parser.print_help()
+        return 2
+
+    from ..cache import SimulationCache, maintenance
+    from ..config import init_config
+
+    init_config(args.config)
+    cache = SimulationCache()
+    try:
+        if args.cmd == "stats":
+            report = cache.get_cache_stats()
+        elif args.cmd == "verify":
+            report = maintenance.verify(cache, repair=args.repair, workers=args.workers)
+        elif args.cmd == "gc":
+            report = maintenance.collect_garbage(cache)
+        elif args.cmd == "compact":
+            report = maintenance.compact(cache, workers=args.workers)
+        elif args.cmd == "rekey":
+            report = maintenance.rekey(cache, dry_run=args.dry_run)
+        else:
+            report = maintenance.disk_usage(cache, by_model=args.by_model)
+    finally:
+        cache.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    elif args.cmd == "du":
+        print_usage(report)
+    else:
+        print_report(args.cmd, report)
+
+    if args.cmd == "verify" and not args.repair:
+        return 1 if report["missing"] or report["corrupt"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
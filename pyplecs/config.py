@@ -35,11 +35,57 @@ class CacheConfig:
     ttl: int = 3600
     timeseries_format: str = "parquet"
     metadata_format: str = "json"
-    compression: str = "snappy"
+    compression: str = "zstd"
+    compression_level: Optional[int] = 3
+    column_compression: dict = field(default_factory=dict)
+    float32_columns: list = field(default_factory=list)
+    quantize_columns: dict = field(default_factory=dict)
+    hdf5_complevel: int = 4
+    hdf5_complib: str = "blosc:zstd"
+    row_group_size: int = 65536
+    implicit_time: bool = True
+    chunk_rows: int = 4096
+    storage_layout: str = "flat"
+    compact_threshold: int = 64
+    time_axis_tolerance: float = 1e-6
     hash_algorithm: str = "sha256"
     include_files: bool = True
     include_parameters: bool = True
     exclude_fields: list = field(default_factory=lambda: ["timestamp", "run_id"])
+    drop_unreferenced: bool = False
+    max_size_mb: Optional[float] = None
+    eviction_policy: str = "lru"
+    cost_weight: float = 3600.0
+    gc_interval: float = 30.0
+    gc_batch_size: int = 500
+    bloom_enabled: bool = True
+    bloom_capacity: int = 100000
+    bloom_fp_rate: float = 0.01
+    io_workers: int = 8
+    write_behind: bool = True
+    writer_workers: int = 2
+    writer_batch_size: int = 16
+    writer_fsync: str = "batch"
+    writer_max_pending: int = 256
+    lease_timeout: float = 600.0
+    approximate_enabled: bool = False
+    approximate_tolerances: dict = field(default_factory=dict)
+    approximate_mode: str = "nearest"
+    approximate_neighbors: int = 4
+    negative_cache_enabled: bool = True
+    failure_classes: dict = field(default_factory=dict)
+    tiers_enabled: bool = False
+    cold_directory: Optional[str] = None
+    cold_format: str = "parquet"
+    cold_compression: str = "zstd"
+    cold_compression_level: Optional[int] = 19
+    demote_after: float = 7 * 86400.0
+    tier_interval: float = 3600.0
+    tier_batch_size: int = 100
+    promote_on_read: bool = True
+    warm_start_enabled: bool = False
+    warm_start_max_distance: float = 0.1
+    warm_start_max_states: int = 256
 
 
 @dataclass
@@ -191,7 +237,27 @@ class ConfigManager(ConfigManagerBase):
             metadata_format=cache_data.get("storage", {}).get(
                 "metadata_format", "json"
             ),
-            compression=cache_data.get("storage", {}).get("compression", "snappy"),
+            compression=cache_data.get("storage", {}).get("compression", "zstd"),
+            compression_level=cache_data.get("storage", {}).get("compression_level", 3),
+            column_compression=cache_data.get("storage", {}).get(
+                "column_compression", {}
+            ),
+            float32_columns=cache_data.get("storage", {}).get("lossy", {}).get(
+                "float32", []
+            ),
+            quantize_columns=cache_data.get("storage", {}).get("lossy", {}).get(
+                "quantize", {}
+            ),
+            hdf5_complevel=cache_data.get("storage", {}).get("hdf5_complevel", 4),
+            hdf5_complib=cache_data.get("storage", {}).get("hdf5_complib", "blosc:zstd"),
+            row_group_size=cache_data.get("storage", {}).get("row_group_size", 65536),
+            implicit_time=cache_data.get("storage", {}).get("implicit_time", True),
+            chunk_rows=cache_data.get("storage", {}).get("chunk_rows", 4096),
+            storage_layout=cache_data.get("storage", {}).get("layout", "flat"),
+            compact_threshold=cache_data.get("storage", {}).get("compact_threshold", 64),
+            time_axis_tolerance=cache_data.get("storage", {}).get(
+                "time_axis_tolerance", 1e-6
+            ),
             hash_algorithm=cache_data.get("hash", {}).get("algorithm", "sha256"),
             include_files=cache_data.get("hash", {}).get("include_files", True),
             include_parameters=cache_data.get("hash", {}).get(
@@ -200,6 +266,48 @@ class ConfigManager(ConfigManagerBase):
             exclude_fields=cache_data.get("hash", {}).get(
                 "exclude_fields", ["timestamp", "run_id"]
             ),
+            drop_unreferenced=cache_data.get("hash", {}).get("drop_unreferenced", False),
+            max_size_mb=cache_data.get("max_size_mb"),
+            eviction_policy=cache_data.get("gc", {}).get("eviction_policy", "lru"),
+            cost_weight=cache_data.get("gc", {}).get("cost_weight", 3600.0),
+            gc_interval=cache_data.get("gc", {}).get("interval", 30.0),
+            gc_batch_size=cache_data.get("gc", {}).get("batch_size", 500),
+            bloom_enabled=cache_data.get("bloom", {}).get("enabled", True),
+            bloom_capacity=cache_data.get("bloom", {}).get("capacity", 100000),
+            bloom_fp_rate=cache_data.get("bloom", {}).get("fp_rate", 0.01),
+            io_workers=cache_data.get("io_workers", 8),
+            write_behind=cache_data.get("write_behind", {}).get("enabled", True),
+            writer_workers=cache_data.get("write_behind", {}).get("workers", 2),
+            writer_batch_size=cache_data.get("write_behind", {}).get("batch_size", 16),
+            writer_fsync=cache_data.get("write_behind", {}).get("fsync", "batch"),
+            writer_max_pending=cache_data.get("write_behind", {}).get(
+                "max_pending", 256
+            ),
+            lease_timeout=cache_data.get("lease_timeout", 600.0),
+            approximate_enabled=cache_data.get("approximate", {}).get("enabled", False),
+            approximate_tolerances=cache_data.get("approximate", {}).get(
+                "tolerances", {}
+            ),
+            approximate_mode=cache_data.get("approximate", {}).get("mode", "nearest"),
+            approximate_neighbors=cache_data.get("approximate", {}).get("neighbors", 4),
+            negative_cache_enabled=cache_data.get("failures", {}).get("enabled", True),
+            failure_classes=cache_data.get("failures", {}).get("classes", {}),
+            tiers_enabled=cache_data.get("tiers", {}).get("enabled", False),
+            cold_directory=cache_data.get("tiers", {}).get("cold_directory"),
+            cold_format=cache_data.get("tiers", {}).get("cold_format", "parquet"),
+            cold_compression=cache_data.get("tiers", {}).get("cold_compression", "zstd"),
+            cold_compression_level=cache_data.get("tiers", {}).get(
+                "cold_compression_level", 19
+            ),
+            demote_after=cache_data.get("tiers", {}).get("demote_after", 7 * 86400.0),
+            tier_interval=cache_data.get("tiers", {}).get("interval", 3600.0),
+            tier_batch_size=cache_data.get("tiers", {}).get("batch_size", 100),
+            promote_on_read=cache_data.get("tiers", {}).get("promote_on_read", True),
+            warm_start_enabled=cache_data.get("warm_start", {}).get("enabled", False),
+            warm_start_max_distance=cache_data.get("warm_start", {}).get("max_distance", 0.1),
+            warm_start_max_states=cache_data.get("warm_start", {}).get(
+                "max_states_per_model", 256
+            ),
         )
 
         webgui_data = self._config_data.get("webgui", {})
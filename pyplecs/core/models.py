@@ -27,6 +27,7 @@ class SimulationRequest:
     simulation_time: Optional[float] = None
     output_variables: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    client_id: Optional[str] = None  # Submitter, for per-client cache statistics
 
     def __post_init__(self):
         """Validate and normalize the request."""
@@ -5,19 +5,36 @@ import logging
 import threading
 import time
 import uuid
+import xmlrpc.client
+from collections import deque
 from dataclasses import dataclass, field
 from queue import PriorityQueue
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from pyplecs.contracts import SimulationOrchestratorBase, TaskPriority
 
 from ..cache import SimulationCache
+from ..cache.states import WARM_START_VARIANT
 from ..config import get_config
 from ..core.models import SimulationRequest, SimulationResult, SimulationStatus
+from ..pyplecs import SYSTEM_STATE_FIELD
+from .warmup import WarmupJob, expand_sweep
 
 logger = logging.getLogger(__name__)
 
 
+def _rejects_initial_states(error: Exception) -> bool:
+    """True if ``error`` is the server refusing initial system states.
+
+    PLECS answers an unsupported or mismatched ``SystemState`` option with
+    an XML-RPC fault naming it; a server object without warm-start support
+    has no ``initial_states`` argument.
+    """
+    if isinstance(error, xmlrpc.client.Fault):
+        return SYSTEM_STATE_FIELD in str(error.faultString)
+    return isinstance(error, TypeError) and "initial_states" in str(error)
+
+
 @dataclass
 class SimulationTask:
     """Represents a simulation task in the queue."""
@@ -33,6 +50,18 @@ class SimulationTask:
     error: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    simulation_hash: Optional[str] = None
+    holds_lease: bool = False
+    lease_timed_out: bool = False
+    # Identical submissions waiting on this task's simulation
+    followers: List["SimulationTask"] = field(default_factory=list, repr=False)
+    # Stored state the run starts from (``SimulationCache.find_system_state``)
+    # and the final state it returned
+    warm_start: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    final_state: Any = field(default=None, repr=False)
+    # Never warm-started: warm-up jobs, which fill the cold-start cache,
+    # and retries after a failed warm start
+    cold_start: bool = False
 
     def __lt__(self, other):
         """For priority queue ordering."""
@@ -99,7 +128,7 @@ class BatchSimulationExecutor:
 
             # PLECS handles parallelization internally
             # This single call distributes work across CPU cores
-            results = self.server.simulate_batch(param_array)
+            results = self._simulate(tasks, param_array)
 
             runtime = time.time() - start_time
             self.stats["batches_executed"] += 1
@@ -112,6 +141,9 @@ class BatchSimulationExecutor:
             simulation_results = []
             for result, task in zip(results, tasks):
                 sim_result = self._parse_plecs_result(result, task)
+                # Individual times are not reported; charge each task an
+                # equal share of the batch runtime
+                sim_result.execution_time = runtime / len(tasks)
                 simulation_results.append(sim_result)
 
             return simulation_results
@@ -120,6 +152,27 @@ class BatchSimulationExecutor:
             logger.error(f"Batch execution failed: {e}")
             raise
 
+    def _simulate(self, tasks: List[SimulationTask], param_array: List[Dict[str, Any]]) -> List[Any]:
+        """Run the batch, warm-starting tasks that have a stored state.
+
+        If the server rejects the initial states (an older PLECS or a
+        server without the hook), the batch is run again from the model's
+        initial state and the tasks are no longer marked as warm-started.
+        Any other error fails the batch as usual.
+        """
+        initial_states = [task.warm_start["state"] if task.warm_start else None for task in tasks]
+        if all(state is None for state in initial_states):
+            return self.server.simulate_batch(param_array)
+        try:
+            return self.server.simulate_batch(param_array, initial_states=initial_states)
+        except (xmlrpc.client.Fault, TypeError) as e:
+            if not _rejects_initial_states(e):
+                raise
+            logger.warning(f"Warm start rejected, simulating from the initial state: {e}")
+            for task in tasks:
+                task.warm_start = None
+            return self.server.simulate_batch(param_array)
+
     def _parse_plecs_result(
         self, plecs_result: Any, task: SimulationTask
     ) -> SimulationResult:
@@ -138,17 +191,26 @@ class BatchSimulationExecutor:
             # Extract timeseries data from PLECS result
             # PLECS returns results in various formats depending on model
             if isinstance(plecs_result, dict):
+                # The final system state is kept apart from the waveforms
+                plecs_result = dict(plecs_result)
+                task.final_state = plecs_result.pop(SYSTEM_STATE_FIELD, None)
                 timeseries_data = pd.DataFrame(plecs_result)
             else:
                 # Handle other result formats
                 timeseries_data = None
 
+            metadata = {"model_file": task.request.model_file}
+            if task.warm_start is not None:
+                metadata["warm_start"] = {
+                    "parameters": task.warm_start["parameters"],
+                    "distance": task.warm_start["distance"],
+                }
             return SimulationResult(
                 task_id=task.id,
                 success=True,
                 timeseries_data=timeseries_data,
-                metadata={"model_file": task.request.model_file},
-                execution_time=0.0,  # Part of batch, individual time not tracked
+                metadata=metadata,
+                execution_time=0.0,  # Set by execute_batch from the batch runtime
                 cached=False,
             )
         except Exception as e:
@@ -202,6 +264,11 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
         self.task_queue = PriorityQueue()
         self.active_tasks: Dict[str, SimulationTask] = {}
         self.completed_tasks: Dict[str, SimulationTask] = {}
+        self.warmup_jobs: Dict[str, WarmupJob] = {}
+        # Queued or running task per simulated point, for coalescing
+        # identical submissions (see ``_join_flight``)
+        self.inflight: Dict[Tuple[Any, ...], SimulationTask] = {}
+        self.coalesce = self.config.get("orchestration.coalesce_inflight", True)
 
         # State management
         self.is_running = False
@@ -215,6 +282,10 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
             "total_completed": 0,
             "total_failed": 0,
             "total_cached_hits": 0,
+            "total_approximate_hits": 0,
+            "total_cached_failures": 0,
+            "total_coalesced": 0,
+            "total_warm_starts": 0,
             "total_batches": 0,
             "queue_size": 0,
             "active_tasks": 0,
@@ -280,39 +351,40 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
             max_retries=self.config.get("orchestration.retry_attempts", 3),
         )
 
-        # Check cache first if enabled
+        # Check cache first if enabled: exact results, then warm-started
+        # results, known failures and approximations, as for
+        # submit_simulations
         if use_cache and self.cache.config.cache.enabled:
-            cached_result = self.cache.get_cached_result(
-                request.model_file, request.parameters
-            )
-
-            if cached_result:
-                task.status = SimulationStatus.COMPLETED
-                task.result = SimulationResult(
-                    task_id=task.id,
-                    success=True,
-                    timeseries_data=cached_result["timeseries"],
-                    metadata=cached_result["metadata"],
-                    execution_time=0.0,
-                    cached=True,
+            found = [
+                self.cache.get_cached_result(
+                    request.model_file,
+                    request.parameters,
+                    columns=request.output_variables or None,
+                    client=request.client_id,
                 )
-                task.completed_at = time.time()
-
-                self.completed_tasks[task.id] = task
-                self.stats["total_cached_hits"] += 1
-
-                logger.info(f"Task {task.id} served from cache")
-                self._trigger_callbacks("on_task_completed", task)
+            ]
+            self._warm_start_lookup([task], found)
+            self._failure_lookup([task], found)
+            self._approximate_lookup([task], found)
 
+            if found[0]:
+                self._complete_from_cache(task, found[0])
                 return task.id
 
-        # Add to queue
+        # Add to queue, unless the same point is already queued or running
+        if use_cache:
+            self._hash_task(task)
         with self._lock:
-            self.task_queue.put(task)
+            coalesced = use_cache and self._join_flight(task)
+            if not coalesced:
+                self.task_queue.put(task)
             self.active_tasks[task.id] = task
             self.stats["total_submitted"] += 1
             self.stats["queue_size"] = self.task_queue.qsize()
 
+        if coalesced:
+            logger.info(f"Task {task.id} coalesced with an identical in-flight task")
+            return task.id
         logger.info(f"Task {task.id} queued with priority {priority.name}")
 
         # Start orchestrator if not running
@@ -321,6 +393,265 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
 
         return task.id
 
+    async def submit_simulations(
+        self,
+        requests: List[SimulationRequest],
+        priority: Union[TaskPriority, List[TaskPriority]] = TaskPriority.NORMAL,
+        use_cache: Union[bool, List[bool]] = True,
+    ) -> List[str]:
+        """Submit many simulations with a single bulk cache lookup.
+
+        Args:
+            requests: Simulation requests
+            priority: Priority for all tasks, or one per request
+            use_cache: Whether to use cached results, for all or per request
+
+        Returns:
+            Task IDs in request order
+        """
+        if isinstance(priority, TaskPriority):
+            priority = [priority] * len(requests)
+        if isinstance(use_cache, bool):
+            use_cache = [use_cache] * len(requests)
+
+        max_retries = self.config.get("orchestration.retry_attempts", 3)
+        tasks = [
+            SimulationTask(request=request, priority=task_priority, max_retries=max_retries)
+            for request, task_priority in zip(requests, priority)
+        ]
+
+        cached_results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        lookup = [i for i, flag in enumerate(use_cache) if flag]
+        if lookup and self.cache.config.cache.enabled:
+            found = self.cache.get_cached_results_many(
+                [self._cache_key(tasks[i].request) for i in lookup],
+                clients=[tasks[i].request.client_id for i in lookup],
+            )
+            self._warm_start_lookup([tasks[i] for i in lookup], found)
+            self._failure_lookup([tasks[i] for i in lookup], found)
+            self._approximate_lookup([tasks[i] for i in lookup], found)
+            for i, cached in zip(lookup, found):
+                cached_results[i] = cached
+
+        missed = []
+        for task, cached, flag in zip(tasks, cached_results, use_cache):
+            if cached:
+                self._complete_from_cache(task, cached)
+            else:
+                missed.append((task, flag))
+
+        for task, flag in missed:
+            if flag:
+                self._hash_task(task)
+
+        queued = []
+        with self._lock:
+            for task, flag in missed:
+                if not (flag and self._join_flight(task)):
+                    self.task_queue.put(task)
+                    queued.append(task)
+                self.active_tasks[task.id] = task
+            self.stats["total_submitted"] += len(missed)
+            self.stats["queue_size"] = self.task_queue.qsize()
+
+        logger.info(
+            f"Submitted {len(tasks)} tasks: {len(tasks) - len(missed)} served "
+            f"from cache, {len(missed) - len(queued)} coalesced, {len(queued)} queued"
+        )
+
+        if queued and not self.is_running:
+            await self.start()
+
+        return [task.id for task in tasks]
+
+    def _hash_task(self, task: SimulationTask) -> str:
+        """Compute and remember a task's simulation hash.
+
+        Hashing may read the model file, so callers do it before taking
+        ``self._lock``.
+        """
+        if task.simulation_hash is None:
+            task.simulation_hash = self.cache.simulation_hash(
+                task.request.model_file, task.request.parameters
+            )
+        return task.simulation_hash
+
+    def _flight_key(self, task: SimulationTask) -> Tuple[Any, ...]:
+        """Identity of the simulation a task runs: its hash plus run settings.
+
+        The task must already be hashed (``_hash_task``).
+        """
+        return (
+            task.simulation_hash,
+            task.request.simulation_time,
+            tuple(task.request.output_variables),
+        )
+
+    def _join_flight(self, task: SimulationTask) -> bool:
+        """Attach a task to an identical queued or running task.
+
+        The first task for a point becomes its leader; later identical
+        submissions become followers that keep their own IDs and callbacks
+        and are finished with the leader's ``SimulationResult`` object (so
+        its ``task_id`` is the leader's) when it completes or fails. A
+        submission more urgent
+        than a still-queued leader is queued on its own instead (the cache
+        lease keeps the point from being simulated twice).
+
+        Called with ``self._lock`` held, after ``_hash_task``.
+
+        Returns:
+            True if the task was attached and must not be queued
+        """
+        if not self.coalesce:
+            return False
+        key = self._flight_key(task)
+        leader = self.inflight.get(key)
+        if leader is None or leader.status not in (
+            SimulationStatus.QUEUED,
+            SimulationStatus.RUNNING,
+        ):
+            self.inflight[key] = task
+            return False
+        if (
+            leader.status == SimulationStatus.QUEUED
+            and task.priority.value < leader.priority.value
+        ):
+            return False
+
+        task.status = leader.status
+        task.started_at = leader.started_at
+        leader.followers.append(task)
+        self.stats["total_coalesced"] += 1
+        return True
+
+    def _land_flight(self, leader: SimulationTask):
+        """Finish the tasks coalesced into ``leader`` with its outcome."""
+        if not leader.followers and not self.inflight:
+            return
+        self._hash_task(leader)
+        with self._lock:
+            key = self._flight_key(leader)
+            if self.inflight.get(key) is leader:
+                del self.inflight[key]
+            followers, leader.followers = leader.followers, []
+            finished = []
+            for follower in followers:
+                self.active_tasks.pop(follower.id, None)
+                self.completed_tasks[follower.id] = follower
+                if follower.status == SimulationStatus.CANCELLED:
+                    continue
+                follower.status = leader.status
+                follower.result = leader.result
+                follower.error = leader.error
+                follower.started_at = leader.started_at
+                follower.completed_at = leader.completed_at
+                finished.append(follower)
+
+                cached = leader.result is not None and leader.result.cached
+                if leader.status != SimulationStatus.COMPLETED:
+                    self.stats["total_failed"] += 1
+                    if cached:
+                        self.stats["total_cached_failures"] += 1
+                elif cached:
+                    self.stats["total_cached_hits"] += 1
+                    if leader.result.metadata.get("approximate"):
+                        self.stats["total_approximate_hits"] += 1
+                else:
+                    self.stats["total_completed"] += 1
+
+        saved = 0.0
+        if leader.status == SimulationStatus.COMPLETED and leader.result is not None:
+            saved = leader.result.execution_time
+        for follower in finished:
+            self.cache.stats.record_coalesced(
+                follower.request.model_file, follower.request.client_id, seconds_saved=saved
+            )
+            if follower.status == SimulationStatus.COMPLETED:
+                self._trigger_callbacks("on_task_completed", follower)
+            else:
+                self._trigger_callbacks("on_task_failed", follower)
+
+    @staticmethod
+    def _cache_key(request: SimulationRequest) -> Tuple[Any, ...]:
+        """Bulk cache lookup tuple for a request."""
+        return request.model_file, request.parameters, request.output_variables or None
+
+    def _warm_start_lookup(
+        self,
+        tasks: List[SimulationTask],
+        cached_results: List[Optional[Dict[str, Any]]],
+        use_bloom: bool = True,
+    ) -> None:
+        """Fill exact cache misses with warm-started results, in place.
+
+        Applies while ``cache.warm_start.enabled`` is on: such a request
+        would be warm-started if simulated, so a stored warm-started run
+        of the same point (flagged by ``metadata["warm_start"]``) serves it.
+        Tasks that must start cold (warm-up jobs, retries of a failed warm
+        start) are left alone.
+        """
+        if self.cache.states is None:
+            return
+        for i, task in enumerate(tasks):
+            if cached_results[i] or task.cold_start:
+                continue
+            try:
+                cached_results[i] = self.cache.get_cached_result(
+                    task.request.model_file,
+                    task.request.parameters,
+                    columns=task.request.output_variables or None,
+                    client=task.request.client_id,
+                    use_bloom=use_bloom,
+                    variant=WARM_START_VARIANT,
+                )
+            except Exception as e:
+                logger.warning(f"Warm-start cache lookup failed for task {task.id}: {e}")
+
+    def _failure_lookup(
+        self, tasks: List[SimulationTask], cached_results: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """Fill exact cache misses with recorded deterministic failures, in place.
+
+        A known failure is stored as ``{"failure": record}`` and fails the
+        task in ``_complete_from_cache`` without simulating it again.
+        """
+        for i, task in enumerate(tasks):
+            if cached_results[i]:
+                continue
+            try:
+                failure = self.cache.get_cached_failure(
+                    task.request.model_file, task.request.parameters, task.simulation_hash
+                )
+            except Exception as e:
+                logger.warning(f"Failure cache lookup failed for task {task.id}: {e}")
+                continue
+            if failure is not None:
+                cached_results[i] = {"failure": failure}
+
+    def _approximate_lookup(
+        self, tasks: List[SimulationTask], cached_results: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """Fill exact cache misses from neighboring results, in place.
+
+        Applies to requests with ``metadata["approximate"]`` set, or to all
+        requests when ``cache.approximate.enabled`` is on (a request can
+        opt out with ``metadata["approximate"] = False``).
+        """
+        default = self.cache.config.cache.approximate_enabled
+        for i, task in enumerate(tasks):
+            if cached_results[i] or not task.request.metadata.get("approximate", default):
+                continue
+            try:
+                cached_results[i] = self.cache.get_approximate_result(
+                    task.request.model_file,
+                    task.request.parameters,
+                    columns=task.request.output_variables or None,
+                )
+            except Exception as e:
+                # An approximation is optional; simulate instead
+                logger.warning(f"Approximate cache lookup failed for task {task.id}: {e}")
+
     async def get_task_status(self, task_id: str) -> Optional[SimulationTask]:
         """Get status of a specific task."""
         # Check active tasks
@@ -343,6 +674,28 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                     task.status = SimulationStatus.CANCELLED
                     del self.active_tasks[task_id]
                     self.completed_tasks[task_id] = task
+                    key = self._flight_key(task) if task.simulation_hash else None
+                    leader = self.inflight.get(key)
+                    if leader is not None and leader is not task:
+                        # A follower leaves its leader's flight
+                        leader.followers = [
+                            follower for follower in leader.followers if follower is not task
+                        ]
+                        return True
+                    waiting = [
+                        follower
+                        for follower in task.followers
+                        if follower.status == SimulationStatus.QUEUED
+                    ]
+                    task.followers = []
+                    if waiting:
+                        # The first follower takes over the simulation
+                        successor, *rest = waiting
+                        successor.followers = rest
+                        self.inflight[key] = successor
+                        self.task_queue.put(successor)
+                    elif leader is task:
+                        del self.inflight[key]
                     return True
                 elif task.status == SimulationStatus.RUNNING:
                     # Mark for cancellation - worker will check this
@@ -375,6 +728,9 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
         while self.is_processing_batch:
             await asyncio.sleep(0.1)
 
+        # Persist results still queued for write-behind
+        await asyncio.get_event_loop().run_in_executor(None, self.cache.flush)
+
         logger.info("Simulation orchestrator stopped")
 
     async def _orchestrator_loop(self):
@@ -393,6 +749,9 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                     await asyncio.sleep(0.1)
                     continue
 
+                # Top up the queue from warm-up jobs while it is idle
+                self._feed_warmup()
+
                 # Collect batch from priority queue
                 batch = []
                 max_batch = self.executor.batch_size if self.executor else self.batch_size
@@ -401,21 +760,40 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                     and not self.task_queue.empty()
                 ):
                     try:
-                        task = self.task_queue.get_nowait()
-
-                        # Check cache first (avoid simulation if cached)
+                        dequeued = []
+                        while (
+                            len(batch) + len(dequeued) < max_batch
+                            and not self.task_queue.empty()
+                        ):
+                            dequeued.append(self.task_queue.get_nowait())
+
+                        # Check cache first (avoid simulation if cached),
+                        # with one bulk lookup for everything dequeued
+                        cached_results = [None] * len(dequeued)
                         if self.cache.config.cache.enabled:
-                            cached = self.cache.get_cached_result(
-                                task.request.model_file, task.request.parameters
-                            )
-
+                            try:
+                                cached_results = self.cache.get_cached_results_many(
+                                    [self._cache_key(task.request) for task in dequeued],
+                                    clients=[task.request.client_id for task in dequeued],
+                                )
+                            except Exception as e:
+                                # Simulate rather than drop the dequeued tasks
+                                logger.error(f"Bulk cache lookup failed: {e}")
+                            self._warm_start_lookup(dequeued, cached_results)
+                            self._failure_lookup(dequeued, cached_results)
+                            self._approximate_lookup(dequeued, cached_results)
+
+                        for task, cached in zip(dequeued, cached_results):
                             if cached:
                                 # Serve from cache immediately
                                 self._complete_from_cache(task, cached)
-                                continue
-
-                        # Add to batch for simulation
-                        batch.append(task)
+                            elif self._claim_task(task):
+                                # Add to batch for simulation
+                                batch.append(task)
+                            else:
+                                # Another task or process is simulating the
+                                # same point; pick up its result instead
+                                asyncio.create_task(self._await_leased_result(task))
 
                     except Exception as e:
                         logger.error(f"Error dequeuing task: {e}")
@@ -444,13 +822,213 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
         except Exception as e:
             logger.error(f"Orchestrator loop error: {e}")
 
+    async def submit_warmup(
+        self,
+        model_file: str,
+        sweep: Dict[str, Any],
+        simulation_time: Optional[float] = None,
+        output_variables: Optional[List[str]] = None,
+    ) -> str:
+        """Warm the cache with a sweep of a model.
+
+        Points already cached (or recorded as deterministic failures) are
+        skipped; the rest are simulated at LOW priority, one batch at a
+        time and only while no other work is queued.
+
+        Args:
+            model_file: Path to PLECS model file
+            sweep: Sweep specification (``base``, ``grid`` and/or ``points``,
+                see ``expand_sweep``)
+            simulation_time: Simulation time for every point
+            output_variables: Signals to record for every point
+
+        Returns:
+            Warm-up job ID; progress is in ``get_orchestrator_stats()["warmup"]``
+        """
+        model_file = SimulationRequest(model_file=model_file).model_file
+        points = expand_sweep(sweep)
+        missing = list(range(len(points)))
+        if self.cache.config.cache.enabled:
+            missing = self.cache.missing_points(model_file, points)
+
+        job = WarmupJob(
+            model_file=model_file,
+            total_points=len(points),
+            cached_points=len(points) - len(missing),
+            pending=deque(points[i] for i in missing),
+            simulation_time=simulation_time,
+            output_variables=list(output_variables or []),
+        )
+        if not job.pending:
+            job.status = "completed"
+            job.finished_at = time.time()
+        with self._lock:
+            self.warmup_jobs[job.id] = job
+
+        logger.info(
+            f"Warm-up job {job.id}: {len(points)} points, "
+            f"{job.cached_points} already cached, {len(job.pending)} to simulate"
+        )
+
+        if job.pending and not self.is_running:
+            await self.start()
+        return job.id
+
+    def cancel_warmup(self, job_id: str) -> bool:
+        """Stop feeding a warm-up job; tasks already queued still run."""
+        with self._lock:
+            job = self.warmup_jobs.get(job_id)
+            if job is None or job.status != "running":
+                return False
+            job.pending.clear()
+            job.status = "cancelled"
+            job.finished_at = time.time()
+        return True
+
+    def _feed_warmup(self):
+        """Queue the next batch of warm-up points if the orchestrator is idle."""
+        if not self.executor or self.is_processing_batch or not self.task_queue.empty():
+            return
+        with self._lock:
+            job = next(
+                (job for job in self.warmup_jobs.values() if job.pending), None
+            )
+            if job is None:
+                return
+            tasks = []
+            max_retries = self.config.get("orchestration.retry_attempts", 3)
+            while job.pending and len(tasks) < self.executor.batch_size:
+                request = SimulationRequest(
+                    model_file=job.model_file,
+                    parameters=job.pending.popleft(),
+                    simulation_time=job.simulation_time,
+                    output_variables=list(job.output_variables),
+                    # Warming must store exact results
+                    metadata={"warmup_job": job.id, "approximate": False},
+                )
+                tasks.append(
+                    SimulationTask(
+                        request=request,
+                        priority=TaskPriority.LOW,
+                        max_retries=max_retries,
+                        cold_start=True,
+                    )
+                )
+            # Recorded now so the job does not look finished while unqueued
+            job.task_ids.extend(task.id for task in tasks)
+
+        for task in tasks:
+            self._hash_task(task)
+        with self._lock:
+            for task in tasks:
+                if not self._join_flight(task):
+                    self.task_queue.put(task)
+                self.active_tasks[task.id] = task
+            self.stats["total_submitted"] += len(tasks)
+
+    def _warmup_progress(self) -> Dict[str, Any]:
+        """Progress of every warm-up job, finishing jobs whose tasks are done.
+
+        Called with ``self._lock`` held.
+        """
+        jobs = []
+        for job in self.warmup_jobs.values():
+            statuses = [
+                self.completed_tasks[task_id].status
+                for task_id in job.task_ids
+                if task_id in self.completed_tasks
+            ]
+            completed = statuses.count(SimulationStatus.COMPLETED)
+            failed = statuses.count(SimulationStatus.FAILED)
+            if (
+                job.status == "running"
+                and not job.pending
+                and completed + failed == len(job.task_ids)
+            ):
+                job.status = "completed"
+                job.finished_at = time.time()
+            jobs.append(job.progress(completed, failed))
+
+        return {
+            "jobs": jobs,
+            "running": sum(1 for job in jobs if job["status"] == "running"),
+            "pending_points": sum(job["pending_points"] for job in jobs),
+        }
+
+    def _claim_task(self, task: SimulationTask) -> bool:
+        """Take the cache lease for a task about to be simulated.
+
+        Returns False if the lease is held elsewhere. Tasks that already
+        waited a full ``cache.lease_timeout`` are simulated regardless.
+        """
+        if not self.cache.config.cache.enabled or task.lease_timed_out:
+            return True
+        task.holds_lease = self.cache.acquire_lease(self._hash_task(task))
+        return task.holds_lease
+
+    async def _await_leased_result(self, task: SimulationTask):
+        """Wait for the lease holder of a task's hash, then re-check the cache.
+
+        The task is completed from the cache if the holder succeeded, failed
+        if the holder recorded a deterministic failure, and requeued
+        otherwise (or when ``cache.lease_timeout`` expires).
+        """
+        timeout = self.cache.config.cache.lease_timeout
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while self.cache.leases.is_held(task.simulation_hash):
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Task {task.id}: lease wait timed out, simulating locally"
+                )
+                task.lease_timed_out = True
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+        # The holder wrote the result after this process built its Bloom
+        # filter, so ask the backend directly
+        cached = self.cache.get_cached_result(
+            task.request.model_file,
+            task.request.parameters,
+            columns=task.request.output_variables or None,
+            client=task.request.client_id,
+            use_bloom=False,
+        )
+        found = [cached]
+        self._warm_start_lookup([task], found, use_bloom=False)
+        cached = found[0]
+        if not cached:
+            failure = self.cache.get_cached_failure(
+                task.request.model_file, task.request.parameters, task.simulation_hash
+            )
+            cached = {"failure": failure} if failure is not None else None
+        if cached:
+            self._complete_from_cache(task, cached)
+            return
+
+        with self._lock:
+            self.task_queue.put(task)
+            self.stats["queue_size"] = self.task_queue.qsize()
+
+    def _release_lease(self, task: SimulationTask):
+        """Release a task's cache lease if it holds one."""
+        if task.holds_lease:
+            self.cache.release_lease(task.simulation_hash)
+            task.holds_lease = False
+
     def _complete_from_cache(self, task: SimulationTask, cached_result: Dict[str, Any]):
         """Complete a task using cached result.
 
         Args:
             task: Simulation task
-            cached_result: Cached result dict with 'timeseries' and 'metadata'
+            cached_result: Cached result dict with 'timeseries' and 'metadata',
+                or a recorded deterministic failure under 'failure'
         """
+        if "failure" in cached_result:
+            self._fail_from_cache(task, cached_result["failure"])
+            return
+
         task.status = SimulationStatus.COMPLETED
         task.result = SimulationResult(
             task_id=task.id,
@@ -467,9 +1045,41 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                 del self.active_tasks[task.id]
             self.completed_tasks[task.id] = task
             self.stats["total_cached_hits"] += 1
+            if cached_result["metadata"].get("approximate"):
+                self.stats["total_approximate_hits"] += 1
 
         logger.info(f"Task {task.id} served from cache")
         self._trigger_callbacks("on_task_completed", task)
+        self._land_flight(task)
+
+    def _fail_from_cache(self, task: SimulationTask, failure: Dict[str, Any]):
+        """Fail a task with a recorded deterministic failure, without retries.
+
+        Args:
+            task: Simulation task
+            failure: Record from ``SimulationCache.get_cached_failure``
+        """
+        task.status = SimulationStatus.FAILED
+        task.error = failure["error"]
+        task.result = SimulationResult(
+            task_id=task.id,
+            success=False,
+            metadata={"failure_class": failure["failure_class"], "cached_failure": True},
+            error_message=failure["error"],
+            cached=True,
+        )
+        task.completed_at = time.time()
+
+        with self._lock:
+            if task.id in self.active_tasks:
+                del self.active_tasks[task.id]
+            self.completed_tasks[task.id] = task
+            self.stats["total_failed"] += 1
+            self.stats["total_cached_failures"] += 1
+
+        logger.info(f"Task {task.id} failed from cache ({failure['failure_class']})")
+        self._trigger_callbacks("on_task_failed", task)
+        self._land_flight(task)
 
     async def _execute_batch(self, tasks: List[SimulationTask]):
         """Execute a batch of tasks using PLECS native parallel API.
@@ -485,12 +1095,23 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                 task.status = SimulationStatus.RUNNING
                 task.started_at = time.time()
                 self._trigger_callbacks("on_task_started", task)
+                for follower in list(task.followers):
+                    if follower.status == SimulationStatus.QUEUED:
+                        follower.status = SimulationStatus.RUNNING
+                        follower.started_at = task.started_at
+                        self._trigger_callbacks("on_task_started", follower)
 
             self._trigger_callbacks("on_batch_started", tasks)
 
+            loop = asyncio.get_event_loop()
+
+            # Start from the closest stored steady state, if any; the state
+            # files are read off the event loop
+            if self.cache.states is not None:
+                await loop.run_in_executor(None, self._find_warm_starts, tasks)
+
             # Execute batch using PLECS native parallel API
             # This is where the magic happens - PLECS distributes work across CPU cores
-            loop = asyncio.get_event_loop()
             results = await loop.run_in_executor(
                 None, self.executor.execute_batch, tasks
             )
@@ -507,15 +1128,35 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
 
                 if result.success:
                     task.status = SimulationStatus.COMPLETED
+                    if result.metadata.get("warm_start"):
+                        with self._lock:
+                            self.stats["total_warm_starts"] += 1
+                    if self.cache.states is not None and task.final_state is not None:
+                        await loop.run_in_executor(
+                            None,
+                            self.cache.record_system_state,
+                            task.request.model_file,
+                            task.request.parameters,
+                            task.final_state,
+                            task.request.simulation_time,
+                        )
 
-                    # Cache result if successful
+                    # Cache result if successful; persisted in the background,
+                    # and the lease is released once it is indexed. A
+                    # warm-started run depends on the state it started from,
+                    # so it is stored under the warm-start key, not the
+                    # cold-start one.
                     if self.cache.config.cache.enabled:
-                        self.cache.cache_result(
+                        self.cache.enqueue_result(
                             task.request.model_file,
                             task.request.parameters,
                             result.timeseries_data,
                             result.metadata,
+                            execution_time=result.execution_time,
+                            client=task.request.client_id,
+                            variant=WARM_START_VARIANT if task.warm_start else None,
                         )
+                        task.holds_lease = False
 
                     # Move to completed
                     with self._lock:
@@ -525,6 +1166,7 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                         self.stats["total_completed"] += 1
 
                     self._trigger_callbacks("on_task_completed", task)
+                    self._land_flight(task)
 
                 else:
                     # Handle failure with retry logic
@@ -533,33 +1175,76 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
         except Exception as e:
             logger.error(f"Batch execution failed: {e}")
 
-            # Handle failure for all tasks in batch
+            # Handle failure for all tasks in batch; the error is not
+            # specific to any task's parameters, so never cache it
             for task in tasks:
-                await self._handle_task_failure(task, str(e))
+                await self._handle_task_failure(task, str(e), classify=False)
 
         finally:
             self.is_processing_batch = False
 
-    async def _handle_task_failure(self, task: SimulationTask, error_message: str):
+    def _find_warm_starts(self, tasks: List[SimulationTask]):
+        """Look up the stored state each task can start from (blocking I/O)."""
+        for task in tasks:
+            if task.cold_start:
+                continue
+            task.warm_start = self.cache.find_system_state(
+                task.request.model_file, task.request.parameters
+            )
+
+    async def _handle_task_failure(
+        self, task: SimulationTask, error_message: str, classify: bool = True
+    ):
         """Handle task failure with retry logic.
 
+        Deterministic failures (see ``cache.failures``) are recorded in the
+        cache and fail the task at once instead of being retried. A
+        warm-started run's failure may come from its initial state rather
+        than its parameters, so it is not recorded under the (cold-start)
+        simulation hash; the task is retried from a cold start instead.
+
         Args:
             task: Failed simulation task
             error_message: Error description
+            classify: Whether the error may be a deterministic failure of
+                this task's parameters
         """
         task.error = error_message
         task.retry_count += 1
+        self._release_lease(task)
 
-        if task.retry_count < task.max_retries:
+        warm = task.warm_start is not None
+        if warm:
+            task.warm_start = None
+            task.cold_start = True
+
+        failure = None
+        if classify and not warm:
+            try:
+                failure = self.cache.record_failure(
+                    task.request.model_file,
+                    task.request.parameters,
+                    error_message,
+                    task.simulation_hash,
+                )
+            except Exception as e:
+                logger.warning(f"Could not record failure of task {task.id}: {e}")
+
+        if warm or (failure is None and task.retry_count < task.max_retries):
             # Retry task
             logger.info(
                 f"Retrying task {task.id} (attempt {task.retry_count + 1}/{task.max_retries})"
+                + (" from a cold start" if warm else "")
             )
             task.status = SimulationStatus.QUEUED
+            for follower in task.followers:
+                if follower.status == SimulationStatus.RUNNING:
+                    follower.status = SimulationStatus.QUEUED
 
-            # Add delay before retry
-            retry_delay = self.config.get("orchestration.retry_delay", 5)
-            await asyncio.sleep(retry_delay)
+            # Add delay before retrying a possibly transient failure
+            if not warm:
+                retry_delay = self.config.get("orchestration.retry_delay", 5)
+                await asyncio.sleep(retry_delay)
 
             with self._lock:
                 self.task_queue.put(task)
@@ -575,9 +1260,16 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
                 self.stats["total_failed"] += 1
 
             self._trigger_callbacks("on_task_failed", task)
-            logger.error(
-                f"Task {task.id} failed after {task.max_retries} retries: {error_message}"
-            )
+            self._land_flight(task)
+            if failure is not None:
+                logger.error(
+                    f"Task {task.id} failed deterministically "
+                    f"({failure['failure_class']}): {error_message}"
+                )
+            else:
+                logger.error(
+                    f"Task {task.id} failed after {task.max_retries} retries: {error_message}"
+                )
 
     def get_orchestrator_stats(self) -> Dict[str, Any]:
         """Get orchestrator statistics.
@@ -585,6 +1277,9 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
         Returns:
             Dict with orchestrator, batch executor, and cache statistics
         """
+        # Cache statistics have their own lock; don't hold ours while reading
+        cache_stats = self.cache.get_cache_stats()
+
         with self._lock:
             executor_stats = {
                 "batch_size": self.executor.batch_size if self.executor else 0,
@@ -602,8 +1297,10 @@ class SimulationOrchestrator(SimulationOrchestratorBase):
 
             return {
                 **self.stats,
+                "inflight": len(self.inflight),
                 "executor": executor_stats,
-                "cache_stats": self.cache.get_cache_stats(),
+                "warmup": self._warmup_progress(),
+                "cache_stats": cache_stats,
             }
 
     async def wait_for_completion(
@@ -0,0 +1,98 @@
+"""Cache warming jobs built from sweep specifications.
+
+A warm-up job takes a model and a sweep (a parameter grid, a list of
+operating points, or both), drops the points that are already cached and
+feeds the rest to the orchestrator as LOW priority tasks, one batch at a
+time and only while the queue is otherwise empty, so warming never delays
+interactive requests.
+"""
+
+import itertools
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+
+def _grid_values(spec: Any) -> List[Any]:
+    """Values of one grid axis: a list, or ``{"start", "stop", "num"}``."""
+    if isinstance(spec, dict):
+        values = np.linspace(float(spec["start"]), float(spec["stop"]), int(spec["num"]))
+        return [float(value) for value in values]
+    if isinstance(spec, (list, tuple)):
+        return list(spec)
+    return [spec]
+
+
+def expand_sweep(sweep: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Expand a sweep specification into parameter points.
+
+    Args:
+        sweep: Mapping with any of
+            ``base``: parameters shared by every point,
+            ``grid``: ``{name: values}`` expanded as a Cartesian product,
+            where values is a list or ``{"start", "stop", "num"}``,
+            ``points``: explicit operating points (parameter dicts)
+
+    Returns:
+        Distinct parameter points, grid points first
+    """
+    unknown = set(sweep) - {"base", "grid", "points"}
+    if unknown:
+        raise ValueError(f"Unknown sweep keys: {sorted(unknown)}")
+
+    base = dict(sweep.get("base") or {})
+    grid = sweep.get("grid") or {}
+    points: List[Dict[str, Any]] = []
+    if grid:
+        names = list(grid)
+        for values in itertools.product(*(_grid_values(grid[name]) for name in names)):
+            points.append({**base, **dict(zip(names, values))})
+    for point in sweep.get("points") or []:
+        points.append({**base, **point})
+    if not points and base:
+        points.append(base)
+
+    distinct = {}
+    for point in points:
+        distinct.setdefault(repr(sorted(point.items())), point)
+    return list(distinct.values())
+
+
+@dataclass
+class WarmupJob:
+    """A model's sweep being simulated into the cache."""
+
+    model_file: str
+    total_points: int
+    cached_points: int
+    pending: Deque[Dict[str, Any]] = field(default_factory=deque)
+    simulation_time: Optional[float] = None
+    output_variables: List[str] = field(default_factory=list)
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = "running"
+    task_ids: List[str] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def progress(self, completed: int, failed: int) -> Dict[str, Any]:
+        """Progress summary given the number of finished job tasks."""
+        to_simulate = self.total_points - self.cached_points
+        done = completed + failed
+        return {
+            "id": self.id,
+            "model_file": self.model_file,
+            "status": self.status,
+            "total_points": self.total_points,
+            "cached_points": self.cached_points,
+            "pending_points": len(self.pending),
+            "submitted": len(self.task_ids),
+            "completed": completed,
+            "failed": failed,
+            "progress": done / to_simulate if to_simulate else 1.0,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
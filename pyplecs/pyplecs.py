@@ -56,6 +56,11 @@ def dict_to_plecs_opts(varin: dict):
     return opts
 
 
+# Option-struct field carrying a run's initial system state, and result
+# field carrying its final state (the model's InitialState/SystemState)
+SYSTEM_STATE_FIELD = "SystemState"
+
+
 # DEPRECATED: File-based variant generation removed in v1.0.0
 # Use PLECS native ModelVars instead: server.simulate(parameters={"Vi": 12.0, "Vo": 5.0})
 # See migration guide for examples.
@@ -332,7 +337,7 @@ class PlecsServer(SimulationServer):
         if load:
             self.server.plecs.load(self.sim_path + "//" + self.sim_name)
 
-    def simulate(self, parameters=None):
+    def simulate(self, parameters=None, initial_state=None):
         """Run simulation with optional ModelVars parameters.
 
         This is the primary simulation method. It handles parameter conversion
@@ -341,6 +346,9 @@ class PlecsServer(SimulationServer):
         Args:
             parameters: Dict of model variables (e.g., {"Vi": 12.0, "Vo": 5.0})
                        If None, runs simulation with default model parameters.
+            initial_state: System state to start from (e.g. the final
+                       ``SystemState`` of an earlier run) instead of the
+                       model's initial state
 
         Returns:
             Simulation results from PLECS (structure depends on model outputs)
@@ -348,14 +356,16 @@ class PlecsServer(SimulationServer):
         Example:
             results = server.simulate({"Vi": 250, "Vo_ref": 25})
         """
-        if parameters is None:
+        if parameters is None and initial_state is None:
             return self.server.plecs.simulate(self.modelName)
 
         # Convert parameters to PLECS ModelVars format
-        opts = dict_to_plecs_opts(parameters)
+        opts = dict_to_plecs_opts(parameters or {})
+        if initial_state is not None:
+            opts[SYSTEM_STATE_FIELD] = initial_state
         return self.server.plecs.simulate(self.modelName, opts)
 
-    def simulate_batch(self, parameter_list):
+    def simulate_batch(self, parameter_list, initial_states=None):
         """Run batch simulations using PLECS native parallel API.
 
         CRITICAL: This leverages PLECS' native parallel execution.
@@ -367,6 +377,8 @@ class PlecsServer(SimulationServer):
         Args:
             parameter_list: List of parameter dicts
                            e.g., [{"Vi": 12.0}, {"Vi": 24.0}, {"Vi": 48.0}]
+            initial_states: Optional system state per parameter set (None
+                           entries start from the model's initial state)
 
         Returns:
             List of simulation results (one per parameter set)
@@ -377,6 +389,9 @@ class PlecsServer(SimulationServer):
             # PLECS runs these in parallel across available CPU cores
         """
         opt_structs = [dict_to_plecs_opts(params) for params in parameter_list]
+        for opts, state in zip(opt_structs, initial_states or []):
+            if state is not None:
+                opts[SYSTEM_STATE_FIELD] = state
         return self.server.plecs.simulate(self.modelName, opt_structs)
 
     def run_sim_with_mat_file(self, mat_file_path):
@@ -11,6 +11,7 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from ..cache.stats import CacheStats
 from ..config import get_config
 
 logger = logging.getLogger(__name__)
@@ -115,32 +116,17 @@ def create_web_app():
 
     @app.get("/api/cache/stats")
     async def get_cache_stats():
-        """Get cache statistics."""
+        """Get cache statistics persisted by the running cache."""
         try:
             config = get_config()
             cache_dir = config.cache.directory
 
-            import os
-
-            total_entries = 0
-            total_size = 0
-
-            if os.path.exists(cache_dir):
-                for root, _, files in os.walk(cache_dir):
-                    total_entries += len(files)
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        try:
-                            total_size += os.path.getsize(file_path)
-                        except OSError:
-                            continue
-
-            return {
-                "total_entries": total_entries,
-                "total_size_bytes": total_size,
-                "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "cache_directory": cache_dir,
+            stats = CacheStats.read_snapshot(cache_dir) or {
+                "total_entries": 0,
+                "total_size_bytes": 0,
+                "total_size_mb": 0.0,
             }
+            return {**stats, "cache_directory": cache_dir}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -41,6 +41,7 @@ setup(
             'pyplecs-gui=pyplecs.webgui:main',
             'pyplecs-mcp=pyplecs.mcp:main',
             'pyplecs-setup=pyplecs.cli.installer:main',
+            'pyplecs-cache=pyplecs.cli.cache:main',
         ],
     },
     classifiers=[
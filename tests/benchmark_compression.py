@@ -0,0 +1,116 @@
+"""Disk footprint benchmarks for cached waveform codecs.
+
+Waveforms are synthesized to match the bundled ``data/*.plecs`` models
+(switching frequency, sample time and input voltage from their
+initialization commands), then stored with each codec setting. Run with
+``pytest tests/benchmark_compression.py -s`` to see the table.
+"""
+
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pyplecs.cache.codecs import CodecSettings, decode_table, encode_table, parquet_options
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+SETTINGS = {
+    "snappy (previous default)": None,
+    "zstd + byte_stream_split": CodecSettings(compression="zstd", compression_level=3),
+    "zstd + float32": CodecSettings(
+        compression="zstd", float32_columns=["Vsw", "IL", "Vo", "Iin"]
+    ),
+    "zstd + quantize 1 mV/mA": CodecSettings(
+        compression="zstd",
+        quantize_columns={"Vsw": 1e-3, "IL": 1e-3, "Vo": 1e-3, "Iin": 1e-3},
+    ),
+}
+
+
+def _init_value(text: str, name: str, default: float) -> float:
+    """Read a scalar assignment from a model's initialization commands."""
+    match = re.search(rf"\b{name}\s*=\s*([0-9.eE+-]+)", text)
+    try:
+        return float(match.group(1)) if match else default
+    except ValueError:
+        return default
+
+
+def synthesize_waveform(model_file: Path, duration: float = 20e-3) -> pd.DataFrame:
+    """Build a converter-like waveform for one bundled model."""
+    # Initialization commands are stored as concatenated string literals
+    text = model_file.read_text(errors="ignore").replace('"\n"', "")
+    fs = _init_value(text, "fs", 100e3)
+    dt = _init_value(text, "dt", 1e-6)
+    vi = _init_value(text, "Vi", 24.0)
+
+    t = np.arange(0.0, duration, dt)
+    duty = 0.5
+    phase = (t * fs) % 1.0
+    on = phase < duty
+    settle = 1.0 - np.exp(-t / (duration / 5))
+
+    ripple = np.where(on, phase / duty, (1.0 - phase) / (1.0 - duty)) - 0.5
+    il = 2.0 * settle + 0.4 * ripple
+    vo = vi * duty * settle + 0.05 * np.cumsum(ripple) * dt * fs
+    return pd.DataFrame(
+        {
+            "Time": t,
+            "Vsw": np.where(on, vi, -0.05) + 1e-3 * np.sin(2e6 * np.pi * t),
+            "IL": il,
+            "Vo": vo,
+            "Iin": np.where(on, il, 0.0),
+        }
+    )
+
+
+def write(table: pa.Table, settings, path: Path) -> float:
+    """Write ``table`` with ``settings`` and return the elapsed seconds."""
+    start = time.perf_counter()
+    if settings is None:
+        pq.write_table(table, path, compression="snappy")
+    else:
+        encoded = encode_table(table, settings)
+        pq.write_table(encoded, path, **parquet_options(encoded, settings))
+    return time.perf_counter() - start
+
+
+class TestCompressionFootprint:
+    """Benchmark codec settings on waveforms shaped like the bundled models."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("model_file", sorted(DATA_DIR.glob("*.plecs")), ids=lambda p: p.stem)
+    def test_codec_footprint(self, model_file, tmp_path):
+        """Float-aware codecs must beat snappy and honor their error bounds."""
+        data = synthesize_waveform(model_file)
+        table = pa.Table.from_pandas(data, preserve_index=False)
+
+        sizes = {}
+        print(f"\n{model_file.stem}: {len(data)} rows x {len(data.columns)} columns")
+        for label, settings in SETTINGS.items():
+            path = tmp_path / f"{len(sizes)}.parquet"
+            elapsed = write(table, settings, path)
+            sizes[label] = path.stat().st_size
+
+            restored = decode_table(pq.read_table(path)).to_pandas()
+            error = (restored - data).abs().max().max()
+            print(
+                f"  {label:28s} {sizes[label] / 1024:9.1f} KiB "
+                f"{elapsed * 1000:7.1f} ms  max error {error:.2e}"
+            )
+
+            if settings is not None:
+                bound = max(settings.quantize_columns.values(), default=0.0)
+                if settings.float32_columns:
+                    bound = max(bound, 1e-5 * data.abs().max().max())
+                assert error <= bound + 1e-12
+
+        baseline = sizes["snappy (previous default)"]
+        assert sizes["zstd + byte_stream_split"] < baseline
+        assert sizes["zstd + quantize 1 mV/mA"] < sizes["zstd + byte_stream_split"]
@@ -0,0 +1,50 @@
+"""Shared fixtures for the cache and orchestrator tests."""
+
+import pandas as pd
+import pytest
+import yaml
+
+from pyplecs import config as config_module
+from pyplecs.config import ConfigManager
+
+
+def _write_config(tmp_path, cache_type="sqlite", **cache_options):
+    """Write a minimal config whose cache lives under tmp_path."""
+    cache_section = {
+        "enabled": True,
+        "type": cache_type,
+        "directory": (tmp_path / "cache").as_posix(),
+        "ttl": 3600,
+        "gc": {"interval": 0},
+    }
+    cache_section.update(cache_options)
+
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(yaml.safe_dump({"cache": cache_section}))
+    return str(config_path)
+
+
+@pytest.fixture
+def use_config(tmp_path, monkeypatch):
+    """Install a temporary global config; returns a factory taking overrides."""
+
+    def _install(cache_type="sqlite", **cache_options):
+        manager = ConfigManager(_write_config(tmp_path, cache_type, **cache_options))
+        monkeypatch.setattr(config_module, "_config_manager", manager)
+        return manager
+
+    return _install
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    """Create a dummy PLECS model file."""
+    path = tmp_path / "model.plecs"
+    path.write_text("Plecs { Name \"model\" }")
+    return str(path)
+
+
+@pytest.fixture
+def waveform():
+    """Small two-signal waveform."""
+    return pd.DataFrame({"Time": [0.0, 1e-6, 2e-6], "Vo": [0.0, 5.0, 10.0]})
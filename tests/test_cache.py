@@ -0,0 +1,1523 @@
+"""Tests for the simulation cache backends and result store."""
+
+import hashlib
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+from pyplecs.cache import SimulationCache, SqliteCacheBackend, UnsupportedCacheBackend, maintenance
+from pyplecs.cache.bloom import BloomFilter
+from pyplecs.cache.bundle import read_manifest
+from pyplecs.cache.chunks import split_column
+from pyplecs.cache.codecs import CodecSettings, column_codecs, decode_table, encode_table
+from pyplecs.cache.failures import FailureClass, FailureStore, classify_failure, failure_classes
+from pyplecs.cache.locking import LeaseManager, atomic_write
+from pyplecs.cache.relevance import referenced_names
+from pyplecs.cache.stats import CacheStats
+from pyplecs.cache.timeaxis import (
+    TIME_AXIS_METADATA_KEY,
+    detect_segments,
+    expand_segments,
+    window_rows,
+)
+from pyplecs.cli import cache as cache_cli
+from pyplecs.core.models import SimulationRequest, SimulationStatus
+from pyplecs.orchestration import SimulationOrchestrator, SimulationTask, TaskPriority
+from pyplecs.orchestration.warmup import expand_sweep
+
+
+class TestSqliteCacheBackend:
+    """Test suite for SqliteCacheBackend."""
+
+    def test_roundtrip_and_counters(self, tmp_path):
+        backend = SqliteCacheBackend(str(tmp_path))
+        backend.set("k1", {"model_file": "m.plecs", "parameters": {"Vi": 12.0}})
+
+        assert backend.exists("k1")
+        assert backend.get("k1")["parameters"] == {"Vi": 12.0}
+        backend.get("k1")
+
+        entry = backend.query()[0]
+        assert entry["key"] == "k1"
+        assert entry["access_count"] == 2
+        backend.close()
+
+    def test_expired_entries_are_hidden(self, tmp_path):
+        backend = SqliteCacheBackend(str(tmp_path))
+        backend.set("k1", {"parameters": {}}, ttl=-1)
+
+        assert not backend.exists("k1")
+        assert backend.get("k1") is None
+        assert backend.query() == []
+        backend.close()
+
+    def test_parameter_range_query(self, tmp_path):
+        backend = SqliteCacheBackend(str(tmp_path))
+        for i, vi in enumerate([5.0, 12.0, 24.0, 48.0]):
+            backend.set(f"k{i}", {"model_fingerprint": "fp", "parameters": {"Vi": vi}})
+
+        keys = [e["key"] for e in backend.query(parameter_ranges={"Vi": (10, 30)})]
+        assert keys == ["k1", "k2"]
+        assert backend.query(model_fingerprint="other") == []
+        backend.close()
+
+    def test_persists_across_connections(self, tmp_path):
+        backend = SqliteCacheBackend(str(tmp_path))
+        backend.set("k1", {"parameters": {}})
+        backend.close()
+
+        reopened = SqliteCacheBackend(str(tmp_path))
+        assert reopened.exists("k1")
+        reopened.clear()
+        assert not reopened.exists("k1")
+        reopened.close()
+
+
+class TestSimulationCache:
+    """Test suite for SimulationCache."""
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_cache_roundtrip(self, use_config, model_file, waveform, cache_type):
+        use_config(cache_type)
+        cache = SimulationCache()
+        params = {"Vi": 12.0}
+
+        assert cache.get_cached_result(model_file, params) is None
+        sim_hash = cache.cache_result(model_file, params, waveform, {"note": "x"})
+        assert sim_hash
+
+        cached = cache.get_cached_result(model_file, params)
+        pd.testing.assert_frame_equal(cached["timeseries"], waveform)
+        assert cached["metadata"] == {"note": "x"}
+        cache.close()
+
+    def test_query_entries_by_model(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        for vi in (12.0, 24.0, 48.0):
+            cache.cache_result(model_file, {"Vi": vi}, waveform, {})
+
+        entries = cache.query_entries(model_file, parameter_ranges={"Vi": (20, None)})
+        assert sorted(e["parameters"]["Vi"] for e in entries) == [24.0, 48.0]
+        assert all(e["size_bytes"] > 0 for e in entries)
+        cache.close()
+
+    def test_file_cache_is_imported_into_new_sqlite_index(self, use_config, model_file, waveform):
+        use_config("file")
+        cache = SimulationCache()
+        for vi in (12.0, 24.0):
+            cache.cache_result(model_file, {"Vi": vi}, waveform, {})
+        cache.close()
+
+        use_config("sqlite")
+        cache = SimulationCache()
+        assert cache.backend.imported == 2
+        pd.testing.assert_frame_equal(
+            cache.get_cached_result(model_file, {"Vi": 24.0})["timeseries"], waveform
+        )
+        assert cache.get_cache_stats()["total_entries"] == 2
+        assert len(cache.query_entries(model_file, parameter_ranges={"Vi": (20, None)})) == 1
+        cache.close()
+
+        reopened = SimulationCache()
+        assert reopened.backend.imported == 0
+        reopened.close()
+
+
+class TestCacheGarbageCollector:
+    """Test suite for TTL and size-bound enforcement."""
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_expired_results_are_misses_and_collected(
+        self, use_config, model_file, waveform, cache_type
+    ):
+        use_config(cache_type, ttl=-1)
+        cache = SimulationCache()
+        sim_hash = cache.cache_result(model_file, {"Vi": 12.0}, waveform, {})
+        results_dir = cache.result_store.storage_dir
+
+        assert cache.get_cached_result(model_file, {"Vi": 12.0}) is None
+        assert list(results_dir.glob(f"{sim_hash}*"))
+
+        assert cache.gc.step()["expired"] == 1
+        assert not list(results_dir.glob(f"{sim_hash}*"))
+        cache.close()
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_lru_eviction_keeps_recently_used(
+        self, use_config, model_file, waveform, cache_type
+    ):
+        use_config(cache_type)
+        cache = SimulationCache()
+        for vi in (1.0, 2.0, 3.0):
+            cache.cache_result(model_file, {"Vi": vi}, waveform, {})
+            time.sleep(0.02)
+        cache.get_cached_result(model_file, {"Vi": 1.0})
+
+        # Budget for a single entry: the two least recently used must go
+        cache.gc.max_size_bytes = cache.stats.total_bytes // 3 + 1
+        cache.gc.low_watermark = 1.0
+        assert cache.gc.step()["evicted"] == 2
+
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is not None
+        assert cache.get_cached_result(model_file, {"Vi": 2.0}) is None
+        assert cache.get_cached_result(model_file, {"Vi": 3.0}) is None
+        cache.close()
+
+    def test_cost_policy_keeps_expensive_results(self, use_config, model_file, waveform):
+        use_config("sqlite", max_size_mb=1e-9, gc={"interval": 0, "eviction_policy": "cost"})
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {}, execution_time=120.0)
+        cache.cache_result(model_file, {"Vi": 2.0}, waveform, {}, execution_time=0.1)
+
+        candidates = cache.backend.eviction_candidates("cost", 10, cost_weight=3600.0)
+        assert [cache.backend.get(k)["parameters"]["Vi"] for k in candidates] == [2.0, 1.0]
+        cache.close()
+
+
+class TestCacheStats:
+    """Test suite for incrementally maintained statistics."""
+
+    def test_counters_track_writes_hits_and_evictions(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        sim_hash = cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})  # overwrite
+        cache.cache_result(model_file, {"Vi": 2.0}, waveform, {})
+        cache.get_cached_result(model_file, {"Vi": 1.0})
+        cache.get_cached_result(model_file, {"Vi": 3.0})
+
+        stats = cache.get_cache_stats()
+        assert stats["total_entries"] == 2
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["per_model"][model_file]["entries"] == 2
+        assert stats["total_size_bytes"] == stats["per_model"][model_file]["bytes"] > 0
+
+        cache.evict(sim_hash)
+        stats = cache.get_cache_stats()
+        assert stats["total_entries"] == 1
+        assert stats["evictions"] == 1
+        cache.close()
+
+    def test_counters_persist_across_restarts(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        cache.get_cached_result(model_file, {"Vi": 1.0})
+        cache.close()
+
+        reopened = SimulationCache()
+        stats = reopened.get_cache_stats()
+        assert stats["total_entries"] == 1
+        assert stats["hits"] == 1
+        reopened.close()
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_missing_stats_are_rebuilt_from_backend(
+        self, use_config, model_file, waveform, cache_type
+    ):
+        use_config(cache_type)
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        cache.cache_result(model_file, {"Vi": 2.0}, waveform, {})
+        expected = cache.get_cache_stats()["total_size_bytes"]
+        cache.close()
+        cache.stats.path.unlink()
+
+        rebuilt = SimulationCache()
+        stats = rebuilt.get_cache_stats()
+        assert stats["total_entries"] == 2
+        assert stats["total_size_bytes"] == expected
+        rebuilt.close()
+
+    def test_flushes_from_two_processes_are_merged(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        first = SimulationCache()
+        second = SimulationCache()
+        first.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        second.cache_result(model_file, {"Vi": 2.0}, waveform, {})
+        first.get_cached_result(model_file, {"Vi": 1.0})
+        second.get_cached_result(model_file, {"Vi": 3.0})
+        first.close()
+        second.close()
+
+        persisted = CacheStats.read_snapshot(first.config.cache.directory)
+        assert persisted["total_entries"] == 2
+        assert persisted["hits"] == 1 and persisted["misses"] == 1
+        assert persisted["per_model"][model_file]["entries"] == 2
+
+    def test_stale_totals_are_rebuilt_on_open(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        cache.stats.flush()
+        # Simulate a crash: the second write never reaches stats.json
+        cache.cache_result(model_file, {"Vi": 2.0}, waveform, {})
+        cache.stats._dirty = False
+        cache.close()
+
+        reopened = SimulationCache()
+        stats = reopened.get_cache_stats()
+        assert stats["total_entries"] == 2
+        assert (2, stats["total_size_bytes"]) == reopened.backend.size_totals()
+        reopened.close()
+
+    def test_size_budget_counts_entries_of_other_processes(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        first = SimulationCache()
+        second = SimulationCache()
+        for vi in (1.0, 2.0, 3.0):
+            second.cache_result(model_file, {"Vi": vi}, waveform, {})
+
+        _, total_bytes = first.backend.size_totals()
+        first.gc.max_size_bytes = total_bytes // 3 + 1
+        first.gc.low_watermark = 1.0
+        assert first.gc.step()["evicted"] == 2
+        first.close()
+        second.close()
+
+    def test_usage_counters_per_model_and_client(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        key = cache.cache_result(model_file, {"Vi": 1.0}, waveform, {}, execution_time=2.5, client="ci")
+        cache.get_cached_result(model_file, {"Vi": 1.0}, client="alice")
+        cache.get_cached_results_many(
+            [(model_file, {"Vi": 1.0}), (model_file, {"Vi": 9.0})], clients=["alice", "bob"]
+        )
+        cache.get_cached_result(model_file, {"Vi": 9.0})
+        cache.evict(key)
+        cache.close()
+
+        reopened = SimulationCache()
+        stats = reopened.get_cache_stats()
+        reopened.close()
+        model = stats["per_model"][model_file]
+        assert model["entries"] == 0 and model["evictions"] == 1
+        assert model["hits"] == 2 and model["misses"] == 2 and model["hit_rate"] == 0.5
+        assert model["seconds_saved"] == pytest.approx(5.0)
+        assert model["bytes_read"] == 2 * model["bytes_written"] > 0
+        clients = stats["per_client"]
+        assert clients["alice"]["hits"] == 2 and clients["alice"]["hit_rate"] == 1.0
+        assert clients["bob"]["misses"] == 1 and clients["bob"]["hit_rate"] == 0.0
+        assert clients["ci"]["bytes_written"] > 0 and clients["ci"]["evictions"] == 1
+
+
+class TestArrowResultFormat:
+    """Test suite for the memory-mapped Arrow IPC timeseries format."""
+
+    def test_roundtrip_returns_zero_copy_views(self, use_config, model_file):
+        use_config("sqlite", storage={"timeseries_format": "arrow"})
+        cache = SimulationCache()
+        waveform = pd.DataFrame({"Time": [i * 1e-6 for i in range(1000)], "Vo": [5.0] * 1000})
+        sim_hash = cache.cache_result(model_file, {"Vi": 12.0}, waveform, {})
+
+        assert (cache.result_store.storage_dir / f"{sim_hash}.arrow").exists()
+        cached = cache.get_cached_result(model_file, {"Vi": 12.0})
+        pd.testing.assert_frame_equal(cached["timeseries"], waveform)
+        assert not cached["timeseries"]["Vo"].to_numpy().flags["OWNDATA"]
+
+        table = cache.result_store.load_table(sim_hash)
+        assert table.column_names == ["Time", "Vo"]
+        cache.close()
+
+
+class TestColumnProjection:
+    """Test suite for column-projected cache reads."""
+
+    @pytest.mark.parametrize("ts_format", ["parquet", "arrow", "hdf5", "csv"])
+    def test_only_requested_columns_are_returned(self, use_config, model_file, ts_format):
+        if ts_format == "hdf5":
+            pytest.importorskip("tables")
+        use_config("sqlite", storage={"timeseries_format": ts_format})
+        cache = SimulationCache()
+        waveform = pd.DataFrame(
+            {"Time": [0.0, 1e-6], "Vo": [0.0, 5.0], "IL": [0.0, 1.0], "Vin": [24.0, 24.0]}
+        )
+        cache.cache_result(model_file, {"Vi": 24.0}, waveform, {})
+
+        cached = cache.get_cached_result(model_file, {"Vi": 24.0}, columns=["IL", "missing"])
+        assert list(cached["timeseries"].columns) == ["Time", "IL"]
+
+        full = cache.get_cached_result(model_file, {"Vi": 24.0})
+        assert list(full["timeseries"].columns) == ["Time", "Vo", "IL", "Vin"]
+        cache.close()
+
+
+class TestTimeWindowReads:
+    """Test suite for time-window predicate pushdown."""
+
+    @pytest.fixture
+    def long_waveform(self):
+        """1000 samples at 1 us spacing."""
+        times = [i * 1e-6 for i in range(1000)]
+        return pd.DataFrame({"Time": times, "Vo": [float(i) for i in range(1000)]})
+
+    @pytest.mark.parametrize("ts_format", ["parquet", "arrow", "csv"])
+    def test_window_returns_only_samples_inside(
+        self, use_config, model_file, long_waveform, ts_format
+    ):
+        use_config("sqlite", storage={"timeseries_format": ts_format, "row_group_size": 100})
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 12.0}, long_waveform, {})
+
+        cached = cache.get_cached_result(
+            model_file, {"Vi": 12.0}, columns=["Vo"], t_start=250e-6, t_end=259.5e-6
+        )
+        expected = long_waveform.iloc[250:260].reset_index(drop=True)
+        pd.testing.assert_frame_equal(cached["timeseries"], expected)
+        cache.close()
+
+    def test_parquet_skips_row_groups_outside_window(
+        self, use_config, model_file, long_waveform
+    ):
+        use_config("sqlite", storage={"row_group_size": 100, "implicit_time": False})
+        cache = SimulationCache()
+        sim_hash = cache.cache_result(model_file, {"Vi": 12.0}, long_waveform, {})
+
+        store = cache.result_store
+        metadata = pq.ParquetFile(store.storage_dir / f"{sim_hash}.parquet").metadata
+        assert metadata.num_row_groups == 10
+        assert store._overlapping_row_groups(metadata, "Time", 250e-6, 420e-6) == [2, 3, 4]
+        assert store._overlapping_row_groups(metadata, "Time", 2.0, None) == []
+        cache.close()
+
+    def test_unsorted_input_is_stored_sorted(self, use_config, model_file, long_waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        shuffled = long_waveform.sample(frac=1.0, random_state=0)
+        cache.cache_result(model_file, {"Vi": 12.0}, shuffled, {})
+
+        cached = cache.get_cached_result(model_file, {"Vi": 12.0}, t_end=9e-6)
+        assert cached["timeseries"]["Vo"].tolist() == [float(i) for i in range(10)]
+        cache.close()
+
+
+class TestBloomFilter:
+    """Test suite for the miss fast path."""
+
+    def test_no_false_negatives_and_bounded_fp_rate(self):
+        bloom = BloomFilter(capacity=1000, fp_rate=0.01)
+        keys = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(2000)]
+        bloom.update(keys[:1000])
+
+        assert all(key in bloom for key in keys[:1000])
+        false_positives = sum(key in bloom for key in keys[1000:])
+        assert false_positives < 50
+        assert bloom.get_stats()["estimated_fp_rate"] < 0.05
+
+    def test_definite_misses_skip_the_backend(
+        self, use_config, model_file, waveform, monkeypatch
+    ):
+        use_config("sqlite")
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+
+        def fail(key):
+            raise AssertionError("backend consulted for a definite miss")
+
+        monkeypatch.setattr(cache.backend, "get", fail)
+        assert cache.get_cached_result(model_file, {"Vi": 2.0}) is None
+        assert cache.get_cache_stats()["bloom"]["skipped_lookups"] == 1
+        cache.close()
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_filter_is_rebuilt_from_backend(
+        self, use_config, model_file, waveform, cache_type
+    ):
+        use_config(cache_type)
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        cache.close()
+
+        reopened = SimulationCache()
+        assert reopened.get_cached_result(model_file, {"Vi": 1.0}) is not None
+        assert reopened.get_cache_stats()["bloom"]["keys_added"] == 1
+        reopened.close()
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_entries_written_by_another_process_are_found(
+        self, use_config, model_file, waveform, cache_type
+    ):
+        use_config(cache_type)
+        reader = SimulationCache()
+        writer = SimulationCache()
+        writer.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        writer.cache_result(model_file, {"Vi": 2.0}, waveform, {})
+        writer.close()
+
+        assert reader.get_cached_result(model_file, {"Vi": 1.0}) is not None
+        results = reader.get_cached_results_many([(model_file, {"Vi": 2.0})])
+        assert results[0] is not None
+        assert reader.missing_points(model_file, [{"Vi": 1.0}, {"Vi": 2.0}, {"Vi": 3.0}]) == [2]
+        assert reader.get_cache_stats()["bloom"]["refreshes"] >= 1
+        reader.close()
+
+    def test_model_hash_follows_file_changes(self, use_config, model_file):
+        use_config("sqlite")
+        cache = SimulationCache()
+        hasher = cache.hasher
+        before = hasher.compute_hash(model_file, {"Vi": 1.0})
+        assert hasher.compute_hash(model_file, {"Vi": 1.0}) == before
+
+        with open(model_file, "a") as f:
+            f.write("\n// edited")
+        assert hasher.compute_hash(model_file, {"Vi": 1.0}) != before
+        cache.close()
+
+
+class TestParameterRelevance:
+    """Test suite for dropping unreferenced parameters from cache keys."""
+
+    MODEL = (
+        'Plecs {\n'
+        '  Name          "buck"\n'
+        '  InitializationCommands "Vi = 24; % input\\nVo_ref=12;\\nD=Vo_"\n'
+        '"ref/Vi\\n"\n'
+        '  Schematic {\n'
+        '    Component {\n'
+        '      Parameter {\n'
+        '        Variable      "L"\n'
+        '        Value         "Lo"\n'
+        '      }\n'
+        '    }\n'
+        '  }\n'
+        '}\n'
+    )
+
+    def test_referenced_names_join_split_strings(self, tmp_path):
+        path = tmp_path / "buck.plecs"
+        path.write_text(self.MODEL)
+        names = referenced_names(str(path))
+        assert {"Vi", "Vo_ref", "D", "Lo"} <= names
+        assert "Vo_" not in names and "nVo_ref" not in names
+
+        path.write_text(self.MODEL.replace("D=Vo_", "run('setup.m'); D=Vo_"))
+        assert referenced_names(str(path)) is None
+        path.write_text(self.MODEL.replace("% input", "% full load"))
+        assert referenced_names(str(path)) is not None
+
+    def test_unreferenced_parameters_share_cache_key(self, use_config, tmp_path, model_file):
+        use_config("sqlite", hash={"drop_unreferenced": True})
+        path = tmp_path / "buck.plecs"
+        path.write_text(self.MODEL)
+        cache = SimulationCache()
+        key = cache.simulation_hash(str(path), {"Vi": 24.0, "run_tag": "a", "Rload": 1.0})
+        assert cache.simulation_hash(str(path), {"Vi": 24.0, "run_tag": "b"}) == key
+        assert cache.simulation_hash(str(path), {"Vi": 12.0, "run_tag": "a"}) != key
+        # Without initialization commands nothing is dropped
+        assert cache.simulation_hash(model_file, {"Vi": 1.0, "x": 1}) != cache.simulation_hash(
+            model_file, {"Vi": 1.0, "x": 2}
+        )
+        cache.close()
+
+        # Off by default: existing keys stay valid
+        use_config("sqlite")
+        cache = SimulationCache()
+        assert cache.simulation_hash(str(path), {"Vi": 24.0, "run_tag": "b"}) != key
+        cache.close()
+
+
+class TestBulkLookup:
+    """Test suite for bulk cache lookups."""
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_hits_and_misses_in_request_order(
+        self, use_config, model_file, waveform, cache_type
+    ):
+        use_config(cache_type)
+        cache = SimulationCache()
+        for vi in (1.0, 3.0):
+            cache.cache_result(model_file, {"Vi": vi}, waveform, {"Vi": vi})
+
+        results = cache.get_cached_results_many(
+            [
+                (model_file, {"Vi": 1.0}),
+                (model_file, {"Vi": 2.0}),
+                (model_file, {"Vi": 3.0}, ["Vo"]),
+                (model_file, {"Vi": 1.0}),
+            ]
+        )
+
+        assert [r["metadata"]["Vi"] if r else None for r in results] == [1.0, None, 3.0, 1.0]
+        pd.testing.assert_frame_equal(results[2]["timeseries"], waveform)
+        stats = cache.get_cache_stats()
+        assert stats["hits"] == 3 and stats["misses"] == 1
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_serves_cached_sweep_points(
+        self, use_config, model_file, waveform
+    ):
+        use_config("sqlite")
+        orchestrator = SimulationOrchestrator()
+        orchestrator.cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+
+        task_ids = await orchestrator.submit_simulations(
+            [
+                SimulationRequest(model_file=model_file, parameters={"Vi": vi})
+                for vi in (1.0, 2.0)
+            ],
+            priority=TaskPriority.LOW,
+        )
+        await orchestrator.stop()
+
+        hit = await orchestrator.get_task_status(task_ids[0])
+        miss = await orchestrator.get_task_status(task_ids[1])
+        assert hit.result.cached
+        assert miss.status == SimulationStatus.QUEUED
+        assert miss.priority == TaskPriority.LOW
+        orchestrator.cache.close()
+
+
+class TestWriteBehind:
+    """Test suite for write-behind persistence."""
+
+    @pytest.mark.parametrize("fsync", ["none", "batch", "always"])
+    def test_enqueued_results_are_persisted(self, use_config, model_file, waveform, fsync):
+        use_config("sqlite", write_behind={"fsync": fsync, "batch_size": 4})
+        cache = SimulationCache()
+        hashes = [
+            cache.enqueue_result(model_file, {"Vi": float(vi)}, waveform, {"vi": vi})
+            for vi in range(10)
+        ]
+        cache.flush()
+
+        assert all(cache.backend.exists(h) for h in hashes)
+        assert cache.get_cache_stats()["total_entries"] == 10
+        assert cache.get_cache_stats()["writer"]["written"] == 10
+        cache.close()
+
+    def test_pending_results_are_served_before_they_are_written(
+        self, use_config, model_file, waveform, monkeypatch
+    ):
+        use_config("sqlite")
+        cache = SimulationCache()
+        release = threading.Event()
+        store_result = cache._store_result
+
+        def slow_store(*args):
+            release.wait(5)
+            return store_result(*args)
+
+        monkeypatch.setattr(cache, "_store_result", slow_store)
+        cache.enqueue_result(model_file, {"Vi": 1.0}, waveform, {"note": "x"})
+
+        cached = cache.get_cached_result(model_file, {"Vi": 1.0}, columns=["Vo"])
+        pd.testing.assert_frame_equal(cached["timeseries"], waveform)
+        assert cache.get_cached_results_many([(model_file, {"Vi": 1.0})])[0] is not None
+
+        release.set()
+        cache.close()
+        reopened = SimulationCache()
+        assert reopened.get_cached_result(model_file, {"Vi": 1.0})["metadata"] == {"note": "x"}
+        reopened.close()
+
+    def test_full_queue_does_not_block_submit(self, use_config, model_file, waveform, monkeypatch):
+        use_config("sqlite", write_behind={"workers": 1, "max_pending": 1})
+        cache = SimulationCache()
+        release = threading.Event()
+        store_result = cache._store_result
+
+        def slow_store(*args):
+            if threading.current_thread().name.startswith("pyplecs-cache-writer"):
+                release.wait(5)
+            return store_result(*args)
+
+        monkeypatch.setattr(cache, "_store_result", slow_store)
+        started = time.monotonic()
+        hashes = [cache.enqueue_result(model_file, {"Vi": float(vi)}, waveform, {}) for vi in range(4)]
+        assert time.monotonic() - started < 2
+        assert cache.get_cache_stats()["writer"]["overflowed"] >= 1
+
+        release.set()
+        cache.flush()
+        assert all(cache.backend.exists(h) for h in hashes)
+        cache.close()
+
+    def test_invalidate_drops_queued_result(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        cache.enqueue_result(model_file, {"Vi": 1.0}, waveform, {})
+        cache.invalidate_cache(model_file, {"Vi": 1.0})
+
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is None
+        cache.close()
+
+
+class TestMultiProcessSafety:
+    """Test suite for atomic writes and per-hash leases."""
+
+    def test_failed_atomic_write_keeps_previous_file(self, tmp_path):
+        target = tmp_path / "result.csv"
+        target.write_text("old")
+
+        with pytest.raises(RuntimeError):
+            with atomic_write(target) as tmp:
+                tmp.write_text("partial")
+                raise RuntimeError("crash mid-write")
+
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_lease_excludes_until_released(self, tmp_path):
+        leases = LeaseManager(str(tmp_path))
+        lease = leases.acquire("abc")
+
+        assert lease is not None
+        assert leases.acquire("abc") is None
+        assert not leases.wait("abc", timeout=0.05)
+
+        threading.Timer(0.1, lease.release).start()
+        assert leases.wait("abc", timeout=5)
+        assert leases.acquire("abc") is not None
+
+    def test_lease_is_visible_to_other_processes(self, tmp_path):
+        script = (
+            "import sys, time\n"
+            "from pyplecs.cache.locking import LeaseManager\n"
+            "lease = LeaseManager(sys.argv[1]).acquire('abc')\n"
+            "print('held', flush=True)\n"
+            "time.sleep(0.5)\n"
+            "lease.release()\n"
+        )
+        child = subprocess.Popen(
+            [sys.executable, "-c", script, str(tmp_path)], stdout=subprocess.PIPE, text=True
+        )
+        # Skip the package banner printed on import
+        for line in child.stdout:
+            if line.strip() == "held":
+                break
+
+        leases = LeaseManager(str(tmp_path))
+        assert leases.is_held("abc")
+        assert leases.wait("abc", timeout=10)
+        child.wait(10)
+
+    def test_indexing_a_result_releases_its_lease(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        sim_hash = cache.simulation_hash(model_file, {"Vi": 1.0})
+
+        assert cache.acquire_lease(sim_hash)
+        assert not cache.acquire_lease(sim_hash)
+        cache.enqueue_result(model_file, {"Vi": 1.0}, waveform, {})
+        assert cache.wait_for_lease(sim_hash, timeout=5)
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is not None
+        cache.close()
+
+    def test_result_of_lease_holder_bypasses_bloom_filter(
+        self, use_config, model_file, waveform, monkeypatch
+    ):
+        use_config("sqlite")
+        waiter = SimulationCache()
+        holder = SimulationCache()
+        holder.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+        holder.close()
+
+        # A filter that has not noticed the holder's write yet
+        monkeypatch.setattr(waiter.backend, "change_token", lambda: waiter._bloom_token)
+        assert waiter.get_cached_result(model_file, {"Vi": 1.0}) is None
+        assert waiter.get_cached_result(model_file, {"Vi": 1.0}, use_bloom=False) is not None
+        waiter.close()
+
+
+class TestWaveformCodecs:
+    """Test suite for per-column and lossy waveform codecs."""
+
+    @pytest.fixture
+    def smooth_waveform(self):
+        """Slowly varying signal over a uniform time axis."""
+        times = [i * 1e-6 for i in range(2000)]
+        return pd.DataFrame(
+            {"Time": times, "Vo": [12.0 + 0.01 * (i % 100) for i in range(2000)]}
+        )
+
+    def test_byte_stream_split_and_column_codecs(self, use_config, model_file, smooth_waveform):
+        use_config(
+            "sqlite",
+            storage={"column_compression": {"Time": "snappy"}, "implicit_time": False},
+        )
+        cache = SimulationCache()
+        sim_hash = cache.cache_result(model_file, {"Vi": 12.0}, smooth_waveform, {})
+
+        path = cache.result_store.storage_dir / f"{sim_hash}.parquet"
+        row_group = pq.ParquetFile(path).metadata.row_group(0)
+        columns = {row_group.column(i).path_in_schema: row_group.column(i) for i in range(2)}
+        assert columns["Time"].compression == "SNAPPY"
+        assert columns["Vo"].compression == "ZSTD"
+        assert "BYTE_STREAM_SPLIT" in columns["Vo"].encodings
+
+        cached = cache.get_cached_result(model_file, {"Vi": 12.0})
+        pd.testing.assert_frame_equal(cached["timeseries"], smooth_waveform)
+        cache.close()
+
+    @pytest.mark.parametrize("ts_format", ["parquet", "arrow"])
+    def test_quantized_columns_honor_error_bound(
+        self, use_config, model_file, smooth_waveform, ts_format
+    ):
+        use_config(
+            "sqlite",
+            storage={
+                "timeseries_format": ts_format,
+                "lossy": {"quantize": {"Vo": 1e-3, "Time": 1e-3}},
+            },
+        )
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"Vi": 12.0}, smooth_waveform, {})
+
+        restored = cache.get_cached_result(model_file, {"Vi": 12.0})["timeseries"]
+        assert restored["Vo"].dtype == "float64"
+        assert (restored["Vo"] - smooth_waveform["Vo"]).abs().max() <= 1e-3
+        # The time axis is never stored lossily
+        pd.testing.assert_series_equal(restored["Time"], smooth_waveform["Time"])
+        cache.close()
+
+    def test_non_finite_quantized_column_is_stored_losslessly(self, smooth_waveform):
+        waveform = smooth_waveform.copy()
+        waveform.loc[10, "Vo"] = np.nan
+        waveform.loc[20, "Vo"] = np.inf
+        settings = CodecSettings(quantize_columns={"Vo": 1e-3}, protected_columns=["Time"])
+        encoded = encode_table(pa.Table.from_pandas(waveform), settings)
+
+        assert "Vo" not in column_codecs(encoded.schema)
+        restored = decode_table(encoded).column("Vo").to_numpy()
+        np.testing.assert_array_equal(restored, waveform["Vo"].to_numpy())
+
+    def test_float32_records_measured_error(self, smooth_waveform):
+        settings = CodecSettings(float32_columns=["Vo"], protected_columns=["Time"])
+        encoded = encode_table(pa.Table.from_pandas(smooth_waveform), settings)
+
+        assert encoded.schema.field("Vo").type == pa.float32()
+        codec = column_codecs(encoded.schema)["Vo"]
+        restored = decode_table(encoded).column("Vo").to_numpy()
+        assert abs(restored - smooth_waveform["Vo"].to_numpy()).max() <= codec["max_error"]
+
+
+class TestImplicitTimeAxis:
+    """Test suite for storing uniform time axes as segments."""
+
+    @pytest.fixture
+    def piecewise_waveform(self):
+        """1 us steps for 1 ms, then 0.5 us steps."""
+        times = np.r_[np.arange(1000) * 1e-6, 1e-3 + np.arange(4000) * 0.5e-6]
+        return pd.DataFrame({"Time": times, "Vo": np.sin(2e3 * np.pi * times)})
+
+    def test_detects_uniform_and_piecewise_axes(self, piecewise_waveform):
+        assert detect_segments(np.arange(500) * 1e-7) == [(0.0, 1e-7, 500)]
+
+        times = piecewise_waveform["Time"].to_numpy()
+        segments = detect_segments(times)
+        assert [n for _, _, n in segments] == [1001, 3999]
+        assert abs(expand_segments(segments) - times).max() <= 1e-6 * 1e-6
+
+        variable_step = np.cumsum(np.random.default_rng(0).uniform(1e-7, 1e-6, 1000))
+        assert detect_segments(variable_step) is None
+
+    def test_window_rows_match_rebuilt_axis(self, piecewise_waveform):
+        segments = detect_segments(piecewise_waveform["Time"].to_numpy())
+        rebuilt = expand_segments(segments)
+        for t_start, t_end in [(250e-6, 259.5e-6), (0.9995e-3, 1.2e-3), (5.0, 6.0), (None, 1e-6)]:
+            lo = 0 if t_start is None else np.searchsorted(rebuilt, t_start, "left")
+            hi = np.searchsorted(rebuilt, t_end, "right")
+            assert window_rows(segments, t_start, t_end) == (lo, max(lo, hi))
+
+    @pytest.mark.parametrize("ts_format", ["parquet", "arrow"])
+    def test_time_column_is_not_stored(
+        self, use_config, model_file, piecewise_waveform, ts_format
+    ):
+        use_config("sqlite", storage={"timeseries_format": ts_format, "row_group_size": 500})
+        cache = SimulationCache()
+        sim_hash = cache.cache_result(model_file, {"Vi": 12.0}, piecewise_waveform, {})
+
+        path = cache.result_store.storage_dir / f"{sim_hash}.{ts_format}"
+        if ts_format == "parquet":
+            schema = pq.read_schema(path)
+        else:
+            schema = pa.ipc.open_file(pa.memory_map(str(path))).schema
+        assert schema.names == ["Vo"]
+        assert TIME_AXIS_METADATA_KEY in schema.metadata
+
+        cached = cache.get_cached_result(model_file, {"Vi": 12.0})
+        pd.testing.assert_frame_equal(cached["timeseries"], piecewise_waveform)
+
+        window = cache.get_cached_result(
+            model_file, {"Vi": 12.0}, columns=["Time"], t_start=0.9995e-3, t_end=1.01e-3
+        )["timeseries"]
+        inside = piecewise_waveform["Time"].between(0.9995e-3, 1.01e-3)
+        expected = piecewise_waveform.loc[inside, ["Time"]].reset_index(drop=True)
+        pd.testing.assert_frame_equal(window, expected)
+        cache.close()
+
+    def test_variable_step_axis_is_stored_explicitly(self, use_config, model_file):
+        use_config("sqlite")
+        cache = SimulationCache()
+        times = np.cumsum(np.random.default_rng(0).uniform(1e-7, 1e-6, 1000))
+        data = pd.DataFrame({"Time": times, "Vo": times * 2})
+        sim_hash = cache.cache_result(model_file, {"Vi": 12.0}, data, {})
+
+        path = cache.result_store.storage_dir / f"{sim_hash}.parquet"
+        assert pq.read_schema(path).names == ["Time", "Vo"]
+        cached = cache.get_cached_result(model_file, {"Vi": 12.0})
+        pd.testing.assert_frame_equal(cached["timeseries"], data)
+        cache.close()
+
+
+class TestChunkDedup:
+    """Test suite for the deduplicating chunked result format."""
+
+    @pytest.fixture
+    def sweep(self):
+        """Two results sharing an input-stage signal and a start-up transient."""
+        times = np.arange(20000) * 1e-6
+        rng = np.random.default_rng(0)
+        iin = np.cumsum(rng.normal(size=len(times)))
+        vo_a = np.cumsum(rng.normal(size=len(times)))
+        vo_b = vo_a.copy()
+        vo_b[12000:] += 1.0
+        return (
+            pd.DataFrame({"Time": times, "Iin": iin, "Vo": vo_a}),
+            pd.DataFrame({"Time": times, "Iin": iin, "Vo": vo_b}),
+        )
+
+    def test_shared_prefix_gives_shared_chunks(self, sweep):
+        first, second = (split_column(data["Vo"].to_numpy(), 1024) for data in sweep)
+        shared = {digest for digest, _, _ in first} & {digest for digest, _, _ in second}
+        prefix_chunks = 0
+        for (digest_a, _, _), (digest_b, _, _) in zip(first, second):
+            if digest_a != digest_b:
+                break
+            prefix_chunks += 1
+        assert prefix_chunks > 0
+        assert len(shared) >= prefix_chunks
+        assert sum(rows for _, rows, _ in first) == 20000
+
+    def test_round_trip_and_dedup_stats(self, use_config, model_file, sweep):
+        use_config("sqlite", storage={"timeseries_format": "chunked", "chunk_rows": 1024})
+        cache = SimulationCache()
+        cache.cache_result(model_file, {"L": 1.0}, sweep[0], {})
+        cache.cache_result(model_file, {"L": 2.0}, sweep[1], {})
+
+        for value, data in zip((1.0, 2.0), sweep):
+            cached = cache.get_cached_result(model_file, {"L": value})
+            pd.testing.assert_frame_equal(cached["timeseries"], data)
+
+        window = cache.get_cached_result(
+            model_file, {"L": 2.0}, columns=["Vo"], t_start=5e-3, t_end=5.5e-3
+        )["timeseries"]
+        inside = sweep[1]["Time"].between(5e-3, 5.5e-3)
+        expected = sweep[1].loc[inside, ["Time", "Vo"]].reset_index(drop=True)
+        pd.testing.assert_frame_equal(window, expected)
+
+        dedup = cache.get_cache_stats()["dedup"]
+        # Iin is stored once and the Vo prefix is shared
+        assert dedup["dedup_ratio"] > 1.5
+        cache.close()
+
+    def test_deleting_results_releases_chunks(self, use_config, model_file, sweep):
+        use_config("sqlite", storage={"timeseries_format": "chunked", "chunk_rows": 1024})
+        cache = SimulationCache()
+        first = cache.cache_result(model_file, {"L": 1.0}, sweep[0], {})
+        second = cache.cache_result(model_file, {"L": 2.0}, sweep[1], {})
+        pool = cache.result_store.chunk_pool
+
+        cache.evict(first)
+        assert cache.get_cached_result(model_file, {"L": 1.0}) is None
+        cached = cache.get_cached_result(model_file, {"L": 2.0})
+        pd.testing.assert_frame_equal(cached["timeseries"], sweep[1])
+
+        cache.evict(second)
+        stats = pool.get_stats()
+        assert stats["chunks"] == 0 and stats["stored_bytes"] == 0
+        assert not any(path.is_file() for path in pool.pool_dir.glob("*/*"))
+        cache.close()
+
+
+class TestSweepDataset:
+    """Test suite for the per-model partitioned dataset layout."""
+
+    def _sweep(self, cache, model_file, values):
+        times = np.arange(200) * 1e-6
+        hashes = {}
+        for vi in values:
+            data = pd.DataFrame({"Time": times, "Vo": vi * np.sin(times * 1e4)})
+            hashes[vi] = cache.cache_result(model_file, {"Vi": vi}, data, {"run": vi})
+        return hashes
+
+    def test_runs_are_staged_then_compacted(self, use_config, model_file):
+        use_config("sqlite", storage={"layout": "dataset", "compact_threshold": 4})
+        cache = SimulationCache()
+        hashes = self._sweep(cache, model_file, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        root = cache.result_store.dataset.root
+        (model_dir,) = root.glob("model=*")
+        assert len(list(model_dir.glob("part-*.parquet"))) == 1
+        assert len(list((model_dir / "staging").glob("*.parquet"))) == 1
+        assert not list(cache.result_store.storage_dir.glob("*.parquet"))
+
+        for vi, sim_hash in hashes.items():
+            cached = cache.get_cached_result(
+                model_file, {"Vi": vi}, columns=["Vo"], t_start=49.5e-6, t_end=59.5e-6
+            )
+            assert cached["metadata"] == {"run": vi}
+            assert cached["timeseries"].columns.tolist() == ["Time", "Vo"]
+            assert len(cached["timeseries"]) == 10
+            expected = vi * np.sin(np.arange(50, 60) * 1e-6 * 1e4)
+            np.testing.assert_allclose(cached["timeseries"]["Vo"], expected)
+        cache.close()
+
+    def test_scan_reads_whole_sweep_with_parameter_columns(self, use_config, model_file):
+        use_config("sqlite", storage={"layout": "dataset", "compact_threshold": 3})
+        cache = SimulationCache()
+        self._sweep(cache, model_file, [1.0, 2.0, 3.0, 4.0])
+
+        sweep = cache.scan_sweep(model_file)
+        assert len(sweep) == 4 * 200
+        assert sorted(sweep["param_Vi"].unique()) == [1.0, 2.0, 3.0, 4.0]
+        assert sweep["simulation_hash"].nunique() == 4
+
+        high = cache.scan_sweep(model_file, columns=["Vo"], filter=ds.field("param_Vi") > 2.5)
+        assert len(high) == 2 * 200
+        cache.close()
+
+    def test_scan_requires_dataset_layout(self, use_config, model_file):
+        use_config("sqlite")
+        cache = SimulationCache()
+        with pytest.raises(UnsupportedCacheBackend):
+            cache.scan_sweep(model_file)
+        cache.close()
+
+    def test_evicted_runs_are_dropped_from_parts(self, use_config, model_file):
+        use_config("sqlite", storage={"layout": "dataset", "compact_threshold": 2})
+        cache = SimulationCache()
+        hashes = self._sweep(cache, model_file, [1.0, 2.0])
+        dataset = cache.result_store.dataset
+
+        cache.evict(hashes[1.0])
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is None
+        assert cache.get_cached_result(model_file, {"Vi": 2.0}) is not None
+
+        cache.evict(hashes[2.0])
+        assert dataset.files() == []
+        assert not list(dataset.root.glob("model=*/part-*.parquet"))
+        cache.close()
+
+
+class TestResultQueries:
+    """Test suite for parameter and KPI queries over cached results."""
+
+    @pytest.fixture
+    def cache(self, use_config, model_file):
+        use_config("sqlite")
+        cache = SimulationCache()
+        times = np.arange(100) * 1e-6
+        for vi in (12.0, 24.0, 36.0, 48.0):
+            for fs in (50e3, 100e3):
+                data = pd.DataFrame({"Time": times, "Vo": np.full(100, vi / 2)})
+                cache.cache_result(
+                    model_file, {"Vi": vi, "fs": fs}, data, {"kpis": {"efficiency": fs / 1e6}}
+                )
+        yield cache
+        cache.close()
+
+    def test_range_and_equality_filters(self, cache, model_file):
+        handles = cache.find_results(
+            model_file, parameters={"Vi": (10, 40), "fs": 100e3}, order_by="param:Vi"
+        )
+        assert [h.parameters["Vi"] for h in handles] == [12.0, 24.0, 36.0]
+        assert all(h.parameters["fs"] == 100e3 for h in handles)
+
+    def test_kpi_filters_sorting_and_pagination(self, cache, model_file):
+        handles = cache.find_results(
+            model_file,
+            kpis={"Vo.mean": (15.0, None)},
+            order_by="kpi:Vo.mean",
+            descending=True,
+            limit=3,
+        )
+        assert [h.kpis["Vo.mean"] for h in handles] == [24.0, 24.0, 18.0]
+        assert handles[0].kpis["efficiency"] in (0.05, 0.1)
+
+        pages = [
+            cache.find_results(model_file, order_by="param:Vi", limit=3, offset=offset)
+            for offset in (0, 3, 6)
+        ]
+        assert [len(page) for page in pages] == [3, 3, 2]
+        keys = [h.simulation_hash for page in pages for h in page]
+        assert len(set(keys)) == 8
+
+    def test_handles_load_lazily(self, cache, model_file):
+        (handle,) = cache.find_results(model_file, parameters={"Vi": 48.0, "fs": 50e3})
+        assert "timeseries" not in handle.to_dict()
+        result = handle.load(columns=["Vo"], t_end=9e-6)
+        assert result["timeseries"]["Vo"].tolist() == [24.0] * 10
+
+    def test_unknown_order_column_is_rejected(self, cache):
+        with pytest.raises(ValueError):
+            cache.find_results(order_by="Vi; DROP TABLE entries")
+
+    def test_file_backend_is_unsupported(self, use_config, model_file):
+        use_config("file")
+        cache = SimulationCache()
+        with pytest.raises(UnsupportedCacheBackend):
+            cache.find_results(model_file)
+        with pytest.raises(UnsupportedCacheBackend):
+            cache.query_entries(model_file)
+        cache.close()
+
+
+class TestApproximateLookup:
+    """Test suite for approximate lookups of near-miss parameter points."""
+
+    @pytest.fixture
+    def cache(self, use_config, model_file):
+        use_config("sqlite", approximate={"tolerances": {"Vi": 10.0}, "neighbors": 2})
+        cache = SimulationCache()
+        for vi in (10.0, 20.0, 30.0):
+            times = np.arange(0, 50 + vi) * 1e-6
+            data = pd.DataFrame({"Time": times, "Vo": np.full(len(times), vi / 2)})
+            cache.cache_result(model_file, {"Vi": vi, "fs": 100e3}, data, {"Vi": vi})
+        yield cache
+        cache.close()
+
+    def test_nearest_result_is_flagged(self, cache, model_file):
+        result = cache.get_approximate_result(model_file, {"Vi": 18.0, "fs": 100e3})
+        metadata = result["metadata"]
+        assert metadata["approximate"] is True and metadata["Vi"] == 20.0
+        approximation = metadata["approximation"]
+        assert approximation["mode"] == "nearest"
+        assert approximation["distance"] == pytest.approx(0.2)
+        assert [n["parameters"]["Vi"] for n in approximation["neighbors"]] == [20.0, 10.0]
+        assert approximation["kpis"]["Vo.mean"] == 10.0
+        # Inverse-distance weights for distances 0.2 and 0.8 are 16/17 and 1/17
+        assert approximation["error_estimate"]["Vo.mean"] == pytest.approx(5 / 17)
+        assert result["timeseries"]["Vo"].eq(10.0).all()
+
+    def test_interpolation_blends_waveforms_onto_nearest_axis(self, cache, model_file):
+        result = cache.get_approximate_result(
+            model_file, {"Vi": 16.0, "fs": 100e3}, mode="interpolate"
+        )
+        timeseries = result["timeseries"]
+        assert len(timeseries) == 70
+        # Inverse-distance weights for distances 0.4 and 0.6 are 9/13 and 4/13
+        assert timeseries["Vo"].to_numpy() == pytest.approx(10.0 * 9 / 13 + 5.0 * 4 / 13)
+        approximation = result["metadata"]["approximation"]
+        assert approximation["kpis"]["Vo.mean"] == pytest.approx(timeseries["Vo"].iloc[0])
+        assert approximation["error_estimate"]["Vo.mean"] > 0
+
+    def test_points_outside_tolerance_or_exact_filters_miss(self, cache, model_file):
+        assert cache.get_approximate_result(model_file, {"Vi": 45.0, "fs": 100e3}) is None
+        assert cache.get_approximate_result(model_file, {"Vi": 20.0, "fs": 50e3}) is None
+        assert cache.get_approximate_result(model_file, {"Vi": 20.0}) is None
+        assert cache.get_approximate_result(
+            model_file, {"Vi": 20.0, "fs": 100e3}, tolerances={}
+        ) is None
+
+    def test_index_follows_new_and_evicted_results(self, cache, model_file, waveform):
+        request = {"Vi": 42.0, "fs": 100e3}
+        assert cache.get_approximate_result(model_file, request) is None
+        cache.cache_result(model_file, {"Vi": 40.0, "fs": 100e3}, waveform, {"Vi": 40.0})
+        assert cache.get_approximate_result(model_file, request)["metadata"]["Vi"] == 40.0
+
+        cache.evict(cache.simulation_hash(model_file, {"Vi": 40.0, "fs": 100e3}))
+        assert cache.get_approximate_result(model_file, request) is None
+
+    def test_unknown_mode_is_rejected(self, cache, model_file):
+        with pytest.raises(ValueError):
+            cache.get_approximate_result(model_file, {"Vi": 20.0, "fs": 100e3}, mode="cubic")
+
+    def test_file_backend_is_unsupported(self, use_config, model_file):
+        use_config("file")
+        cache = SimulationCache()
+        with pytest.raises(UnsupportedCacheBackend):
+            cache.get_approximate_result(model_file, {"Vi": 20.0})
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_completes_opted_in_requests(self, cache, model_file):
+        orchestrator = SimulationOrchestrator()
+        task_ids = await orchestrator.submit_simulations(
+            [
+                SimulationRequest(
+                    model_file=model_file,
+                    parameters={"Vi": 21.0, "fs": 100e3},
+                    metadata={"approximate": True},
+                ),
+                SimulationRequest(model_file=model_file, parameters={"Vi": 21.0, "fs": 100e3}),
+            ]
+        )
+        await orchestrator.stop()
+
+        approximate = await orchestrator.get_task_status(task_ids[0])
+        exact = await orchestrator.get_task_status(task_ids[1])
+        assert approximate.result.cached
+        assert approximate.result.metadata["approximate"] is True
+        assert exact.status == SimulationStatus.QUEUED
+        assert orchestrator.stats["total_approximate_hits"] == 1
+
+        task_id = await orchestrator.submit_simulation(
+            SimulationRequest(
+                model_file=model_file,
+                parameters={"Vi": 19.0, "fs": 100e3},
+                metadata={"approximate": True},
+            )
+        )
+        single = await orchestrator.get_task_status(task_id)
+        assert single.result.cached and single.result.metadata["approximate"] is True
+        assert orchestrator.stats["total_approximate_hits"] == 2
+        orchestrator.cache.close()
+
+
+class TestNegativeCache:
+    """Test suite for negative caching of deterministic failures."""
+
+    def test_failure_classification(self):
+        classes = failure_classes()
+        assert classify_failure("Error: Singular matrix at t=1e-3", classes).name == (
+            "singular_matrix"
+        )
+        assert classify_failure("Step size underflow in solver", classes).name == "step_size"
+        assert classify_failure("Connection refused", classes) is None
+        assert classify_failure(None, classes) is None
+
+        classes = failure_classes(
+            {"step_size": {"ttl": 0}, "license": {"patterns": ["no license"], "ttl": 60}}
+        )
+        assert classify_failure("Step size underflow", classes) is None
+        assert classify_failure("No license available", classes).ttl == 60
+
+    def test_expired_failures_are_dropped(self, tmp_path):
+        store = FailureStore(str(tmp_path / "failures"))
+        store.record("a", "singular", FailureClass("singular_matrix", ["singular"], ttl=60))
+        store.record("b", "singular", FailureClass("singular_matrix", ["singular"], ttl=-1))
+        assert store.get("a")["failure_class"] == "singular_matrix"
+        assert store.get("b") is None
+        assert not (tmp_path / "failures" / "b.json").exists()
+
+    def test_misses_open_no_files(self, tmp_path, monkeypatch):
+        store = FailureStore(str(tmp_path / "failures"))
+        singular = FailureClass("singular_matrix", ["singular"], ttl=60)
+        store.record("a", "singular", singular)
+        other = FailureStore(str(tmp_path / "failures"))
+        other.record("b", "singular", singular)
+
+        def no_io(*args, **kwargs):
+            raise AssertionError("failure record opened")
+
+        with monkeypatch.context() as patch:
+            patch.setattr("builtins.open", no_io)
+            patch.setattr("pathlib.Path.read_text", no_io)
+            patch.setattr("pathlib.Path.open", no_io)
+            assert store.get("c") is None
+        # Records of other processes are seen once the directory changes
+        assert store.get("b")["error"] == "singular"
+        other.delete("b")
+        assert store.get("b") is None and store.get("a") is not None
+
+    def test_only_deterministic_failures_are_recorded(self, use_config, model_file):
+        use_config("sqlite", failures={"classes": {"step_size": {"ttl": 120}}})
+        cache = SimulationCache()
+        assert cache.record_failure(model_file, {"Vi": 1.0}, "XML-RPC timeout") is None
+        record = cache.record_failure(model_file, {"Vi": 2.0}, "minimum step size reached")
+        assert record["expires_at"] - record["created_at"] == pytest.approx(120)
+
+        assert cache.get_cached_failure(model_file, {"Vi": 1.0}) is None
+        assert cache.get_cached_failure(model_file, {"Vi": 2.0})["error"] == (
+            "minimum step size reached"
+        )
+        assert cache.get_cache_stats()["failures"] == {"recorded": 1, "hits": 1}
+
+        cache.invalidate_cache(model_file, {"Vi": 2.0})
+        assert cache.get_cached_failure(model_file, {"Vi": 2.0}) is None
+        cache.record_failure(model_file, {"Vi": 2.0}, "singular matrix")
+        cache.clear_cache()
+        assert cache.get_cached_failure(model_file, {"Vi": 2.0}) is None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_skips_retries_and_serves_known_failures(
+        self, use_config, model_file
+    ):
+        use_config("sqlite")
+        orchestrator = SimulationOrchestrator()
+        request = SimulationRequest(model_file=model_file, parameters={"Vi": 3.0})
+
+        task = SimulationTask(request=request)
+        orchestrator.active_tasks[task.id] = task
+        await orchestrator._handle_task_failure(task, "Singular matrix in state-space model")
+        assert task.status == SimulationStatus.FAILED
+        assert task.retry_count == 1 and orchestrator.task_queue.empty()
+
+        (task_id,) = await orchestrator.submit_simulations([request])
+        resubmitted = await orchestrator.get_task_status(task_id)
+        assert resubmitted.status == SimulationStatus.FAILED
+        assert resubmitted.result.cached and not resubmitted.result.success
+        assert resubmitted.result.error_message == "Singular matrix in state-space model"
+        assert resubmitted.result.metadata["failure_class"] == "singular_matrix"
+        assert orchestrator.stats["total_cached_failures"] == 1
+
+        single = await orchestrator.get_task_status(await orchestrator.submit_simulation(request))
+        assert single.status == SimulationStatus.FAILED and single.result.cached
+        assert orchestrator.stats["total_cached_failures"] == 2
+        orchestrator.cache.close()
+
+
+class TestCacheWarmup:
+    """Test suite for cache warm-up jobs."""
+
+    def test_sweep_expansion(self):
+        points = expand_sweep(
+            {
+                "base": {"fs": 100e3},
+                "grid": {"Vi": [12, 24], "D": {"start": 0.2, "stop": 0.4, "num": 3}},
+                "points": [{"Vi": 48, "D": 0.5}, {"Vi": 12, "D": 0.2}],
+            }
+        )
+        assert len(points) == 7
+        assert points[0] == {"fs": 100e3, "Vi": 12, "D": 0.2}
+        assert points[-1] == {"fs": 100e3, "Vi": 48, "D": 0.5}
+        with pytest.raises(ValueError):
+            expand_sweep({"grdi": {"Vi": [1]}})
+
+    def test_missing_points_skip_cached_and_failed(self, use_config, model_file, waveform):
+        use_config("sqlite")
+        cache = SimulationCache()
+        points = [{"Vi": float(vi)} for vi in range(5)]
+        cache.cache_result(model_file, points[1], waveform, {})
+        cache.enqueue_result(model_file, points[2], waveform, {})
+        cache.record_failure(model_file, points[3], "singular matrix")
+
+        assert cache.missing_points(model_file, points) == [0, 4]
+        assert cache.get_cache_stats()["hits"] == 0
+        cache.close()
+
+class TestCacheBundles:
+    """Test suite for single-file cache export and import."""
+
+    @pytest.fixture
+    def source(self, use_config, model_file, tmp_path):
+        use_config("sqlite")
+        cache = SimulationCache()
+        other_model = tmp_path / "other.plecs"
+        other_model.write_text("Plecs { Name \"other\" }")
+        for vi in (1.0, 2.0, 3.0):
+            data = pd.DataFrame({"Time": [0.0, 1e-6, 2e-6], "Vo": [0.0, vi, 2 * vi]})
+            cache.cache_result(model_file, {"Vi": vi}, data, {"Vi": vi}, execution_time=vi)
+        cache.cache_result(str(other_model), {"Vi": 1.0}, data, {})
+        yield cache
+        cache.close()
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_export_import_round_trip(
+        self, source, use_config, model_file, tmp_path, cache_type
+    ):
+        bundle = tmp_path / "sweep.bundle"
+        summary = source.export_bundle(str(bundle), model_file=model_file)
+        assert summary["results"] == 3 and summary["bytes"] == bundle.stat().st_size
+        manifest = read_manifest(str(bundle))
+        assert manifest["selection"]["model_file"] == model_file
+        assert len(manifest["simulation_hashes"]) == 3
+
+        use_config(cache_type, directory=(tmp_path / "target").as_posix())
+        target = SimulationCache()
+        target.cache_result(model_file, {"Vi": 1.0}, pd.DataFrame({"Vo": [9.0]}), {"local": True})
+        assert target.import_bundle(str(bundle)) == {"imported": 2, "skipped": 1, "corrupt": 0}
+
+        assert target.get_cached_result(model_file, {"Vi": 1.0})["metadata"] == {"local": True}
+        result = target.get_cached_result(model_file, {"Vi": 3.0})
+        assert result["metadata"] == {"Vi": 3.0}
+        assert result["timeseries"]["Vo"].tolist() == [0.0, 3.0, 6.0]
+        assert target.get_cache_stats()["total_entries"] == 3
+        assert target.import_bundle(str(bundle))["skipped"] == 3
+        target.close()
+
+    def test_selection_by_time_and_query(self, source, model_file, tmp_path):
+        bundle = str(tmp_path / "selection.bundle")
+        assert source.export_bundle(bundle, since=time.time() + 60)["results"] == 0
+        assert source.export_bundle(bundle, until=time.time())["results"] == 4
+        summary = source.export_bundle(bundle, model_file=model_file, parameters={"Vi": (2, None)})
+        assert summary["results"] == 2
+        summary = source.export_bundle(bundle, model_file=model_file, kpis={"Vo.max": (5.0, None)})
+        assert summary["results"] == 1
+
+    def test_parameter_selection_requires_sqlite(self, use_config, model_file, tmp_path):
+        use_config("file")
+        cache = SimulationCache()
+        with pytest.raises(UnsupportedCacheBackend):
+            cache.export_bundle(str(tmp_path / "x.bundle"), parameters={"Vi": (2, None)})
+        cache.close()
+
+    def test_corrupt_results_are_rejected(self, source, use_config, model_file, tmp_path):
+        bundle = tmp_path / "sweep.bundle"
+        source.export_bundle(str(bundle), model_file=model_file)
+
+        with pa.memory_map(str(bundle), "r") as f:
+            reader = pa.ipc.open_file(f)
+            schema = reader.schema
+            batches = [reader.get_batch(i) for i in range(reader.num_record_batches)]
+            damaged = [batches[0].set_column(4, "sha256", pa.array(["0" * 64]))] + batches[1:]
+            with pa.ipc.new_file(str(tmp_path / "damaged.bundle"), schema) as writer:
+                for batch in damaged:
+                    writer.write_batch(batch)
+
+        use_config("sqlite", directory=(tmp_path / "target").as_posix())
+        target = SimulationCache()
+        counts = target.import_bundle(str(tmp_path / "damaged.bundle"))
+        assert counts == {"imported": 2, "skipped": 0, "corrupt": 1}
+        target.close()
+
+
+class TestCacheMaintenance:
+    """Test suite for the cache maintenance operations and CLI."""
+
+    @staticmethod
+    def _fill(cache, model_file, values=(1.0, 2.0, 3.0)):
+        keys = []
+        for vi in values:
+            data = pd.DataFrame({"Time": [0.0, 1e-6, 2e-6], "Vo": [0.0, vi, 2 * vi]})
+            keys.append(cache.cache_result(model_file, {"Vi": vi}, data, {"Vi": vi}))
+        return keys
+
+    def test_verify_finds_damage_and_repairs(self, use_config, model_file):
+        use_config("file")
+        cache = SimulationCache()
+        good, corrupt, missing = self._fill(cache, model_file)
+        results_dir = cache.result_store.storage_dir
+        path = results_dir / f"{corrupt}.parquet"
+        raw = bytearray(path.read_bytes())
+        for i in range(8, 40):
+            raw[i] ^= 0xFF
+        path.write_bytes(bytes(raw))
+        (results_dir / f"{missing}.parquet").unlink()
+        (results_dir / "orphan.parquet").write_bytes(b"PAR1")
+
+        report = maintenance.verify(cache, workers=2)
+        assert {k: report[k] for k in ("checked", "ok", "missing", "corrupt")} == {
+            "checked": 3, "ok": 1, "missing": 1, "corrupt": 1,
+        }
+        assert report["orphan_files"] == ["orphan.parquet"]
+        assert {p["simulation_hash"] for p in report["problems"]} == {corrupt, missing}
+
+        report = maintenance.verify(cache, repair=True)
+        assert report["repaired"]["evicted"] == 2
+        report = maintenance.verify(cache)
+        assert report["checked"] == report["ok"] == 1 and not report["orphan_files"]
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is not None
+        cache.close()
+
+    def test_compact_rewrites_into_current_format(self, use_config, model_file):
+        use_config("sqlite", storage={"timeseries_format": "csv"})
+        cache = SimulationCache()
+        keys = self._fill(cache, model_file, (1.0, 2.0))
+        expires_at = {e["key"]: e["expires_at"] for e in cache.backend.iter_entries()}
+        cache.close()
+
+        use_config("sqlite", storage={"timeseries_format": "parquet"})
+        cache = SimulationCache()
+        assert cache.get_cached_result(model_file, {"Vi": 2.0}) is None
+        assert maintenance.verify(cache)["stale"] == 2
+
+        report = maintenance.compact(cache, workers=2)
+        assert report["rewritten"] == 2 and report["failed"] == 0
+        assert cache.result_store.stored_formats(keys[1]) == ["parquet"]
+        result = cache.get_cached_result(model_file, {"Vi": 2.0})
+        assert result["timeseries"]["Vo"].tolist() == [0.0, 2.0, 4.0]
+        assert result["metadata"] == {"Vi": 2.0}
+        for entry in cache.backend.iter_entries():
+            assert entry["expires_at"] == pytest.approx(expires_at[entry["key"]], abs=2)
+        assert cache.get_cache_stats()["total_entries"] == 2
+        cache.close()
+
+    def test_rekey_after_hash_change(self, use_config, model_file, tmp_path):
+        use_config("sqlite")
+        cache = SimulationCache()
+        self._fill(cache, model_file, (1.0, 2.0))
+        other_model = tmp_path / "other.plecs"
+        other_model.write_text("Plecs { Name \"other\" }")
+        self._fill(cache, str(other_model), (1.0,))
+        cache.close()
+        other_model.write_text("Plecs { Name \"changed\" }")
+
+        use_config("sqlite", hash={"algorithm": "md5"})
+        cache = SimulationCache()
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is None
+        assert maintenance.rekey(cache, dry_run=True)["rekeyed"] == 2
+        assert cache.get_cached_result(model_file, {"Vi": 1.0}) is None
+
+        report = maintenance.rekey(cache)
+        assert report == {"checked": 3, "rekeyed": 2, "merged": 0, "unchanged": 0, "skipped": 1}
+        result = cache.get_cached_result(model_file, {"Vi": 2.0})
+        assert result["timeseries"]["Vo"].tolist() == [0.0, 2.0, 4.0]
+        assert maintenance.rekey(cache)["unchanged"] == 2
+        cache.close()
+
+    def test_cli_commands(self, use_config, model_file, capsys):
+        manager = use_config("file")
+        cache = SimulationCache()
+        self._fill(cache, model_file)
+        cache.close()
+
+        assert cache_cli.main(["--config", manager.config_path, "--json", "du", "--by-model"]) == 0
+        usage = json.loads(capsys.readouterr().out)
+        assert usage["by_model"][model_file]["entries"] == 3
+        assert usage["total_bytes"] == sum(usage["by_directory"].values())
+
+        assert cache_cli.main(["--config", manager.config_path, "verify", "-j", "2"]) == 0
+        assert "ok: 3" in capsys.readouterr().out
+        assert cache_cli.main(["--config", manager.config_path, "--json", "gc"]) == 0
+        assert json.loads(capsys.readouterr().out)["expired"] == 0
+        assert cache_cli.main(["--config", manager.config_path, "stats"]) == 0
+        assert "total_entries: 3" in capsys.readouterr().out
+
+
+class TestCacheTiers:
+    """Test suite for hot/cold tiering of stored results."""
+
+    @pytest.mark.parametrize("cache_type", ["file", "sqlite"])
+    def test_idle_results_demote_and_promote_on_read(self, use_config, model_file, tmp_path, cache_type):
+        use_config(
+            cache_type,
+            storage={"timeseries_format": "arrow"},
+            tiers={"enabled": True, "cold_directory": str(tmp_path / "archive"), "interval": 0},
+        )
+        cache = SimulationCache()
+        data = pd.DataFrame({"Time": [0.0, 1e-6, 2e-6], "Vo": [0.0, 1.0, 2.0]})
+        key = cache.cache_result(model_file, {"Vi": 1.0}, data, {"Vi": 1.0})
+        assert cache.tiers.step() == 0
+
+        assert cache.tiers.step(now=time.time() + 30 * 86400) == 1
+        assert cache.result_store.stored_formats(key) == []
+        assert cache.cold_store.stored_formats(key) == ["parquet"]
+        assert cache.store_for(key) is cache.cold_store
+        assert maintenance.verify(cache)["ok"] == 1
+
+        result = cache.get_cached_result(model_file, {"Vi": 1.0})
+        assert result["timeseries"]["Vo"].tolist() == [0.0, 1.0, 2.0]
+        assert cache.result_store.stored_formats(key) == ["arrow"]
+        assert cache.cold_store.stored_formats(key) == []
+        stats = cache.get_cache_stats()["tiers"]
+        assert stats["demoted"] == stats["promoted"] == 1
+        cache.close()
+
+    def test_cold_reads_without_promotion(self, use_config, model_file):
+        use_config("sqlite", tiers={"enabled": True, "interval": 0, "promote_on_read": False})
+        cache = SimulationCache()
+        data = pd.DataFrame({"Time": [0.0, 1e-6], "Vo": [0.0, 1.0]})
+        key = cache.cache_result(model_file, {"Vi": 1.0}, data, {"Vi": 1.0})
+        assert cache.tiers.demote(key)
+
+        assert cache.get_cached_result(model_file, {"Vi": 1.0})["timeseries"]["Vo"].tolist() == [0.0, 1.0]
+        assert cache.store_for(key) is cache.cold_store
+        assert cache.backend.demotion_candidates(time.time() + 1, 10) == []
+
+        cache.invalidate_cache(model_file, {"Vi": 1.0})
+        assert cache.cold_store.stored_formats(key) == []
+        cache.close()
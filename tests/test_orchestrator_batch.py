@@ -1,13 +1,18 @@
 """Tests for batch orchestration with PLECS native parallel API."""
 
+import asyncio
 import tempfile
+import threading
+import xmlrpc.client
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 
-from pyplecs.core.models import SimulationRequest
-from pyplecs.orchestration import BatchSimulationExecutor, SimulationOrchestrator, TaskPriority
+from pyplecs.cache.states import WARM_START_VARIANT
+from pyplecs.core.models import SimulationRequest, SimulationStatus
+from pyplecs.orchestration import BatchSimulationExecutor, SimulationOrchestrator, SimulationTask, TaskPriority
 
 
 @pytest.fixture
@@ -230,5 +235,328 @@ class TestSimulationOrchestratorBatch:
         assert stats['executor']['batch_size'] == 4  # default
 
 
+class TestSingleFlight:
+    """Test suite for coalescing identical in-flight simulations."""
+
+    @pytest.mark.asyncio
+    async def test_identical_submissions_share_one_simulation(self, use_config, model_file):
+        use_config("sqlite")
+        server = MagicMock()
+        server.simulate_batch.side_effect = lambda params: [
+            {"Time": [0.0, 1e-6], "Vo": [0.0, p["Vi"]]} for p in params
+        ]
+        orchestrator = SimulationOrchestrator(plecs_server=server, batch_size=4)
+        completed = []
+        orchestrator.add_callback("on_task_completed", lambda task: completed.append(task.id))
+
+        request = SimulationRequest(model_file=model_file, parameters={"Vi": 1.0})
+        first = await orchestrator.submit_simulation(request)
+        second = await orchestrator.submit_simulation(request)
+        others = await orchestrator.submit_simulations(
+            [request, SimulationRequest(model_file=model_file, parameters={"Vi": 2.0})]
+        )
+        assert orchestrator.task_queue.qsize() == 2
+
+        tasks = [
+            await orchestrator.wait_for_completion(task_id, timeout=10)
+            for task_id in (first, second, *others)
+        ]
+        await orchestrator.stop()
+
+        simulated = [p["Vi"] for call in server.simulate_batch.call_args_list for p in call[0][0]]
+        assert sorted(simulated) == [1.0, 2.0]
+        assert all(task.status == SimulationStatus.COMPLETED for task in tasks)
+        assert tasks[1].result is tasks[0].result and tasks[2].result is tasks[0].result
+        assert sorted(completed) == sorted([first, second, *others])
+
+        stats = orchestrator.get_orchestrator_stats()
+        assert stats["total_coalesced"] == 2 and stats["inflight"] == 0
+        assert stats["total_submitted"] == 4 and stats["total_completed"] == 4
+        assert stats["cache_stats"]["per_model"][tasks[0].request.model_file]["coalesced"] == 2
+        orchestrator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_priority_and_cancellation(self, use_config, model_file):
+        use_config("sqlite")
+        orchestrator = SimulationOrchestrator()
+        request = SimulationRequest(model_file=model_file, parameters={"Vi": 1.0})
+        leader = await orchestrator.submit_simulation(request, priority=TaskPriority.LOW)
+        follower = await orchestrator.submit_simulation(request, priority=TaskPriority.LOW)
+        await orchestrator.stop()
+        urgent = await orchestrator.submit_simulation(request, priority=TaskPriority.HIGH)
+        await orchestrator.stop()
+        fresh = await orchestrator.submit_simulation(request, use_cache=False)
+        await orchestrator.stop()
+        assert orchestrator.task_queue.qsize() == 3
+        assert orchestrator.stats["total_coalesced"] == 1
+
+        assert await orchestrator.cancel_task(leader)
+        queued = [orchestrator.task_queue.get_nowait().id for _ in range(4)]
+        assert sorted(queued) == sorted([leader, follower, urgent, fresh])
+        (task,) = orchestrator.inflight.values()
+        assert task.id == follower
+        orchestrator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_tasks_leave_the_flight(self, use_config, model_file):
+        use_config("sqlite")
+        orchestrator = SimulationOrchestrator()
+        lone = await orchestrator.submit_simulation(
+            SimulationRequest(model_file=model_file, parameters={"Vi": 1.0})
+        )
+        request = SimulationRequest(model_file=model_file, parameters={"Vi": 2.0})
+        leader = await orchestrator.submit_simulation(request)
+        follower = await orchestrator.submit_simulation(request)
+        await orchestrator.stop()
+
+        assert await orchestrator.cancel_task(follower)
+        (task,) = [task for task in orchestrator.inflight.values() if task.id == leader]
+        assert task.followers == []
+
+        assert await orchestrator.cancel_task(lone)
+        assert await orchestrator.cancel_task(leader)
+        assert orchestrator.inflight == {}
+        orchestrator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_hashing_happens_outside_the_lock(self, use_config, model_file, monkeypatch):
+        use_config("sqlite")
+        orchestrator = SimulationOrchestrator()
+        simulation_hash = orchestrator.cache.simulation_hash
+        locked = []
+
+        def hash_and_check(*args):
+            locked.append(orchestrator._lock.locked())
+            return simulation_hash(*args)
+
+        monkeypatch.setattr(orchestrator.cache, "simulation_hash", hash_and_check)
+        request = SimulationRequest(model_file=model_file, parameters={"Vi": 1.0})
+        await orchestrator.submit_simulation(request)
+        await orchestrator.submit_simulations([SimulationRequest(model_file=model_file, parameters={"Vi": 2.0})])
+        await orchestrator.stop()
+        assert locked and not any(locked)
+        orchestrator.cache.close()
+
+
+class TestCacheWarmup:
+    """Test suite for cache warm-up jobs run by the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_simulates_only_missing_points_when_idle(
+        self, use_config, model_file, waveform
+    ):
+        use_config("sqlite")
+        server = MagicMock()
+        server.simulate_batch.side_effect = lambda params: [
+            {"Time": [0.0, 1e-6], "Vo": [0.0, p["Vi"]]} for p in params
+        ]
+        orchestrator = SimulationOrchestrator(plecs_server=server, batch_size=2)
+        orchestrator.cache.cache_result(model_file, {"Vi": 1.0}, waveform, {})
+
+        job_id = await orchestrator.submit_warmup(
+            model_file, {"grid": {"Vi": [0.0, 1.0, 2.0, 3.0, 4.0]}}
+        )
+        for _ in range(100):
+            if orchestrator.get_orchestrator_stats()["warmup"]["running"] == 0:
+                break
+            await asyncio.sleep(0.05)
+        await orchestrator.stop()
+
+        (job,) = orchestrator.get_orchestrator_stats()["warmup"]["jobs"]
+        assert job["id"] == job_id and job["status"] == "completed"
+        assert (job["total_points"], job["cached_points"], job["completed"]) == (5, 1, 4)
+        assert job["progress"] == 1.0
+        simulated = [p["Vi"] for call in server.simulate_batch.call_args_list for p in call[0][0]]
+        assert sorted(simulated) == [0.0, 2.0, 3.0, 4.0]
+        assert max(len(call[0][0]) for call in server.simulate_batch.call_args_list) <= 2
+        assert orchestrator.cache.missing_points(
+            model_file, [{"Vi": float(vi)} for vi in range(5)]
+        ) == []
+        orchestrator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_warmup_waits_for_queued_work(self, use_config, model_file):
+        use_config("sqlite")
+        orchestrator = SimulationOrchestrator()
+        orchestrator.executor = MagicMock(batch_size=2)
+        job_id = await orchestrator.submit_warmup(model_file, {"grid": {"Vi": [1.0, 2.0, 3.0]}})
+        await orchestrator.stop()
+
+        orchestrator.task_queue.put(SimulationTask(request=SimulationRequest(model_file)))
+        orchestrator._feed_warmup()
+        assert orchestrator.task_queue.qsize() == 1
+
+        orchestrator.task_queue.get_nowait()
+        orchestrator._feed_warmup()
+        queued = [orchestrator.task_queue.get_nowait() for _ in range(2)]
+        assert all(task.priority == TaskPriority.LOW for task in queued)
+        assert queued[0].request.metadata["warmup_job"] == job_id
+
+        assert orchestrator.cancel_warmup(job_id)
+        (job,) = orchestrator.get_orchestrator_stats()["warmup"]["jobs"]
+        assert job["status"] == "cancelled" and job["pending_points"] == 0
+        orchestrator.cache.close()
+
+
+class TestWarmStart:
+    """Test suite for warm-starting simulations from stored system states."""
+
+    @staticmethod
+    def _server(warm_error=None):
+        server = MagicMock()
+
+        def simulate_batch(params, **kwargs):
+            if kwargs and warm_error is not None:
+                raise warm_error
+            return [
+                {"Time": [0.0, 1e-6], "Vo": [0.0, p["Vi"]], "SystemState": {"x": [p["Vi"]]}}
+                for p in params
+            ]
+
+        server.simulate_batch.side_effect = simulate_batch
+        return server
+
+    async def _run(self, orchestrator, model_file, vi):
+        request = SimulationRequest(model_file=model_file, parameters={"Vi": vi})
+        task_id = await orchestrator.submit_simulation(request)
+        return await orchestrator.wait_for_completion(task_id, timeout=10)
+
+    @pytest.mark.asyncio
+    async def test_runs_start_from_closest_stored_state(self, use_config, model_file):
+        use_config("sqlite", warm_start={"enabled": True, "max_distance": 0.1})
+        server = self._server()
+        orchestrator = SimulationOrchestrator(plecs_server=server, batch_size=4)
+
+        first = await self._run(orchestrator, model_file, 10.0)
+        assert "warm_start" not in first.result.metadata
+        assert list(first.result.timeseries_data.columns) == ["Time", "Vo"]
+        assert server.simulate_batch.call_args.kwargs == {}
+
+        near = await self._run(orchestrator, model_file, 10.5)
+        assert server.simulate_batch.call_args.kwargs == {"initial_states": [{"x": [10.0]}]}
+        assert near.result.metadata["warm_start"]["parameters"] == {"Vi": 10.0}
+        assert near.result.metadata["warm_start"]["distance"] == pytest.approx(0.5 / 10.5)
+
+        far = await self._run(orchestrator, model_file, 20.0)
+        assert "warm_start" not in far.result.metadata
+        await orchestrator.stop()
+
+        assert orchestrator.get_orchestrator_stats()["total_warm_starts"] == 1
+        assert orchestrator.cache.get_cache_stats()["warm_start"]["recorded"] == 3
+        # Warm-started results are cached apart from cold-started ones
+        cache = orchestrator.cache
+        cache.flush()
+        assert cache.get_cached_result(model_file, {"Vi": 10.5}) is None
+        warm = cache.get_cached_result(model_file, {"Vi": 10.5}, variant=WARM_START_VARIANT)
+        assert warm["metadata"]["warm_start"]["parameters"] == {"Vi": 10.0}
+        assert cache.get_cached_result(model_file, {"Vi": 20.0}) is not None
+
+        again = await self._run(orchestrator, model_file, 10.5)
+        await orchestrator.stop()
+        assert again.result.cached and again.result.metadata["warm_start"]["parameters"] == {"Vi": 10.0}
+        assert server.simulate_batch.call_count == 3
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_state_files_are_read_off_the_event_loop(self, use_config, model_file, monkeypatch):
+        use_config("sqlite", warm_start={"enabled": True})
+        orchestrator = SimulationOrchestrator(plecs_server=self._server())
+        cache = orchestrator.cache
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def on_thread(method):
+            def wrapper(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+
+            return wrapper
+
+        monkeypatch.setattr(cache, "find_system_state", on_thread(cache.find_system_state))
+        monkeypatch.setattr(cache, "record_system_state", on_thread(cache.record_system_state))
+        await self._run(orchestrator, model_file, 10.0)
+        await orchestrator.stop()
+
+        assert len(threads) == 2 and loop_thread not in threads
+        cache.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "rejection",
+        [
+            TypeError("unexpected keyword argument 'initial_states'"),
+            xmlrpc.client.Fault(1, "Invalid option 'SystemState' for this model"),
+        ],
+    )
+    async def test_falls_back_to_cold_start(self, use_config, model_file, rejection):
+        use_config("sqlite", warm_start={"enabled": True})
+        orchestrator = SimulationOrchestrator(plecs_server=self._server(rejection))
+        await self._run(orchestrator, model_file, 10.0)
+        task = await self._run(orchestrator, model_file, 10.2)
+        await orchestrator.stop()
+
+        assert task.status == SimulationStatus.COMPLETED
+        assert "warm_start" not in task.result.metadata
+        assert orchestrator.get_orchestrator_stats()["total_warm_starts"] == 0
+        orchestrator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_start_is_retried_cold(self, use_config, model_file):
+        use_config("sqlite", warm_start={"enabled": True})
+        orchestrator = SimulationOrchestrator()
+        orchestrator.cache.record_system_state(model_file, {"Vi": 1.0}, {"x": [1.0]}, None)
+        task = SimulationTask(
+            request=SimulationRequest(model_file=model_file, parameters={"Vi": 1.05}), max_retries=1
+        )
+        orchestrator._hash_task(task)
+        orchestrator._find_warm_starts([task])
+        assert task.warm_start is not None
+
+        await orchestrator._handle_task_failure(task, "Singular matrix at t=0")
+        assert orchestrator.cache.get_cached_failure(model_file, {"Vi": 1.05}) is None
+        assert task.status == SimulationStatus.QUEUED and task.warm_start is None
+        assert orchestrator.task_queue.get_nowait() is task
+
+        orchestrator._find_warm_starts([task])
+        assert task.warm_start is None
+        await orchestrator._handle_task_failure(task, "Singular matrix at t=0")
+        assert task.status == SimulationStatus.FAILED
+        assert orchestrator.cache.get_cached_failure(model_file, {"Vi": 1.05}) is not None
+        orchestrator.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_lease_waiters_are_served_the_warm_started_result(self, use_config, model_file):
+        use_config("sqlite", warm_start={"enabled": True})
+        orchestrator = SimulationOrchestrator(plecs_server=self._server())
+        await self._run(orchestrator, model_file, 10.0)
+        task = SimulationTask(request=SimulationRequest(model_file=model_file, parameters={"Vi": 10.2}))
+        cache = orchestrator.cache
+        assert cache.acquire_lease(orchestrator._hash_task(task))
+
+        waiter = asyncio.create_task(orchestrator._await_leased_result(task))
+        await asyncio.sleep(0.1)
+        cache.enqueue_result(
+            model_file, {"Vi": 10.2}, pd.DataFrame({"Time": [0.0], "Vo": [10.2]}),
+            {"warm_start": {"parameters": {"Vi": 10.0}, "distance": 0.02}}, variant=WARM_START_VARIANT,
+        )
+        await asyncio.wait_for(waiter, timeout=10)
+        await orchestrator.stop()
+
+        assert not cache.leases.is_held(task.simulation_hash)
+        assert task.status == SimulationStatus.COMPLETED and task.result.cached
+        assert task.result.metadata["warm_start"]["parameters"] == {"Vi": 10.0}
+        assert orchestrator.task_queue.qsize() == 0
+        cache.close()
+
+    def test_other_errors_are_not_rerun_cold(self, model_file):
+        server = self._server(xmlrpc.client.Fault(1, "Singular matrix at t=0"))
+        task = SimulationTask(request=SimulationRequest(model_file=model_file, parameters={"Vi": 1.0}))
+        task.warm_start = {"state": {"x": [1.0]}, "parameters": {"Vi": 1.1}, "distance": 0.1}
+
+        with pytest.raises(xmlrpc.client.Fault):
+            BatchSimulationExecutor(server)._simulate([task], [task.request.parameters])
+        assert server.simulate_batch.call_count == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])